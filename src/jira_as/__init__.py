@@ -168,6 +168,7 @@ from .testing import (
     assert_issue_has_field,
     assert_search_returns_empty,
     assert_search_returns_results,
+    clear_server_info_cache,
     generate_unique_name,
     get_jira_version,
     is_cloud_instance,
@@ -219,6 +220,7 @@ from .validators import (
     validate_email,
     validate_file_path,
     validate_issue_key,
+    validate_issue_keys,
     validate_jql,
     validate_project_key,
     validate_project_name,
@@ -380,6 +382,7 @@ __all__ = [
     "validate_holder_type",
     # Validators
     "validate_issue_key",
+    "validate_issue_keys",
     "validate_jql",
     "validate_permission",
     "validate_project_key",
@@ -397,6 +400,7 @@ __all__ = [
     "assert_issue_has_field",
     "assert_search_returns_empty",
     "assert_search_returns_results",
+    "clear_server_info_cache",
     "generate_unique_name",
     "get_jira_version",
     "is_cloud_instance",
@@ -46,6 +46,7 @@ from jira_as import (
     parse_date_to_iso,
     text_to_adf,
     validate_issue_key,
+    validate_issue_keys,
     validate_project_key,
 )
 
@@ -631,7 +632,7 @@ def _move_to_sprint_impl(
         issues_to_move = []
 
         if issue_keys:
-            issues_to_move.extend([validate_issue_key(k) for k in issue_keys])
+            issues_to_move.extend(validate_issue_keys(issue_keys))
 
         if jql:
             search_result = c.search_issues(jql, max_results=1000)
@@ -669,7 +670,7 @@ def _move_to_backlog_impl(
         issues_to_move = []
 
         if issue_keys:
-            issues_to_move.extend([validate_issue_key(k) for k in issue_keys])
+            issues_to_move.extend(validate_issue_keys(issue_keys))
 
         if jql:
             search_result = c.search_issues(jql, max_results=1000)
@@ -766,7 +767,7 @@ def _rank_issue_impl(
             "Must specify before_key, after_key, or position (top/bottom)"
         )
 
-    validated_keys = [validate_issue_key(k) for k in issue_keys]
+    validated_keys = validate_issue_keys(issue_keys)
 
     validated_before = validate_issue_key(before_key) if before_key else None
     validated_after = validate_issue_key(after_key) if after_key else None
@@ -823,7 +824,7 @@ def _estimate_issue_impl(
         if not keys_to_update:
             return {"updated": 0, "issues": []}
 
-        validated_keys = [validate_issue_key(k) for k in keys_to_update]
+        validated_keys = validate_issue_keys(keys_to_update)
         story_points_field = get_agile_field("story_points")
         points_value = None if points == 0 else points
 
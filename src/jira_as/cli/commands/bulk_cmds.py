@@ -21,7 +21,7 @@ from jira_as import (
     ValidationError,
     get_jira_client,
     text_to_adf,
-    validate_issue_key,
+    validate_issue_keys,
     validate_jql,
     validate_project_key,
 )
@@ -97,7 +97,7 @@ def _get_issues_to_process(
         fields = ["key", "summary"]
 
     if issue_keys:
-        validated_keys = [validate_issue_key(k) for k in issue_keys[:max_issues]]
+        validated_keys = validate_issue_keys(issue_keys[:max_issues])
         return [{"key": key} for key in validated_keys]
     elif jql:
         validated_jql = validate_jql(jql)
@@ -677,7 +677,7 @@ def _bulk_clone_impl(
         retrieval_errors: dict[str, str] = {}
 
         if issue_keys:
-            issue_keys = [validate_issue_key(k) for k in issue_keys[:max_issues]]
+            issue_keys = validate_issue_keys(issue_keys[:max_issues])
             issues: list[dict[str, Any]] = []
             for key in issue_keys:
                 try:
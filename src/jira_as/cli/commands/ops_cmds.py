@@ -7,6 +7,7 @@ All implementation functions are inlined for direct CLI usage.
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
@@ -679,12 +680,12 @@ def _discover_patterns(
         }
 
     # Common labels
-    sorted_labels = sorted(all_labels.items(), key=lambda x: x[1], reverse=True)
-    patterns["common_labels"] = [label for label, _ in sorted_labels[:20]]
+    top_labels = heapq.nlargest(20, all_labels.items(), key=lambda x: x[1])
+    patterns["common_labels"] = [label for label, _ in top_labels]
 
     # Top assignees
-    sorted_assignees = sorted(
-        all_assignees.items(), key=lambda x: x[1]["count"], reverse=True
+    top_assignees = heapq.nlargest(
+        20, all_assignees.items(), key=lambda x: x[1]["count"]
     )
     patterns["top_assignees"] = [
         {
@@ -692,7 +693,7 @@ def _discover_patterns(
             "display_name": data["display_name"],
             "total_assignments": data["count"],
         }
-        for account_id, data in sorted_assignees[:20]
+        for account_id, data in top_assignees
     ]
 
     if verbose:
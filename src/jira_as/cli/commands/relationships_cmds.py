@@ -22,6 +22,7 @@ from jira_as import (
     get_jira_client,
     text_to_adf,
     validate_issue_key,
+    validate_issue_keys,
     validate_jql,
 )
 
@@ -866,7 +867,7 @@ def _bulk_link_impl(
                 "dry_run": dry_run,
             }
 
-        issues = [validate_issue_key(key) for key in issues]
+        issues = validate_issue_keys(issues)
 
         if dry_run:
             return {
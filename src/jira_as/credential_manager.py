@@ -16,7 +16,11 @@ to provide JIRA-specific credential handling.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import threading
+import time
+from datetime import timedelta
 from typing import Any
 
 from assistant_skills_lib import BaseCredentialManager, CredentialBackend
@@ -25,21 +29,25 @@ from assistant_skills_lib import CredentialNotFoundError as BaseCredentialNotFou
 from .error_handler import AuthenticationError, JiraError
 from .validators import validate_email, validate_url
 
+# Setup instructions shown whenever credentials are missing
+_CREDENTIAL_NOT_FOUND_HINT = (
+    "To set up credentials, run:\n"
+    "  python setup.py\n\n"
+    "Or set environment variables:\n"
+    "  export JIRA_API_TOKEN='your-token'\n"
+    "  export JIRA_EMAIL='your-email'\n"
+    "  export JIRA_SITE_URL='https://your-site.atlassian.net'\n\n"
+    "Get an API token at:\n"
+    "  https://id.atlassian.com/manage-profile/security/api-tokens"
+)
+
 
 class CredentialNotFoundError(JiraError):
     """Raised when credentials cannot be found in any backend."""
 
     def __init__(self, **kwargs: Any):
         message = "No JIRA credentials found"
-        hint = "\n\nTo set up credentials, run:\n"
-        hint += "  python setup.py\n\n"
-        hint += "Or set environment variables:\n"
-        hint += "  export JIRA_API_TOKEN='your-token'\n"
-        hint += "  export JIRA_EMAIL='your-email'\n"
-        hint += "  export JIRA_SITE_URL='https://your-site.atlassian.net'\n\n"
-        hint += "Get an API token at:\n"
-        hint += "  https://id.atlassian.com/manage-profile/security/api-tokens"
-        super().__init__(message + hint, **kwargs)
+        super().__init__(f"{message}\n\n{_CREDENTIAL_NOT_FOUND_HINT}", **kwargs)
 
 
 class CredentialManager(BaseCredentialManager):
@@ -65,6 +73,17 @@ class CredentialManager(BaseCredentialManager):
     _FIELD_EMAIL = "email"
     _FIELD_API_TOKEN = "api_token"
 
+    # How long a successful validate_credentials() result is reused
+    VALIDATION_CACHE_TTL = timedelta(seconds=30)
+
+    def __init__(self) -> None:
+        """Initialize credential manager with an empty validation cache."""
+        super().__init__()
+        # (url, email, sha256(api_token)) -> (monotonic time, user info)
+        self._validation_cache: dict[
+            tuple[str, str, str], tuple[float, dict[str, Any]]
+        ] = {}
+
     def get_service_name(self) -> str:
         """Return the keychain service name."""
         return "jira-assistant"
@@ -79,20 +98,16 @@ class CredentialManager(BaseCredentialManager):
 
     def get_credential_not_found_hint(self) -> str:
         """Return JIRA-specific help text for credential not found error."""
-        hint = "To set up credentials, run:\n"
-        hint += "  python setup.py\n\n"
-        hint += "Or set environment variables:\n"
-        hint += "  export JIRA_API_TOKEN='your-token'\n"
-        hint += "  export JIRA_EMAIL='your-email'\n"
-        hint += "  export JIRA_SITE_URL='https://your-site.atlassian.net'\n\n"
-        hint += "Get an API token at:\n"
-        hint += "  https://id.atlassian.com/manage-profile/security/api-tokens"
-        return hint
+        return _CREDENTIAL_NOT_FOUND_HINT
 
     def validate_credentials(self, credentials: dict[str, str]) -> dict[str, Any]:
         """
         Validate credentials by making a test API call.
 
+        Successful results are cached per (url, email, token) for
+        VALIDATION_CACHE_TTL so repeated checks skip the round trip.
+        Failures are never cached.
+
         Args:
             credentials: Dictionary with site_url, email, api_token
 
@@ -114,6 +129,15 @@ class CredentialManager(BaseCredentialManager):
         # Validate URL format first
         url = validate_url(url)
 
+        # Key on a token digest so the raw token is not held as a dict key
+        cache_key = (url, email, hashlib.sha256(api_token.encode()).hexdigest())
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            cached_at, user_info = cached
+            if time.monotonic() - cached_at < self.VALIDATION_CACHE_TTL.total_seconds():
+                return copy.copy(user_info)
+            del self._validation_cache[cache_key]
+
         # Test with /rest/api/3/myself endpoint
         test_url = f"{url}/rest/api/3/myself"
 
@@ -139,7 +163,7 @@ class CredentialManager(BaseCredentialManager):
                     status_code=response.status_code,
                 )
 
-            return response.json()
+            user_info = response.json()
 
         except requests.exceptions.ConnectionError:
             raise JiraError(
@@ -152,6 +176,13 @@ class CredentialManager(BaseCredentialManager):
         except requests.exceptions.RequestException as e:
             raise JiraError(f"Connection error: {sanitize_error_message(str(e))}")
 
+        self._validation_cache[cache_key] = (time.monotonic(), user_info)
+        return copy.copy(user_info)
+
+    def clear_validation_cache(self) -> None:
+        """Forget cached validate_credentials() results."""
+        self._validation_cache.clear()
+
     # -------------------------------------------------------------------------
     # Backward-compatible tuple-based API methods
     # These wrap the base class dict-based methods for existing code
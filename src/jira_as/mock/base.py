@@ -23,6 +23,9 @@ class MockJiraClientBase:
     Provides seed data for DEMO and DEMOSD projects, along with essential
     methods for issue CRUD, transitions, comments, worklogs, users, and projects.
 
+    Getters return the stored objects themselves rather than copies, so reads
+    are cheap; callers that want to modify a result should copy it first.
+
     Mixins extend this class to add specialized functionality.
     """
 
@@ -80,6 +83,9 @@ class MockJiraClientBase:
         {"id": "31", "name": "Done", "to": {"name": "Done", "id": "10002"}},
     ]
 
+    # Seed issue stores built by _init_issues(), keyed by (client class, base_url)
+    _SEED_ISSUES: ClassVar[dict[tuple[type, str], dict[str, dict]]] = {}
+
     # =========================================================================
     # Initialization
     # =========================================================================
@@ -92,6 +98,7 @@ class MockJiraClientBase:
         timeout: int = 30,
         max_retries: int = 3,
         retry_backoff: float = 2.0,
+        seed: bool = True,
     ):
         """Initialize mock client with optional parameters for interface compatibility.
 
@@ -102,6 +109,8 @@ class MockJiraClientBase:
             timeout: Request timeout in seconds (for interface compatibility).
             max_retries: Number of retries (for interface compatibility).
             retry_backoff: Backoff multiplier (for interface compatibility).
+            seed: Load the DEMO/DEMOSD seed issues. Pass False for an empty
+                issue store when the seed data is not needed.
         """
         self.base_url = base_url
         self.email = email
@@ -112,7 +121,7 @@ class MockJiraClientBase:
 
         # Initialize mutable state
         self._next_issue_id = 100
-        self._issues = self._init_issues()
+        self._issues = self._seed_issues() if seed else {}
         self._comments: dict[str, list[dict]] = {}
         self._worklogs: dict[str, list[dict]] = {}
 
@@ -300,6 +309,32 @@ class MockJiraClientBase:
             ],
         }
 
+    def _seed_issues(self) -> dict[str, dict]:
+        """Return a private copy of the seed issue store.
+
+        The seed is built once per client class and base URL. Each client gets
+        its own issue, fields and labels containers; other nested values
+        (status, users, descriptions) are shared with the cached seed because
+        the mock only ever replaces them, never mutates them in place.
+
+        Returns:
+            Dictionary of issue key to issue data.
+        """
+        cache_key = (type(self), self.base_url)
+        seed = self._SEED_ISSUES.get(cache_key)
+        if seed is None:
+            seed = self._SEED_ISSUES[cache_key] = self._init_issues()
+        return {
+            key: {
+                **issue,
+                "fields": {
+                    **issue["fields"],
+                    "labels": list(issue["fields"]["labels"]),
+                },
+            }
+            for key, issue in seed.items()
+        }
+
     def _init_issues(self) -> dict[str, dict]:
         """Initialize issue store with seed data matching DEMO project.
 
@@ -569,7 +604,8 @@ class MockJiraClientBase:
             fields: Dictionary of field values for the new issue.
 
         Returns:
-            The created issue key, id, and self URL.
+            The created issue key, id, and self URL, plus its stored fields
+            (as with expand=fields) so callers need not fetch it again.
         """
         self._next_issue_id += 1
         project_key = fields.get("project", {}).get("key", "DEMO")
@@ -610,7 +646,12 @@ class MockJiraClientBase:
         }
 
         self._issues[issue_key] = new_issue
-        return {"key": issue_key, "id": issue_id, "self": new_issue["self"]}
+        return {
+            "key": issue_key,
+            "id": issue_id,
+            "self": new_issue["self"],
+            "fields": new_issue["fields"],
+        }
 
     def create_issues_bulk(self, issue_updates: list[dict[str, Any]]) -> dict[str, Any]:
         """Create multiple issues in bulk.
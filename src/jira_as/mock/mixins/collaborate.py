@@ -18,6 +18,7 @@ class CollaborateMixin(_Base):
 
     Assumes base class provides:
         - self._issues: Dict[str, Dict]
+        - self._comments: Dict[str, List[Dict]]
         - self.base_url: str
         - self.USERS: Dict[str, Dict]
     """
@@ -27,9 +28,9 @@ class CollaborateMixin(_Base):
     # =========================================================================
 
     def _ensure_watchers_state(self):
-        """Ensure _watchers dict exists."""
+        """Ensure _watchers dict exists (issue key -> accountId -> user)."""
         if not hasattr(self, "_watchers"):
-            self._watchers: dict[str, list[dict]] = {}
+            self._watchers: dict[str, dict[str, dict]] = {}
 
     def _ensure_attachments_state(self):
         """Ensure _attachments dict exists."""
@@ -56,7 +57,7 @@ class CollaborateMixin(_Base):
 
         self._verify_issue_exists(issue_key)
 
-        watchers = self._watchers.get(issue_key, [])
+        watchers = list(self._watchers.get(issue_key, {}).values())
 
         # Include reporter by default as a watcher
         if not watchers:
@@ -85,21 +86,17 @@ class CollaborateMixin(_Base):
 
         self._verify_issue_exists(issue_key)
 
-        if issue_key not in self._watchers:
-            self._watchers[issue_key] = []
+        watchers = self._watchers.setdefault(issue_key, {})
 
-        # Get user info
-        user = self.USERS.get(
-            account_id,
-            {
-                "accountId": account_id,
-                "displayName": "Unknown User",
-            },
-        )
-
-        # Avoid duplicates
-        if not any(w.get("accountId") == account_id for w in self._watchers[issue_key]):
-            self._watchers[issue_key].append(user)
+        # Keyed by account ID, so re-adding a watcher is a no-op
+        if account_id not in watchers:
+            watchers[account_id] = self.USERS.get(
+                account_id,
+                {
+                    "accountId": account_id,
+                    "displayName": "Unknown User",
+                },
+            )
 
     def remove_watcher(self, issue_key: str, account_id: str) -> None:
         """Remove a watcher from an issue.
@@ -115,10 +112,7 @@ class CollaborateMixin(_Base):
 
         self._verify_issue_exists(issue_key)
 
-        if issue_key in self._watchers:
-            self._watchers[issue_key] = [
-                w for w in self._watchers[issue_key] if w.get("accountId") != account_id
-            ]
+        self._watchers.get(issue_key, {}).pop(account_id, None)
 
     # =========================================================================
     # Changelog Operations
@@ -417,10 +411,7 @@ class CollaborateMixin(_Base):
             )
 
         # Add comments
-        comments = (
-            self._comments.get(issue_key, []) if hasattr(self, "_comments") else []
-        )
-        for comment in comments:
+        for comment in self._comments.get(issue_key, []):
             activities.append(
                 {
                     "type": "comment",
@@ -3,7 +3,9 @@
 Provides mock implementations for advanced JQL parsing, filters, and search operations.
 """
 
+import functools
 import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
@@ -14,6 +16,191 @@ else:
     _Base = object
 
 
+_KNOWN_JQL_FIELDS = frozenset(
+    {
+        "project",
+        "issuetype",
+        "status",
+        "priority",
+        "assignee",
+        "reporter",
+        "summary",
+        "description",
+        "labels",
+        "created",
+        "updated",
+        "key",
+        "text",
+        "sprint",
+        "fixversion",
+        "component",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _JqlFilters:
+    """Filter criteria extracted from a JQL string.
+
+    String criteria are pre-lowercased (keys upper-cased) for direct comparison.
+    """
+
+    project: str | None = None
+    issue_type: str | None = None
+    status: str | None = None
+    status_not: str | None = None
+    assignee_current_user: bool = False
+    assignee_empty: bool = False
+    assignee: str | None = None
+    reporter_current_user: bool = False
+    reporter: str | None = None
+    priority: str | None = None
+    label: str | None = None
+    text: str | None = None
+    summary: str | None = None
+    key: str | None = None
+    keys: frozenset[str] | None = None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_jql_filters(jql: str) -> _JqlFilters:
+    """Extract filter criteria from JQL.
+
+    Parsing depends only on the query string, so results are cached and
+    shared; the returned object is immutable.
+
+    Args:
+        jql: JQL query string.
+
+    Returns:
+        Parsed filter criteria.
+    """
+    jql_upper = jql.upper()
+    criteria: dict[str, Any] = {}
+
+    project_match = re.search(r"PROJECT\s*=\s*(\w+)", jql_upper)
+    if project_match:
+        criteria["project"] = project_match.group(1)
+
+    type_match = re.search(r"ISSUETYPE\s*=\s*[\"']?(\w+)[\"']?", jql_upper)
+    if type_match:
+        criteria["issue_type"] = type_match.group(1).lower()
+
+    status_match = re.search(r'STATUS\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE)
+    if status_match:
+        criteria["status"] = status_match.group(1).strip().lower()
+
+    status_not_match = re.search(
+        r'STATUS\s*!=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
+    )
+    if status_not_match:
+        criteria["status_not"] = status_not_match.group(1).strip().lower()
+
+    if "ASSIGNEE" in jql_upper:
+        if "CURRENTUSER()" in jql_upper:
+            criteria["assignee_current_user"] = True
+        elif "EMPTY" in jql_upper or "NULL" in jql_upper:
+            criteria["assignee_empty"] = True
+        else:
+            assignee_match = re.search(
+                r'ASSIGNEE\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
+            )
+            if assignee_match:
+                criteria["assignee"] = assignee_match.group(1).strip().lower()
+
+    if "REPORTER" in jql_upper:
+        if "CURRENTUSER()" in jql_upper:
+            criteria["reporter_current_user"] = True
+        else:
+            reporter_match = re.search(
+                r'REPORTER\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
+            )
+            if reporter_match:
+                criteria["reporter"] = reporter_match.group(1).strip().lower()
+
+    priority_match = re.search(r'PRIORITY\s*=\s*["\']?(\w+)["\']?', jql, re.IGNORECASE)
+    if priority_match:
+        criteria["priority"] = priority_match.group(1).strip().lower()
+
+    label_match = re.search(r'LABELS\s*=\s*["\']?(\w+)["\']?', jql, re.IGNORECASE)
+    if label_match:
+        criteria["label"] = label_match.group(1).strip()
+
+    text_match = re.search(r'TEXT\s*~\s*["\']([^"\']+)["\']', jql, re.IGNORECASE)
+    if text_match:
+        criteria["text"] = text_match.group(1).lower()
+
+    summary_match = re.search(r'SUMMARY\s*~\s*["\']([^"\']+)["\']', jql, re.IGNORECASE)
+    if summary_match:
+        criteria["summary"] = summary_match.group(1).lower()
+
+    key_match = re.search(r"KEY\s*=\s*(\w+-\d+)", jql, re.IGNORECASE)
+    if key_match:
+        criteria["key"] = key_match.group(1).upper()
+
+    key_in_match = re.search(r"KEY\s+IN\s*\(([^)]+)\)", jql, re.IGNORECASE)
+    if key_in_match:
+        criteria["keys"] = frozenset(
+            k.strip().strip("'\"").upper() for k in key_in_match.group(1).split(",")
+        )
+
+    return _JqlFilters(**criteria)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_jql_order(jql: str) -> tuple[str, bool] | None:
+    """Extract the ORDER BY field and direction from JQL.
+
+    Args:
+        jql: JQL query string.
+
+    Returns:
+        Tuple of (lowercased field, reverse) or None if there is no ORDER BY.
+    """
+    order_match = re.search(r"ORDER\s+BY\s+(\w+)(?:\s+(ASC|DESC))?", jql, re.IGNORECASE)
+    if not order_match:
+        return None
+    direction = order_match.group(2).upper() if order_match.group(2) else "ASC"
+    return order_match.group(1).lower(), direction == "DESC"
+
+
+@functools.lru_cache(maxsize=256)
+def _check_jql(jql: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Run the mock's JQL validation checks.
+
+    Args:
+        jql: JQL query string to validate.
+
+    Returns:
+        Tuple of (errors, warnings).
+    """
+    errors = []
+    warnings = []
+
+    # Check for unbalanced parentheses
+    if jql.count("(") != jql.count(")"):
+        errors.append("Unbalanced parentheses")
+
+    # Check for unbalanced quotes
+    if jql.count('"') % 2 != 0:
+        errors.append("Unbalanced double quotes")
+
+    # Check for invalid operators
+    invalid_ops = re.findall(r"[=!<>]{3,}", jql)
+    if invalid_ops:
+        errors.append(f"Invalid operator: {invalid_ops[0]}")
+
+    # Check for known fields
+    used_fields = re.findall(r"(\w+)\s*[=!~<>]+", jql, re.IGNORECASE)
+    for field in used_fields:
+        if field.lower() not in _KNOWN_JQL_FIELDS and not field.startswith(
+            "customfield_"
+        ):
+            warnings.append(f"Unknown field: {field}")
+
+    return tuple(errors), tuple(warnings)
+
+
 class SearchMixin(_Base):
     """Mixin providing advanced search functionality.
 
@@ -51,6 +238,37 @@ class SearchMixin(_Base):
         },
     ]
 
+    # =========================================================================
+    # Instance State
+    # =========================================================================
+
+    def _ensure_filters_state(self):
+        """Ensure _filters dict exists (filter ID -> filter), seeded from FILTERS."""
+        if not hasattr(self, "_filters"):
+            self._filters: dict[str, dict[str, Any]] = {
+                f["id"]: dict(f) for f in self.FILTERS
+            }
+
+    def _get_filter_or_raise(self, filter_id: str) -> dict[str, Any]:
+        """Return the stored filter, or raise NotFoundError.
+
+        Args:
+            filter_id: Filter ID.
+
+        Returns:
+            The stored filter object.
+
+        Raises:
+            NotFoundError: If the filter is not found.
+        """
+        self._ensure_filters_state()
+        f = self._filters.get(filter_id)
+        if f is None:
+            from ...error_handler import NotFoundError
+
+            raise NotFoundError(f"Filter {filter_id} not found")
+        return f
+
     # =========================================================================
     # Advanced JQL Search
     # =========================================================================
@@ -109,130 +327,89 @@ class SearchMixin(_Base):
         Returns:
             Filtered list of issues.
         """
-        jql_upper = jql.upper()
+        criteria = _parse_jql_filters(jql)
 
         # Project filter
-        project_match = re.search(r"PROJECT\s*=\s*(\w+)", jql_upper)
-        if project_match:
-            project = project_match.group(1)
-            if project == "DEMOSD":
-                issues = [i for i in issues if i["key"].startswith("DEMOSD-")]
-            elif project == "DEMO":
-                issues = [
-                    i
-                    for i in issues
-                    if i["key"].startswith("DEMO-")
-                    and not i["key"].startswith("DEMOSD-")
-                ]
+        if criteria.project is not None:
+            prefix = f"{criteria.project}-"
+            issues = [i for i in issues if i["key"].startswith(prefix)]
 
         # Issue type filter
-        type_match = re.search(r"ISSUETYPE\s*=\s*[\"']?(\w+)[\"']?", jql_upper)
-        if type_match:
-            issue_type = type_match.group(1).title()
+        if criteria.issue_type is not None:
             issues = [
                 i
                 for i in issues
-                if i["fields"]["issuetype"]["name"].lower() == issue_type.lower()
+                if i["fields"]["issuetype"]["name"].lower() == criteria.issue_type
             ]
 
         # Status filter
-        status_match = re.search(
-            r'STATUS\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
-        )
-        if status_match:
-            status = status_match.group(1).strip()
+        if criteria.status is not None:
             issues = [
                 i
                 for i in issues
-                if i["fields"]["status"]["name"].lower() == status.lower()
+                if i["fields"]["status"]["name"].lower() == criteria.status
             ]
 
         # Status NOT filter
-        status_not_match = re.search(
-            r'STATUS\s*!=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
-        )
-        if status_not_match:
-            status = status_not_match.group(1).strip()
+        if criteria.status_not is not None:
             issues = [
                 i
                 for i in issues
-                if i["fields"]["status"]["name"].lower() != status.lower()
+                if i["fields"]["status"]["name"].lower() != criteria.status_not
             ]
 
         # Assignee filter
-        if "ASSIGNEE" in jql_upper:
-            if "CURRENTUSER()" in jql_upper:
-                issues = [
-                    i
-                    for i in issues
-                    if i["fields"].get("assignee", {}).get("accountId") == "abc123"
-                ]
-            elif "EMPTY" in jql_upper or "NULL" in jql_upper:
-                issues = [i for i in issues if not i["fields"].get("assignee")]
-            else:
-                assignee_match = re.search(
-                    r'ASSIGNEE\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
-                )
-                if assignee_match:
-                    assignee = assignee_match.group(1).strip().lower()
-                    issues = [
-                        i
-                        for i in issues
-                        if i["fields"]
-                        .get("assignee", {})
-                        .get("displayName", "")
-                        .lower()
-                        == assignee
-                        or i["fields"].get("assignee", {}).get("accountId", "").lower()
-                        == assignee
-                    ]
+        if criteria.assignee_current_user:
+            issues = [
+                i
+                for i in issues
+                if i["fields"].get("assignee", {}).get("accountId") == "abc123"
+            ]
+        elif criteria.assignee_empty:
+            issues = [i for i in issues if not i["fields"].get("assignee")]
+        elif criteria.assignee is not None:
+            assignee = criteria.assignee
+            issues = [
+                i
+                for i in issues
+                if i["fields"].get("assignee", {}).get("displayName", "").lower()
+                == assignee
+                or i["fields"].get("assignee", {}).get("accountId", "").lower()
+                == assignee
+            ]
 
         # Reporter filter
-        if "REPORTER" in jql_upper:
-            if "CURRENTUSER()" in jql_upper:
-                issues = [
-                    i
-                    for i in issues
-                    if i["fields"].get("reporter", {}).get("accountId") == "abc123"
-                ]
-            else:
-                reporter_match = re.search(
-                    r'REPORTER\s*=\s*["\']?([^"\']+)["\']?', jql, re.IGNORECASE
-                )
-                if reporter_match:
-                    reporter = reporter_match.group(1).strip().lower()
-                    issues = [
-                        i
-                        for i in issues
-                        if i["fields"]
-                        .get("reporter", {})
-                        .get("displayName", "")
-                        .lower()
-                        == reporter
-                    ]
+        if criteria.reporter_current_user:
+            issues = [
+                i
+                for i in issues
+                if i["fields"].get("reporter", {}).get("accountId") == "abc123"
+            ]
+        elif criteria.reporter is not None:
+            issues = [
+                i
+                for i in issues
+                if i["fields"].get("reporter", {}).get("displayName", "").lower()
+                == criteria.reporter
+            ]
 
         # Priority filter
-        priority_match = re.search(
-            r'PRIORITY\s*=\s*["\']?(\w+)["\']?', jql, re.IGNORECASE
-        )
-        if priority_match:
-            priority = priority_match.group(1).strip()
+        if criteria.priority is not None:
             issues = [
                 i
                 for i in issues
-                if i["fields"]["priority"]["name"].lower() == priority.lower()
+                if i["fields"]["priority"]["name"].lower() == criteria.priority
             ]
 
         # Label filter
-        label_match = re.search(r'LABELS\s*=\s*["\']?(\w+)["\']?', jql, re.IGNORECASE)
-        if label_match:
-            label = label_match.group(1).strip()
-            issues = [i for i in issues if label in i["fields"].get("labels", [])]
+        if criteria.label is not None:
+            issues = [
+                i for i in issues if criteria.label in i["fields"].get("labels", [])
+            ]
 
         # Text search
-        text_match = re.search(r'TEXT\s*~\s*["\']([^"\']+)["\']', jql, re.IGNORECASE)
-        if text_match:
-            search_term = text_match.group(1).lower()
+        if criteria.text is not None:
+            search_term = criteria.text
             issues = [
                 i
                 for i in issues
@@ -241,30 +418,20 @@ class SearchMixin(_Base):
             ]
 
         # Summary contains
-        summary_match = re.search(
-            r'SUMMARY\s*~\s*["\']([^"\']+)["\']', jql, re.IGNORECASE
-        )
-        if summary_match:
-            search_term = summary_match.group(1).lower()
+        if criteria.summary is not None:
             issues = [
                 i
                 for i in issues
-                if search_term in i["fields"].get("summary", "").lower()
+                if criteria.summary in i["fields"].get("summary", "").lower()
             ]
 
         # Issue key filter
-        key_match = re.search(r"KEY\s*=\s*(\w+-\d+)", jql, re.IGNORECASE)
-        if key_match:
-            key = key_match.group(1).upper()
-            issues = [i for i in issues if i["key"] == key]
+        if criteria.key is not None:
+            issues = [i for i in issues if i["key"] == criteria.key]
 
         # Key IN filter
-        key_in_match = re.search(r"KEY\s+IN\s*\(([^)]+)\)", jql, re.IGNORECASE)
-        if key_in_match:
-            keys = [
-                k.strip().strip("'\"").upper() for k in key_in_match.group(1).split(",")
-            ]
-            issues = [i for i in issues if i["key"] in keys]
+        if criteria.keys is not None:
+            issues = [i for i in issues if i["key"] in criteria.keys]
 
         return issues
 
@@ -278,15 +445,11 @@ class SearchMixin(_Base):
         Returns:
             Sorted list of issues.
         """
-        order_match = re.search(
-            r"ORDER\s+BY\s+(\w+)(?:\s+(ASC|DESC))?", jql, re.IGNORECASE
-        )
-        if not order_match:
+        order = _parse_jql_order(jql)
+        if order is None:
             return issues
 
-        field = order_match.group(1).lower()
-        direction = order_match.group(2).upper() if order_match.group(2) else "ASC"
-        reverse = direction == "DESC"
+        field, reverse = order
 
         def get_sort_key(issue):
             fields = issue.get("fields", {})
@@ -321,53 +484,11 @@ class SearchMixin(_Base):
         Returns:
             Validation result with any errors or warnings.
         """
-        errors = []
-        warnings = []
-
-        # Check for unbalanced parentheses
-        if jql.count("(") != jql.count(")"):
-            errors.append("Unbalanced parentheses")
-
-        # Check for unbalanced quotes
-        if jql.count('"') % 2 != 0:
-            errors.append("Unbalanced double quotes")
-
-        # Check for invalid operators
-        invalid_ops = re.findall(r"[=!<>]{3,}", jql)
-        if invalid_ops:
-            errors.append(f"Invalid operator: {invalid_ops[0]}")
-
-        # Check for known fields
-        known_fields = [
-            "project",
-            "issuetype",
-            "status",
-            "priority",
-            "assignee",
-            "reporter",
-            "summary",
-            "description",
-            "labels",
-            "created",
-            "updated",
-            "key",
-            "text",
-            "sprint",
-            "fixversion",
-            "component",
-        ]
-        field_pattern = r"(\w+)\s*[=!~<>]+"
-        used_fields = re.findall(field_pattern, jql, re.IGNORECASE)
-        for field in used_fields:
-            if field.lower() not in known_fields and not field.startswith(
-                "customfield_"
-            ):
-                warnings.append(f"Unknown field: {field}")
-
+        errors, warnings = _check_jql(jql)
         return {
             "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
+            "errors": list(errors),
+            "warnings": list(warnings),
             "jql": jql,
         }
 
@@ -438,22 +559,16 @@ class SearchMixin(_Base):
         Raises:
             NotFoundError: If the filter is not found.
         """
-        for f in self.FILTERS:
-            if f["id"] == filter_id:
-                result = dict(f)
-                if expand:
-                    # Add expanded fields as empty placeholders
-                    for field in expand.split(","):
-                        field = field.strip()
-                        if field == "sharedUsers":
-                            result["sharedUsers"] = []
-                        elif field == "subscriptions":
-                            result["subscriptions"] = []
-                return result
-
-        from ...error_handler import NotFoundError
-
-        raise NotFoundError(f"Filter {filter_id} not found")
+        result = dict(self._get_filter_or_raise(filter_id))
+        if expand:
+            # Add expanded fields as empty placeholders
+            for field in expand.split(","):
+                field = field.strip()
+                if field == "sharedUsers":
+                    result["sharedUsers"] = []
+                elif field == "subscriptions":
+                    result["subscriptions"] = []
+        return result
 
     def get_favourite_filters(self) -> list[dict[str, Any]]:
         """Get user's favourite filters.
@@ -461,7 +576,8 @@ class SearchMixin(_Base):
         Returns:
             List of favourite filters.
         """
-        return [f for f in self.FILTERS if f.get("favourite")]
+        self._ensure_filters_state()
+        return [f for f in self._filters.values() if f.get("favourite")]
 
     def get_my_filters(self) -> list[dict[str, Any]]:
         """Get filters owned by current user.
@@ -469,7 +585,10 @@ class SearchMixin(_Base):
         Returns:
             List of user's filters.
         """
-        return [f for f in self.FILTERS if f["owner"]["accountId"] == "abc123"]
+        self._ensure_filters_state()
+        return [
+            f for f in self._filters.values() if f["owner"]["accountId"] == "abc123"
+        ]
 
     def search_filters(
         self,
@@ -489,7 +608,8 @@ class SearchMixin(_Base):
         Returns:
             Paginated list of filters.
         """
-        filters = list(self.FILTERS)
+        self._ensure_filters_state()
+        filters = list(self._filters.values())
 
         if filter_name:
             filter_name_lower = filter_name.lower()
@@ -522,7 +642,8 @@ class SearchMixin(_Base):
         Returns:
             The created filter.
         """
-        filter_id = str(10000 + len(self.FILTERS))
+        self._ensure_filters_state()
+        filter_id = str(max(map(int, self._filters), default=9999) + 1)
         result = {
             "id": filter_id,
             "name": name,
@@ -534,6 +655,7 @@ class SearchMixin(_Base):
         }
         if share_permissions:
             result["sharePermissions"] = share_permissions
+        self._filters[filter_id] = result
         return result
 
     def update_filter(
@@ -557,20 +679,14 @@ class SearchMixin(_Base):
         Raises:
             NotFoundError: If the filter is not found.
         """
-        for f in self.FILTERS:
-            if f["id"] == filter_id:
-                updated = dict(f)
-                if name:
-                    updated["name"] = name
-                if jql:
-                    updated["jql"] = jql
-                if description is not None:
-                    updated["description"] = description
-                return updated
-
-        from ...error_handler import NotFoundError
-
-        raise NotFoundError(f"Filter {filter_id} not found")
+        f = self._get_filter_or_raise(filter_id)
+        if name:
+            f["name"] = name
+        if jql:
+            f["jql"] = jql
+        if description is not None:
+            f["description"] = description
+        return f
 
     def delete_filter(self, filter_id: str) -> None:
         """Delete a saved filter.
@@ -581,13 +697,8 @@ class SearchMixin(_Base):
         Raises:
             NotFoundError: If the filter is not found.
         """
-        for f in self.FILTERS:
-            if f["id"] == filter_id:
-                return  # Mock deletion
-
-        from ...error_handler import NotFoundError
-
-        raise NotFoundError(f"Filter {filter_id} not found")
+        self._get_filter_or_raise(filter_id)
+        del self._filters[filter_id]
 
     def set_filter_favourite(self, filter_id: str, favourite: bool) -> dict[str, Any]:
         """Set filter favourite status.
@@ -598,16 +709,13 @@ class SearchMixin(_Base):
 
         Returns:
             The updated filter.
-        """
-        for f in self.FILTERS:
-            if f["id"] == filter_id:
-                updated = dict(f)
-                updated["favourite"] = favourite
-                return updated
-
-        from ...error_handler import NotFoundError
 
-        raise NotFoundError(f"Filter {filter_id} not found")
+        Raises:
+            NotFoundError: If the filter is not found.
+        """
+        f = self._get_filter_or_raise(filter_id)
+        f["favourite"] = favourite
+        return f
 
     # =========================================================================
     # Bulk Search Operations
@@ -627,7 +735,7 @@ class SearchMixin(_Base):
         Returns:
             List of issues.
         """
-        return [self._issues[key] for key in keys if key in self._issues]
+        return [issue for key in keys if (issue := self._issues.get(key)) is not None]
 
     def count_issues(self, jql: str) -> int:
         """Count issues matching a JQL query.
@@ -12,14 +12,25 @@ metadata, workflows, patterns, and defaults. Context is loaded from:
 
 from __future__ import annotations
 
+import heapq
 import json
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+# orjson parses noticeably faster; fall back to the stdlib when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Module-level cache for session persistence
 _context_cache: dict[str, "ProjectContext"] = {}
 
+# Default keys whose global and issue-type lists are combined, not replaced
+_MERGED_LIST_KEYS = ("labels", "components")
+
 
 @dataclass
 class ProjectContext:
@@ -71,13 +82,13 @@ def get_project_skill_path(project_key: str) -> Path:
 
 def load_json_file(path: Path) -> dict[str, Any] | None:
     """Load a JSON file if it exists."""
-    if path.exists():
-        try:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError):
-            return None
-    return None
+    try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
 
 
 def load_skill_context(project_key: str) -> dict[str, Any] | None:
@@ -199,14 +210,26 @@ def merge_contexts(
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override dict into base dict."""
-    result = base.copy()
+    """
+    Merge override dict into base dict, descending into nested dicts.
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    Walks an explicit stack of (destination, source) pairs instead of
+    recursing. Nested dicts from base are copied before they are written
+    to, so base is never modified.
+    """
+    result = base.copy()
+    stack = [(result, override)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                merged = existing.copy()
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
 
     return result
 
@@ -276,12 +299,10 @@ def clear_context_cache(project_key: str | None = None) -> None:
         project_key: If specified, only clear cache for this project.
                      If None, clear all cached contexts.
     """
-    global _context_cache
-
     if project_key is None:
         _context_cache.clear()
-    elif project_key in _context_cache:
-        del _context_cache[project_key]
+    else:
+        _context_cache.pop(project_key, None)
 
 
 def get_defaults_for_issue_type(
@@ -309,12 +330,9 @@ def get_defaults_for_issue_type(
     type_defaults = by_type.get(issue_type, {})
 
     for key, value in type_defaults.items():
-        if key == "labels" and key in result:
-            # Merge label lists
-            result[key] = list(set(result[key] + value))
-        elif key == "components" and key in result:
-            # Merge component lists
-            result[key] = list(set(result[key] + value))
+        if key in _MERGED_LIST_KEYS and key in result:
+            # Merge lists, dropping duplicates but keeping first-seen order
+            result[key] = list(dict.fromkeys(result[key] + value))
         else:
             result[key] = value
 
@@ -426,9 +444,9 @@ def get_common_labels(
             for label, count in type_patterns.get("labels", {}).items():
                 labels[label] = labels.get(label, 0) + count
 
-    # Sort by count and return top N
-    sorted_labels = sorted(labels.items(), key=lambda x: x[1], reverse=True)
-    return [label for label, _ in sorted_labels[:limit]]
+    # Select the top N by count without sorting every label
+    top_labels = heapq.nlargest(limit, labels.items(), key=itemgetter(1))
+    return [label for label, _ in top_labels]
 
 
 def validate_transition(
@@ -447,12 +465,7 @@ def validate_transition(
         True if transition is valid, False otherwise
     """
     valid_transitions = get_valid_transitions(context, issue_type, from_status)
-
-    for transition in valid_transitions:
-        if transition.get("to_status") == to_status:
-            return True
-
-    return False
+    return any(t.get("to_status") == to_status for t in valid_transitions)
 
 
 def format_context_summary(context: ProjectContext) -> str:
@@ -30,8 +30,10 @@ Example usage:
 from __future__ import annotations
 
 import random
+import secrets
 import string
 import time
+import weakref
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -104,9 +106,9 @@ class IssueBuilder:
         return self
 
     def add_labels(self, labels: list[str]) -> "IssueBuilder":
-        """Add labels to existing."""
+        """Add labels to existing, skipping duplicates and keeping order."""
         current = self._fields.get("labels", [])
-        self._fields["labels"] = list(set(current + labels))
+        self._fields["labels"] = list(dict.fromkeys(current + labels))
         return self
 
     def with_assignee(self, account_id: str) -> "IssueBuilder":
@@ -204,11 +206,11 @@ def assert_search_returns_results(
     Raises:
         AssertionError: If count not reached
     """
-    start = time.time()
+    start = time.monotonic()
     interval = 0.5
     last_count = 0
 
-    while time.time() - start < timeout:
+    while time.monotonic() - start < timeout:
         response = client.post(
             "/rest/api/3/search",
             json={"jql": jql, "maxResults": 100},
@@ -286,23 +288,64 @@ def assert_issue_has_field(
                         f"Issue {issue.get('key')} field '{field_name}.{k}' "
                         f"expected '{v}', got '{actual.get(k)}'"
                     )
-        elif isinstance(actual, dict) and "name" in actual:
-            if actual["name"] != expected_value:
+        else:
+            actual = _extract_scalar(actual)
+            if actual != expected_value:
                 raise AssertionError(
                     f"Issue {issue.get('key')} field '{field_name}' "
-                    f"expected '{expected_value}', got '{actual['name']}'"
+                    f"expected '{expected_value}', got '{actual}'"
                 )
-        elif actual != expected_value:
-            raise AssertionError(
-                f"Issue {issue.get('key')} field '{field_name}' "
-                f"expected '{expected_value}', got '{actual}'"
-            )
+
+
+# Keys that hold the comparable value of object-valued fields, in lookup order
+# (status/priority use name, select options value, parent/epic key)
+_SCALAR_KEYS = ("name", "value", "key", "id")
+
+
+def _extract_scalar(value: Any) -> Any:
+    """Reduce an object-valued field to its name/value/key/id, if it has one."""
+    if isinstance(value, dict):
+        for key in _SCALAR_KEYS:
+            if key in value:
+                return value[key]
+    return value
 
 
 # =============================================================================
 # Version Detection
 # =============================================================================
 
+# serverInfo responses per client; the server does not change for a session
+_server_info_cache: weakref.WeakKeyDictionary[Any, dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_server_info(client: "JiraClient") -> dict[str, Any]:
+    """Fetch serverInfo (v3, falling back to v2), cached per client on success."""
+    info = _server_info_cache.get(client)
+    if info is None:
+        try:
+            info = client.get("/rest/api/3/serverInfo")
+        except Exception:
+            info = client.get("/rest/api/2/serverInfo")
+        _server_info_cache[client] = info
+    return info
+
+
+def clear_server_info_cache(client: Optional["JiraClient"] = None) -> None:
+    """
+    Forget cached serverInfo responses.
+
+    Args:
+        client: If specified, only forget this client's response.
+                If None, forget all cached responses.
+    """
+    if client is None:
+        _server_info_cache.clear()
+    else:
+        _server_info_cache.pop(client, None)
+
 
 def get_jira_version(client: "JiraClient") -> tuple[int, int, int]:
     """
@@ -314,11 +357,7 @@ def get_jira_version(client: "JiraClient") -> tuple[int, int, int]:
     Returns:
         Version tuple (major, minor, patch)
     """
-    try:
-        info = client.get("/rest/api/3/serverInfo")
-    except Exception:
-        info = client.get("/rest/api/2/serverInfo")
-
+    info = _get_server_info(client)
     version_str = info.get("version", "0.0.0")
     parts = version_str.split(".")
     return (
@@ -362,7 +401,7 @@ def is_cloud_instance(client: "JiraClient") -> bool:
         True if JIRA Cloud, False if DC/Server
     """
     try:
-        info = client.get("/rest/api/3/serverInfo")
+        info = _get_server_info(client)
         return info.get("deploymentType") == "Cloud"
     except Exception:
         return False
@@ -391,8 +430,8 @@ def wait_for_transition(
     Returns:
         True if status reached, False on timeout
     """
-    start = time.time()
-    while time.time() - start < timeout:
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
         issue = client.get(f"/rest/api/3/issue/{issue_key}?fields=status")
         current = issue.get("fields", {}).get("status", {}).get("name")
         if current == expected_status:
@@ -419,8 +458,8 @@ def wait_for_assignment(
     Returns:
         True if assignment matches, False on timeout
     """
-    start = time.time()
-    while time.time() - start < timeout:
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
         issue = client.get(f"/rest/api/3/issue/{issue_key}?fields=assignee")
         assignee = issue.get("fields", {}).get("assignee")
         current_id = assignee.get("accountId") if assignee else None
@@ -439,13 +478,13 @@ def wait_for_assignment(
 def _random_suffix(length: int = 8) -> str:
     """Generate random suffix for unique names."""
     chars = string.ascii_lowercase + string.digits
-    return "".join(random.choice(chars) for _ in range(length))
+    return "".join(random.choices(chars, k=length))
 
 
 def generate_unique_name(prefix: str = "test") -> str:
     """Generate unique name with timestamp and random suffix."""
     ts = datetime.now().strftime("%Y%m%d%H%M%S")
-    suffix = _random_suffix(4)
+    suffix = secrets.token_hex(4)
     return f"{prefix}_{ts}_{suffix}"
 
 
@@ -454,6 +493,7 @@ __all__ = [
     "assert_issue_has_field",
     "assert_search_returns_empty",
     "assert_search_returns_results",
+    "clear_server_info_cache",
     "generate_unique_name",
     "get_jira_version",
     "is_cloud_instance",
@@ -5,9 +5,12 @@ Provides functions to validate issue keys, JQL queries, project keys,
 and other inputs before making API calls.
 """
 
+import functools
+import inspect
 import os
 import re
-from typing import Any
+import sys
+from typing import Any, Callable, Iterable, TypeVar, cast
 
 from assistant_skills_lib.error_handler import ValidationError
 from assistant_skills_lib.validators import validate_email as base_validate_email
@@ -15,6 +18,44 @@ from assistant_skills_lib.validators import validate_int, validate_required
 from assistant_skills_lib.validators import validate_path as base_validate_path
 from assistant_skills_lib.validators import validate_url as base_validate_url
 
+_F = TypeVar("_F", bound=Callable[..., str])
+
+_PROJECT_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9]*$")
+# SQL statements chained after ';' and script injection, scanned in one pass
+_JQL_DANGEROUS_PATTERN = re.compile(
+    r";\s*(?:DROP|DELETE|INSERT|UPDATE)|<script|javascript:", re.IGNORECASE
+)
+
+
+def _memoize_str_input(func: _F) -> _F:
+    """
+    Cache a validator's results for string inputs.
+
+    Validators are pure, and callers validate the same keys over and over.
+    Non-string inputs (None, ints) bypass the cache and are validated as
+    before; errors are never cached, so invalid input raises on every call.
+    """
+    cached = functools.lru_cache(maxsize=512)(func)
+    # The validated value may be passed by keyword (validate_url(url=...))
+    value_param = next(iter(inspect.signature(func).parameters))
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        value = args[0] if args else kwargs.get(value_param)
+        if isinstance(value, str):
+            return cached(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return cast(_F, wrapper)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted path once; callers reuse a handful of literal paths."""
+    return tuple(path.split("."))
+
 
 def safe_get_nested(obj: dict, path: str, default: Any = None) -> Any:
     """
@@ -45,10 +86,9 @@ def safe_get_nested(obj: dict, path: str, default: Any = None) -> Any:
     if not obj or not isinstance(obj, dict):
         return default
 
-    keys = path.split(".")
     current: Any = obj
 
-    for key in keys:
+    for key in _split_path(path):
         if not isinstance(current, dict):
             return default
         current = current.get(key)
@@ -58,6 +98,24 @@ def safe_get_nested(obj: dict, path: str, default: Any = None) -> Any:
     return current
 
 
+def _is_issue_key(key: str) -> bool:
+    """
+    Check an uppercased key matches PROJECT-123, i.e. ^[A-Z][A-Z0-9]*-[0-9]+$.
+
+    Plain str predicates are cheaper than a regex match for keys this short;
+    isascii() keeps the Unicode-aware predicates to the ASCII grammar.
+    """
+    project, sep, number = key.partition("-")
+    return (
+        bool(sep)
+        and key.isascii()
+        and project[:1].isalpha()
+        and project.isalnum()
+        and number.isdigit()
+    )
+
+
+@_memoize_str_input
 def validate_issue_key(issue_key: str) -> str:
     """
     Validate JIRA issue key format (e.g., PROJ-123).
@@ -74,8 +132,7 @@ def validate_issue_key(issue_key: str) -> str:
     issue_key = validate_required(issue_key, "issue_key")
     issue_key = issue_key.upper()
 
-    pattern = r"^[A-Z][A-Z0-9]*-[0-9]+$"
-    if not re.match(pattern, issue_key):
+    if not _is_issue_key(issue_key):
         raise ValidationError(
             f"Invalid issue key format: '{issue_key}'. "
             "Expected format: PROJECT-123 (e.g., PROJ-42, DEV-1234)",
@@ -83,9 +140,38 @@ def validate_issue_key(issue_key: str) -> str:
             details={"field": "issue_key", "value": issue_key},
         )
 
-    return issue_key
+    # Keys recur across caches, dict keys and logs; share one string object
+    return sys.intern(issue_key)
+
+
+def validate_issue_keys(issue_keys: Iterable[str]) -> list[str]:
+    """
+    Validate a batch of JIRA issue keys.
+
+    Equivalent to calling validate_issue_key on each key, but well-formed
+    string keys are checked inline.
+
+    Args:
+        issue_keys: Issue keys to validate
+
+    Returns:
+        Normalized issue keys (uppercase), in input order
+
+    Raises:
+        ValidationError: On the first key with an invalid format
+    """
+    validated = []
+    for raw in issue_keys:
+        key = raw.strip().upper() if isinstance(raw, str) else None
+        if not key or not _is_issue_key(key):
+            # Slow path: produces the same normalization or error as the
+            # single-key validator, including for non-string input
+            key = validate_issue_key(raw)
+        validated.append(sys.intern(key))
+    return validated
 
 
+@_memoize_str_input
 def validate_project_key(project_key: str) -> str:
     """
     Validate JIRA project key format.
@@ -102,8 +188,7 @@ def validate_project_key(project_key: str) -> str:
     project_key = validate_required(project_key, "project_key")
     project_key = project_key.upper()
 
-    pattern = r"^[A-Z][A-Z0-9]*$"
-    if not re.match(pattern, project_key):
+    if not _PROJECT_KEY_PATTERN.match(project_key):
         raise ValidationError(
             f"Invalid project key format: '{project_key}'. "
             "Expected format: 2-10 uppercase letters/numbers, starting with a letter "
@@ -119,7 +204,7 @@ def validate_project_key(project_key: str) -> str:
             details={"field": "project_key", "value": project_key},
         )
 
-    return project_key
+    return sys.intern(project_key)
 
 
 def validate_jql(jql: str) -> str:
@@ -137,23 +222,6 @@ def validate_jql(jql: str) -> str:
     """
     jql = validate_required(jql, "jql")
 
-    dangerous_patterns = [
-        r";\s*DROP",
-        r";\s*DELETE",
-        r";\s*INSERT",
-        r";\s*UPDATE",
-        r"<script",
-        r"javascript:",
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, jql, re.IGNORECASE):
-            raise ValidationError(
-                f"JQL query contains potentially dangerous pattern: {pattern}",
-                operation="validation",
-                details={"field": "jql", "value": jql},
-            )
-
     if len(jql) > 10000:
         raise ValidationError(
             f"JQL query is too long ({len(jql)} characters). Maximum is 10000.",
@@ -161,9 +229,28 @@ def validate_jql(jql: str) -> str:
             details={"field": "jql", "value": jql},
         )
 
+    match = _JQL_DANGEROUS_PATTERN.search(jql)
+    if match:
+        raise ValidationError(
+            f"JQL query contains potentially dangerous pattern: {match.group(0)}",
+            operation="validation",
+            details={"field": "jql", "value": jql},
+        )
+
     return jql
 
 
+def _resolve_file_path(file_path: str, must_exist: bool) -> str:
+    """Resolve an attachment path via base_validate_path, without size checks."""
+    path_obj = base_validate_path(
+        file_path,
+        field_name="file_path",
+        must_exist=must_exist,
+        must_be_file=True,  # Always a file for attachments
+    )
+    return str(path_obj.absolute())
+
+
 def validate_file_path(file_path: str, must_exist: bool = True) -> str:
     """
     Validate file path for attachments.
@@ -179,13 +266,7 @@ def validate_file_path(file_path: str, must_exist: bool = True) -> str:
     Raises:
         ValidationError: If file doesn't exist or path is invalid
     """
-    path_obj = base_validate_path(
-        file_path,
-        field_name="file_path",
-        must_exist=must_exist,
-        must_be_file=True,  # Always a file for attachments
-    )
-    abs_path = str(path_obj.absolute())
+    abs_path = _resolve_file_path(file_path, must_exist)
 
     if must_exist:
         file_size = os.path.getsize(abs_path)
@@ -201,6 +282,7 @@ def validate_file_path(file_path: str, must_exist: bool = True) -> str:
     return abs_path
 
 
+@_memoize_str_input
 def validate_url(url: str, require_https: bool = True) -> str:
     """
     Validate JIRA instance URL using base_validate_url.
@@ -223,6 +305,7 @@ def validate_url(url: str, require_https: bool = True) -> str:
     )
 
 
+@_memoize_str_input
 def validate_email(email: str) -> str:
     """
     Validate email address format using base_validate_email.
@@ -252,14 +335,26 @@ def validate_transition_id(transition_id: str) -> str:
     Raises:
         ValidationError: If not a valid numeric ID
     """
+    # Fast path for plain ASCII digit strings, the form the API returns
+    if (
+        isinstance(transition_id, str)
+        and transition_id.isascii()
+        and transition_id.isdigit()
+    ):
+        try:
+            return str(int(transition_id))
+        except ValueError:
+            # Past the int/str conversion digit limit; validate_int reports it
+            pass
+
     transition_id_int = validate_int(transition_id, "transition_id", min_value=0)
     return str(transition_id_int)
 
 
 # ========== Project Administration Validators ==========
 
-VALID_PROJECT_TYPES = ["software", "business", "service_desk"]
-VALID_ASSIGNEE_TYPES = ["PROJECT_LEAD", "UNASSIGNED", "COMPONENT_LEAD"]
+VALID_PROJECT_TYPES = frozenset({"software", "business", "service_desk"})
+VALID_ASSIGNEE_TYPES = frozenset({"PROJECT_LEAD", "UNASSIGNED", "COMPONENT_LEAD"})
 
 # Common project template shortcuts
 PROJECT_TEMPLATES = {
@@ -278,15 +373,18 @@ PROJECT_TEMPLATES = {
 
 
 def _validate_enum(
-    value: str, field_name: str, valid_values: list[str], normalize: str = "lower"
+    value: str,
+    field_name: str,
+    valid_values: frozenset[str],
+    normalize: str = "lower",
 ) -> str:
     """
-    Validate value is in a list of valid options.
+    Validate value is in a set of valid options.
 
     Args:
         value: Value to validate
         field_name: Field name for error messages
-        valid_values: List of valid options
+        valid_values: Set of valid options
         normalize: "lower" or "upper" for case normalization
 
     Returns:
@@ -301,7 +399,7 @@ def _validate_enum(
     if value not in valid_values:
         raise ValidationError(
             f"Invalid {field_name.replace('_', ' ')}: '{value}'. "
-            f"Valid types: {', '.join(valid_values)}",
+            f"Valid types: {', '.join(sorted(valid_values))}",
             operation="validation",
             details={"field": field_name, "value": value},
         )
@@ -309,6 +407,7 @@ def _validate_enum(
     return value
 
 
+@_memoize_str_input
 def validate_project_type(project_type: str) -> str:
     """
     Validate project type.
@@ -325,6 +424,7 @@ def validate_project_type(project_type: str) -> str:
     return _validate_enum(project_type, "project_type", VALID_PROJECT_TYPES, "lower")
 
 
+@_memoize_str_input
 def validate_assignee_type(assignee_type: str) -> str:
     """
     Validate default assignee type.
@@ -341,6 +441,7 @@ def validate_assignee_type(assignee_type: str) -> str:
     return _validate_enum(assignee_type, "assignee_type", VALID_ASSIGNEE_TYPES, "upper")
 
 
+@_memoize_str_input
 def validate_project_template(template: str) -> str:
     """
     Validate and expand project template.
@@ -357,14 +458,15 @@ def validate_project_template(template: str) -> str:
     template = validate_required(template, "project_template")
     template = template.lower()
 
-    # If it's a shortcut, expand it
-    if template in PROJECT_TEMPLATES:
-        return PROJECT_TEMPLATES[template]
-
-    # If it looks like a full template key, return it
+    # If it looks like a full template key, return it (no shortcut has . or :)
     if "." in template or ":" in template:
         return template
 
+    # If it's a shortcut, expand it (shortcut keys are all lowercase)
+    expanded = PROJECT_TEMPLATES.get(template)
+    if expanded is not None:
+        return expanded
+
     # Unknown shortcut
     shortcuts = ", ".join(PROJECT_TEMPLATES.keys())
     raise ValidationError(
@@ -447,6 +549,9 @@ def validate_category_name(name: str) -> str:
     return _validate_string_length(name, "category_name", min_length=1, max_length=255)
 
 
+_AVATAR_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif"})
+
+
 def validate_avatar_file(file_path: str) -> str:
     """
     Validate avatar file for project avatar upload.
@@ -460,17 +565,17 @@ def validate_avatar_file(file_path: str) -> str:
     Raises:
         ValidationError: If file is invalid for avatar use
     """
-    # Use base file validation
-    abs_path = validate_file_path(file_path, must_exist=True)
+    # Use base path validation; the 1MB avatar limit below is stricter than
+    # the attachment limit, so the file is sized only once
+    abs_path = _resolve_file_path(file_path, must_exist=True)
 
     # Check file extension
-    valid_extensions = [".png", ".jpg", ".jpeg", ".gif"]
     ext = os.path.splitext(abs_path)[1].lower()
 
-    if ext not in valid_extensions:
+    if ext not in _AVATAR_EXTENSIONS:
         raise ValidationError(
             f"Invalid avatar file format: '{ext}'. "
-            f"Valid formats: {', '.join(valid_extensions)}",
+            f"Valid formats: {', '.join(sorted(_AVATAR_EXTENSIONS))}",
             operation="validation",
             details={"field": "file_path", "value": abs_path},
         )
@@ -134,10 +134,10 @@ class TestConstants:
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    @patch("jira_as.cli.commands.bulk_cmds.validate_issue_key")
+    @patch("jira_as.cli.commands.bulk_cmds.validate_issue_keys")
     def test_get_issues_to_process_with_keys(self, mock_validate, mock_client):
         """Test getting issues from issue keys."""
-        mock_validate.side_effect = lambda x: x
+        mock_validate.side_effect = list
 
         result = _get_issues_to_process(
             mock_client,
@@ -17,6 +17,7 @@ from jira_as.cli.commands.ops_cmds import (
     _cache_clear_impl,
     _cache_status_impl,
     _cache_warm_impl,
+    _discover_patterns,
     _discover_project_impl,
     _format_bytes,
     _format_cache_clear,
@@ -422,6 +423,37 @@ class TestDiscoverProjectImpl:
         mock_jira_client.__exit__.assert_called_once()
 
 
+@pytest.mark.unit
+class TestDiscoverPatterns:
+    """Tests for the _discover_patterns ranking helper."""
+
+    def test_rankings_are_top_20_by_count(self):
+        """Test common labels and top assignees keep the 20 most frequent."""
+        # label-N and user-N each appear N times
+        issues = [
+            {
+                "fields": {
+                    "issuetype": {"name": "Task"},
+                    "labels": [f"label-{n}"],
+                    "assignee": {"accountId": f"user-{n}", "displayName": f"U{n}"},
+                }
+            }
+            for n in range(1, 26)
+            for _ in range(n)
+        ]
+        client = MagicMock()
+        client.search_issues.return_value = {"issues": issues}
+
+        patterns = _discover_patterns(client, "PROJ")
+
+        expected = list(range(25, 5, -1))
+        assert patterns["common_labels"] == [f"label-{n}" for n in expected]
+        assert [a["account_id"] for a in patterns["top_assignees"]] == [
+            f"user-{n}" for n in expected
+        ]
+        assert patterns["top_assignees"][0]["total_assignments"] == 25
+
+
 @pytest.mark.unit
 class TestFormatDiscoverProject:
     """Tests for the _format_discover_project formatting function."""
@@ -10,6 +10,7 @@ Hooks:
 Note: Markers are registered in pyproject.toml [tool.pytest.ini_options].markers
 
 Fixtures:
+- _no_system_keychain: Keeps non-live tests off the system keyring (autouse)
 - mock_config: Sample JIRA configuration dictionary
 - mock_jira_client: Mock JiraClient for unit tests (re-exported from commands/conftest.py)
 """
@@ -45,6 +46,21 @@ def pytest_collection_modifyitems(config, items):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _no_system_keychain(request, monkeypatch):
+    """Report the keychain as unavailable to config lookups in non-live tests.
+
+    The real probe talks to the OS keyring (D-Bus Secret Service on Linux),
+    which can block on headless CI and would read the developer's stored
+    credentials. Live tests keep the real probe.
+    """
+    if "live" in request.keywords:
+        return
+    monkeypatch.setattr(
+        "jira_as.config_manager.is_keychain_available", lambda: False, raising=False
+    )
+
+
 @pytest.fixture
 def mock_config():
     """Sample JIRA configuration dictionary for testing."""
@@ -5,10 +5,43 @@ Tests the mixin functionality in isolation using the composed MockJiraClient.
 
 import pytest
 
+from jira_as.adf_helper import adf_to_text, text_to_adf
 from jira_as.error_handler import NotFoundError
 from jira_as.mock import MockJiraClient, is_mock_mode
 
 
+@pytest.fixture(scope="session")
+def _base_client():
+    """Seeded mock client shared by test classes that only read from it."""
+    return MockJiraClient()
+
+
+@pytest.fixture
+def client():
+    """Fresh seeded mock client; seed issues are built once per class and URL."""
+    return MockJiraClient()
+
+
+@pytest.fixture
+def unseeded_client():
+    """Mock client with an empty issue store, for tests that need no seed data."""
+    return MockJiraClient(seed=False)
+
+
+@pytest.fixture
+def issue_with_worklog(client):
+    """Client plus the ID of a worklog logged against DEMO-84."""
+    worklog = client.add_worklog("DEMO-84", "1h", comment="seed")
+    return client, worklog["id"]
+
+
+@pytest.fixture
+def issue_with_comment(client):
+    """Client plus the ID of a comment added to DEMO-84."""
+    comment = client.add_comment("DEMO-84", {"type": "doc", "content": []})
+    return client, comment["id"]
+
+
 class TestIsMockMode:
     """Tests for is_mock_mode function."""
 
@@ -41,22 +74,17 @@ class TestIsMockMode:
 class TestTimeTrackingMixin:
     """Tests for TimeTrackingMixin functionality."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_get_time_tracking_configuration(self, client):
+    def test_get_time_tracking_configuration(self, unseeded_client):
         """Test getting time tracking configuration."""
-        config = client.get_time_tracking_configuration()
+        config = unseeded_client.get_time_tracking_configuration()
         assert "workingHoursPerDay" in config
         assert "workingDaysPerWeek" in config
         assert "timeFormat" in config
         assert "defaultUnit" in config
 
-    def test_set_time_tracking_configuration(self, client):
+    def test_set_time_tracking_configuration(self, unseeded_client):
         """Test setting time tracking configuration."""
-        config = client.set_time_tracking_configuration(
+        config = unseeded_client.set_time_tracking_configuration(
             working_hours_per_day=7.5,
             working_days_per_week=4,
             time_format="days",
@@ -90,8 +118,8 @@ class TestTimeTrackingMixin:
         tracking = client.get_time_tracking("DEMO-84")
         assert "remainingEstimate" in tracking
 
-    def test_add_worklog(self, client):
-        """Test adding worklog to issue."""
+    def test_worklog_lifecycle(self, client):
+        """Test adding, reading, updating and deleting a worklog."""
         worklog = client.add_worklog(
             issue_key="DEMO-84",
             time_spent="1h",
@@ -100,21 +128,9 @@ class TestTimeTrackingMixin:
         assert "id" in worklog
         assert worklog["timeSpent"] == "1h"
 
-    def test_get_worklogs(self, client):
-        """Test getting worklogs for issue."""
-        # Add a worklog first
-        client.add_worklog("DEMO-84", "1h", "Test worklog")
-
-        worklogs = client.get_worklogs("DEMO-84")
-        assert "worklogs" in worklogs
-        assert len(worklogs["worklogs"]) >= 1
-
-    def test_update_worklog(self, client):
-        """Test updating a worklog."""
-        # Add a worklog first
-        worklog = client.add_worklog("DEMO-84", "1h", "Original")
+        fetched = client.get_worklog("DEMO-84", worklog["id"])
+        assert fetched["id"] == worklog["id"]
 
-        # Update it
         updated = client.update_worklog(
             issue_key="DEMO-84",
             worklog_id=worklog["id"],
@@ -123,62 +139,49 @@ class TestTimeTrackingMixin:
         )
         assert updated["timeSpent"] == "2h"
 
-    def test_delete_worklog(self, client):
-        """Test deleting a worklog."""
-        # Add a worklog first
-        worklog = client.add_worklog("DEMO-84", "1h", "To delete")
+        worklogs = client.get_worklogs("DEMO-84")
+        assert worklog["id"] in [w["id"] for w in worklogs["worklogs"]]
 
-        # Delete it
         client.delete_worklog("DEMO-84", worklog["id"])
-
-        # Verify it's gone
         worklogs = client.get_worklogs("DEMO-84")
-        worklog_ids = [w["id"] for w in worklogs["worklogs"]]
-        assert worklog["id"] not in worklog_ids
-
-    def test_get_worklog(self, client):
-        """Test getting a specific worklog."""
-        # Add a worklog first
-        worklog = client.add_worklog("DEMO-84", "2h", "Test worklog")
-
-        # Get it
-        fetched = client.get_worklog("DEMO-84", worklog["id"])
-        assert fetched["id"] == worklog["id"]
-
-    def test_get_worklog_ids_modified_since(self, client):
-        """Test getting worklog IDs modified since a date."""
-        result = client.get_worklog_ids_modified_since(0)
-        assert "values" in result
-
-    def test_get_user_worklogs(self, client):
-        """Test getting worklogs for a user."""
-        result = client.get_user_worklogs("abc123")
-        assert "worklogs" in result
-
-    def test_get_project_worklogs(self, client):
-        """Test getting worklogs for a project."""
-        result = client.get_project_worklogs("DEMO")
-        assert "worklogs" in result
+        assert worklog["id"] not in [w["id"] for w in worklogs["worklogs"]]
+
+    @pytest.mark.parametrize(
+        "method,args,key",
+        [
+            ("get_worklog_ids_modified_since", (0,), "values"),
+            ("get_user_worklogs", ("abc123",), "worklogs"),
+            ("get_project_worklogs", ("DEMO",), "worklogs"),
+        ],
+        ids=["modified_since", "user", "project"],
+    )
+    def test_worklog_queries(self, client, method, args, key):
+        """Test worklog query endpoints return their list key."""
+        assert key in getattr(client, method)(*args)
 
     def test_get_time_report(self, client):
-        """Test getting time tracking report."""
-        report = client.get_time_report("DEMO-84")
-        assert isinstance(report, dict)
+        """Test time report totals worklogs per user and per issue."""
+        client.add_worklog("DEMO-84", time_spent_seconds=5400)
+        report = client.get_time_report(project_key="DEMO")
+        assert report["totalSeconds"] == 5400
+        assert report["totalFormatted"] == "1h 30m"
+        assert [u["user"]["accountId"] for u in report["byUser"]] == ["abc123"]
+        assert report["byIssue"] == [{"issueKey": "DEMO-84", "totalSeconds": 5400}]
 
 
 class TestSearchMixin:
     """Tests for SearchMixin functionality."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_search_issues_basic(self, client):
-        """Test basic JQL search."""
-        results = client.search_issues("project = DEMO")
+    @pytest.mark.parametrize(
+        "fields",
+        [None, ["summary", "status"], ["summary", "status", "assignee"]],
+    )
+    def test_search_issues_basic(self, client, fields):
+        """Test basic JQL search with and without a fields list."""
+        results = client.search_issues("project = DEMO", fields=fields)
         assert "issues" in results
         assert "total" in results
+        assert len(results["issues"]) >= 1
 
     def test_advanced_search_with_validate_false(self, client):
         """Test advanced search without validation."""
@@ -225,7 +228,12 @@ class TestSearchMixin:
     def test_search_filters_by_name(self, client):
         """Test searching filters by name."""
         result = client.search_filters(filter_name="Open")
-        assert "values" in result or isinstance(result, list)
+        assert [f["name"] for f in result["values"]] == ["My Open Issues"]
+
+    def test_advanced_search_key_in(self, client):
+        """Test advanced search with a key IN list."""
+        results = client.advanced_search("key in (DEMO-84, 'demo-85')")
+        assert {i["key"] for i in results["issues"]} == {"DEMO-84", "DEMO-85"}
 
     def test_search_issues_by_keys_empty(self, client):
         """Test searching by empty keys list."""
@@ -235,7 +243,7 @@ class TestSearchMixin:
     def test_count_issues_zero(self, client):
         """Test counting issues with no matches."""
         count = client.count_issues("project = NONEXISTENT")
-        assert count == 0 or count >= 0  # May return 0 or all issues
+        assert count == 0
 
     def test_search_issues_order_by_created(self, client):
         """Test search with ORDER BY created."""
@@ -267,6 +275,16 @@ class TestSearchMixin:
         results = client.advanced_search("project = DEMO AND status != Done")
         assert "issues" in results
 
+    def test_advanced_search_repeated_jql_sees_changes(self, client):
+        """Test repeating a JQL query reflects issue changes in between."""
+        jql = "project = DEMO AND status != Done"
+        before = {i["key"] for i in client.advanced_search(jql)["issues"]}
+        assert "DEMO-85" in before
+
+        client.transition_issue("DEMO-85", "31")  # 31 = Done
+        after = {i["key"] for i in client.advanced_search(jql)["issues"]}
+        assert after == before - {"DEMO-85"}
+
     def test_advanced_search_assignee_null(self, client):
         """Test advanced search for null assignee."""
         results = client.advanced_search("project = DEMO AND assignee IS NULL")
@@ -297,12 +315,14 @@ class TestSearchMixin:
     def test_search_filters_empty_name(self, client):
         """Test searching filters with empty name."""
         result = client.search_filters(filter_name="")
-        assert "values" in result or isinstance(result, list)
+        assert isinstance(result["values"], list)
+        assert result["total"] == len(result["values"]) == 3
 
     def test_export_search_results_format(self, client):
         """Test export search results format."""
         results = client.export_search_results("project = DEMO")
-        assert "data" in results or isinstance(results, list)
+        assert results["format"] == "json"
+        assert isinstance(results["data"], list)
 
     def test_get_filter_all_attributes(self, client):
         """Test getting filter has all expected attributes."""
@@ -311,14 +331,6 @@ class TestSearchMixin:
         assert "jql" in filter_result
         assert "owner" in filter_result
 
-    def test_get_favourite_filters_returns_list(self, client):
-        """Test get_favourite_filters returns list."""
-        filters = client.get_favourite_filters()
-        assert isinstance(filters, list)
-        # Should have at least one favourite filter
-        favourite_count = sum(1 for f in filters if f.get("favourite"))
-        assert favourite_count >= 0
-
     def test_create_filter_with_jql(self, client):
         """Test creating a filter with specific JQL."""
         new_filter = client.create_filter(
@@ -341,14 +353,6 @@ class TestSearchMixin:
         result = client.set_filter_favourite("10000", favourite=False)
         assert result["favourite"] is False
 
-    def test_search_issues_with_fields(self, client):
-        """Test search with specific fields."""
-        results = client.search_issues(
-            "project = DEMO",
-            fields=["summary", "status"],
-        )
-        assert "issues" in results
-
     def test_search_issues_pagination(self, client):
         """Test search pagination."""
         results = client.search_issues(
@@ -359,26 +363,19 @@ class TestSearchMixin:
         assert results["startAt"] == 0
         assert results["maxResults"] == 10
 
-    def test_search_issues_by_status(self, client):
-        """Test search by status."""
-        results = client.search_issues("project = DEMO AND status = Open")
-        # Should return issues (may be empty if no Open issues in seed data)
-        assert "issues" in results
-
-    def test_search_issues_by_issue_type(self, client):
-        """Test search by issue type."""
-        results = client.search_issues("project = DEMO AND issuetype = Bug")
-        assert "issues" in results
-
-    def test_search_issues_by_assignee(self, client):
-        """Test search by assignee."""
-        results = client.search_issues("project = DEMO AND assignee = currentUser()")
-        assert "issues" in results
-
-    def test_search_issues_order_by(self, client):
-        """Test search with ORDER BY."""
-        results = client.search_issues("project = DEMO ORDER BY created DESC")
-        assert "issues" in results
+    @pytest.mark.parametrize(
+        "jql",
+        [
+            "project = DEMO AND status = Open",
+            "project = DEMO AND issuetype = Bug",
+            "project = DEMO AND assignee = currentUser()",
+            "project = DEMO ORDER BY created DESC",
+        ],
+    )
+    def test_search_issues_variants(self, client, jql):
+        """Test search by status, issue type, assignee and ORDER BY."""
+        # Open may match nothing in seed data; only the shape is checked
+        assert "issues" in client.search_issues(jql)
 
     def test_advanced_search(self, client):
         """Test advanced JQL search."""
@@ -395,16 +392,22 @@ class TestSearchMixin:
         )
         assert "expand" in results
 
-    def test_validate_jql(self, client):
+    def test_validate_jql(self, unseeded_client):
         """Test JQL validation."""
-        result = client.validate_jql("project = DEMO")
-        assert isinstance(result, dict)
+        result = unseeded_client.validate_jql("project = DEMO")
+        assert result == {
+            "valid": True,
+            "errors": [],
+            "warnings": [],
+            "jql": "project = DEMO",
+        }
 
-    def test_validate_jql_invalid(self, client):
+    def test_validate_jql_invalid(self, unseeded_client):
         """Test JQL validation with invalid query."""
-        result = client.validate_jql("invalid query ===")
-        # Should return validation result (may include errors/warnings)
-        assert isinstance(result, dict)
+        result = unseeded_client.validate_jql("invalid query ===")
+        assert result["valid"] is False
+        assert result["errors"] == ["Invalid operator: ==="]
+        assert result["warnings"] == ["Unknown field: query"]
 
     def test_get_filter(self, client):
         """Test getting a filter."""
@@ -415,12 +418,14 @@ class TestSearchMixin:
     def test_get_my_filters(self, client):
         """Test getting current user's filters."""
         filters = client.get_my_filters()
-        assert isinstance(filters, list)
+        assert [f["id"] for f in filters] == ["10000", "10001"]
+        assert {f["owner"]["accountId"] for f in filters} == {"abc123"}
 
     def test_get_favourite_filters(self, client):
         """Test getting favourite filters."""
         filters = client.get_favourite_filters()
-        assert isinstance(filters, list)
+        assert [f["id"] for f in filters] == ["10000", "10002"]
+        assert all(f["favourite"] for f in filters)
 
     def test_create_filter(self, client):
         """Test creating a filter."""
@@ -440,18 +445,35 @@ class TestSearchMixin:
         assert updated["name"] == "Updated Filter Name"
 
     def test_delete_filter(self, client):
-        """Test deleting a filter."""
-        # Use an existing filter ID that we know exists
-        # Delete may fail if filter doesn't exist in mock, just verify no crash
-        try:
+        """Test deleting a filter removes it."""
+        client.delete_filter("10001")
+        with pytest.raises(NotFoundError):
+            client.get_filter("10001")
+        with pytest.raises(NotFoundError):
             client.delete_filter("10001")
-        except Exception:
-            pass  # Expected if filter management differs
+
+    def test_filter_changes_persist(self, client):
+        """Test filter writes are visible to later reads."""
+        new_filter = client.create_filter(name="Persisted", jql="project = DEMO")
+        assert new_filter["id"] == "10003"
+        assert client.get_filter("10003")["name"] == "Persisted"
+
+        client.update_filter("10000", jql="project = DEMOSD")
+        assert client.get_filter("10000")["jql"] == "project = DEMOSD"
+
+        client.set_filter_favourite("10001", favourite=True)
+        favourites = [f["id"] for f in client.get_favourite_filters()]
+        assert favourites == ["10000", "10001", "10002"]
+
+    def test_filter_state_is_per_client(self, client, unseeded_client):
+        """Test filter writes do not leak into other clients."""
+        client.update_filter("10000", name="Renamed")
+        assert unseeded_client.get_filter("10000")["name"] == "My Open Issues"
 
     def test_search_filters(self, client):
         """Test searching filters."""
         result = client.search_filters(filter_name="Bug")
-        assert "values" in result or isinstance(result, list)
+        assert [f["name"] for f in result["values"]] == ["All Bugs"]
 
     def test_set_filter_favourite(self, client):
         """Test setting filter as favourite."""
@@ -460,10 +482,9 @@ class TestSearchMixin:
 
     def test_search_issues_by_keys(self, client):
         """Test searching by specific issue keys."""
-        results = client.search_issues_by_keys(["DEMO-84", "DEMO-85"])
-        # Returns list directly, not paginated
-        assert isinstance(results, list)
-        assert len(results) >= 1
+        results = client.search_issues_by_keys(["DEMO-85", "NONEXISTENT-1", "DEMO-84"])
+        # Returns list directly, not paginated, in request order
+        assert [i["key"] for i in results] == ["DEMO-85", "DEMO-84"]
 
     def test_count_issues(self, client):
         """Test counting issues matching JQL."""
@@ -474,54 +495,38 @@ class TestSearchMixin:
     def test_export_search_results(self, client):
         """Test exporting search results."""
         results = client.export_search_results("project = DEMO")
-        assert "data" in results or isinstance(results, list)
+        assert results["format"] == "json"
+        assert len(results["data"]) == client.count_issues("project = DEMO")
 
 
 class TestRelationshipsMixin:
     """Tests for RelationshipsMixin functionality."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_get_issue_link_types(self, client):
+    def test_get_issue_link_types(self, unseeded_client):
         """Test getting issue link types."""
-        link_types = client.get_issue_link_types()
+        link_types = unseeded_client.get_issue_link_types()
         assert "issueLinkTypes" in link_types
         assert len(link_types["issueLinkTypes"]) > 0
 
-    def test_create_issue_link(self, client):
-        """Test creating issue link."""
-        # Link DEMO-84 to DEMO-85
-        client.create_issue_link(
-            link_type="Relates",
-            inward_issue="DEMO-84",
-            outward_issue="DEMO-85",
-        )
-        # Just verify the call succeeds
-        # Links may be stored differently in the mock
-
-    def test_delete_issue_link(self, client):
-        """Test deleting issue link."""
-        # Create a link first
+    def test_issue_link_lifecycle(self, client):
+        """Test creating and deleting an issue link."""
         client.create_issue_link(
             link_type="Relates",
             inward_issue="DEMO-84",
             outward_issue="DEMO-85",
         )
+        links = client.get_issue_links("DEMO-84")
+        assert len(links) == 1
 
-        # Get the link ID
-        issue = client.get_issue("DEMO-84")
-        links = issue["fields"].get("issuelinks", [])
-        if links:
-            link_id = links[0]["id"]
-            client.delete_issue_link(link_id)
+        client.delete_issue_link(links[0]["id"])
+        assert client.get_issue_links("DEMO-84") == []
 
     def test_get_remote_links(self, client):
         """Test getting remote links."""
         links = client.get_remote_links("DEMO-84")
-        assert isinstance(links, list)
+        assert len(links) == 1
+        assert links[0]["self"].endswith("/issue/DEMO-84/remotelink/10000")
+        assert links[0]["object"].keys() >= {"url", "title"}
 
     def test_create_remote_link(self, client):
         """Test creating remote link."""
@@ -536,46 +541,25 @@ class TestRelationshipsMixin:
 class TestCollaborateMixin:
     """Tests for CollaborateMixin functionality."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_add_comment(self, client):
-        """Test adding comment to issue."""
-        comment = client.add_comment("DEMO-84", "Test comment")
+    def test_comment_lifecycle(self, client):
+        """Test adding, reading, updating and deleting a comment."""
+        comment = client.add_comment("DEMO-84", text_to_adf("Test comment"))
         assert "id" in comment
-        assert "Test comment" in str(comment.get("body", ""))
-
-    def test_get_comments(self, client):
-        """Test getting comments for issue."""
-        # Add a comment first
-        client.add_comment("DEMO-84", "Test comment for get")
+        assert adf_to_text(comment["body"]) == "Test comment"
 
         comments = client.get_comments("DEMO-84")
-        assert "comments" in comments
-        assert len(comments["comments"]) >= 1
-
-    def test_update_comment(self, client):
-        """Test updating a comment."""
-        # Add a comment first
-        comment = client.add_comment("DEMO-84", "Original comment")
+        assert comment["id"] in [c["id"] for c in comments["comments"]]
 
-        # Update it
         updated = client.update_comment(
             issue_key="DEMO-84",
             comment_id=comment["id"],
-            body="Updated comment",
+            body=text_to_adf("Updated comment"),
         )
-        assert "Updated comment" in str(updated.get("body", ""))
+        assert adf_to_text(updated["body"]) == "Updated comment"
 
-    def test_delete_comment(self, client):
-        """Test deleting a comment."""
-        # Add a comment first
-        comment = client.add_comment("DEMO-84", "To delete")
-
-        # Delete it
         client.delete_comment("DEMO-84", comment["id"])
+        comments = client.get_comments("DEMO-84")
+        assert comment["id"] not in [c["id"] for c in comments["comments"]]
 
     def test_get_watchers(self, client):
         """Test getting watchers for issue."""
@@ -583,66 +567,69 @@ class TestCollaborateMixin:
         assert "watchCount" in watchers
 
     def test_add_watcher(self, client):
-        """Test adding watcher to issue."""
-        client.add_watcher("DEMO-84", "abc123")
+        """Test adding watchers to issue, ignoring duplicates."""
+        client.add_watcher("DEMO-84", "def456")
+        client.add_watcher("DEMO-84", "xyz789")
+        client.add_watcher("DEMO-84", "def456")
         watchers = client.get_watchers("DEMO-84")
-        assert watchers["watchCount"] >= 1
+        assert watchers["watchCount"] == 2
+        assert [w["accountId"] for w in watchers["watchers"]] == ["def456", "xyz789"]
+        assert watchers["watchers"][1]["displayName"] == "Unknown User"
 
     def test_remove_watcher(self, client):
         """Test removing watcher from issue."""
-        # Add a watcher first
-        client.add_watcher("DEMO-84", "abc123")
+        client.add_watcher("DEMO-84", "def456")
+        client.add_watcher("DEMO-84", "xyz789")
 
-        # Remove them
-        client.remove_watcher("DEMO-84", "abc123")
+        client.remove_watcher("DEMO-84", "def456")
+        client.remove_watcher("DEMO-84", "not-watching")
+        watchers = client.get_watchers("DEMO-84")
+        assert [w["accountId"] for w in watchers["watchers"]] == ["xyz789"]
 
 
 class TestAgileMixin:
     """Tests for AgileMixin functionality."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
-    def test_get_boards(self, client):
-        """Test getting agile boards."""
+    def test_get_board(self, client):
+        """Test listing boards and fetching one by ID."""
         boards = client.get_boards()
-        assert "values" in boards
+        assert len(boards["values"]) > 0
 
-    def test_get_board(self, client):
-        """Test getting specific board."""
-        # Board 1 exists in seed data
-        board = client.get_board(1)
-        assert "id" in board
+        board = client.get_board(boards["values"][0]["id"])
+        assert board["id"] == boards["values"][0]["id"]
         assert "name" in board
 
-    def test_get_sprints(self, client):
-        """Test getting sprints for board."""
-        sprints = client.get_sprints(1)
-        assert "values" in sprints
-
-    def test_get_backlog_issues(self, client):
-        """Test getting backlog issues."""
-        issues = client.get_backlog_issues(1)
-        assert "issues" in issues
+    @pytest.mark.parametrize(
+        "method,args,key",
+        [
+            ("get_sprints", (1,), "values"),
+            ("get_backlog_issues", (1,), "issues"),
+        ],
+        ids=["sprints", "backlog"],
+    )
+    def test_board_list_endpoints(self, client, method, args, key):
+        """Test board-scoped list endpoints return their list key."""
+        assert key in getattr(client, method)(*args)
 
 
 class TestAdminMixin:
     """Tests for AdminMixin functionality."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
-    def test_get_all_projects(self, client):
-        """Test getting all projects."""
+    def test_get_project(self, client):
+        """Test listing projects and fetching one by key."""
         projects = client.get_all_projects()
-        assert len(projects) > 0
+        assert "DEMO" in [p["key"] for p in projects]
 
-    def test_get_project(self, client):
-        """Test getting specific project."""
         project = client.get_project("DEMO")
         assert project["key"] == "DEMO"
 
@@ -674,67 +661,62 @@ class TestFieldsMixin:
     """Tests for FieldsMixin functionality."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
-    def test_get_fields(self, client):
-        """Test getting all fields."""
+    def test_get_field(self, client):
+        """Test listing fields and fetching one by ID."""
         fields = client.get_fields()
         assert len(fields) > 0
 
-    def test_get_field(self, client):
-        """Test getting specific field."""
-        fields = client.get_fields()
-        if fields:
-            field_id = fields[0]["id"]
-            field = client.get_field(field_id)
-            assert "id" in field
+        field = client.get_field(fields[0]["id"])
+        assert field["id"] == fields[0]["id"]
 
 
 class TestJSMMixin:
     """Tests for JSMMixin functionality."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_get_service_desks(self, client):
-        """Test getting service desks."""
-        desks = client.get_service_desks()
-        assert "values" in desks
-
-    def test_get_request_types(self, client):
-        """Test getting request types for service desk."""
-        types = client.get_request_types(1)
-        assert "values" in types
-
-    def test_get_customers(self, client):
-        """Test getting customers for service desk."""
-        customers = client.get_customers(1)
-        assert "values" in customers
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_service_desks", ()),
+            ("get_request_types", (1,)),
+            ("get_customers", (1,)),
+        ],
+        ids=["service_desks", "request_types", "customers"],
+    )
+    def test_list_endpoints(self, client, method, args):
+        """Test JSM list endpoints return paginated values."""
+        assert "values" in getattr(client, method)(*args)
 
 
 class TestDevMixin:
     """Tests for DevMixin functionality."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
     def test_get_development_status(self, client):
         """Test getting development status for issue."""
-        # This may return empty or mock data
         status = client.get_development_status("DEMO-84")
-        assert isinstance(status, dict)
+        assert status["issueKey"] == "DEMO-84"
+        assert status["hasDevInfo"] is True
+        prs = status["openPRs"] + status["mergedPRs"] + status["declinedPRs"]
+        assert prs == status["pullRequests"]
 
     def test_generate_branch_name(self, client):
         """Test generating branch name for issue."""
         branch = client.generate_branch_name("DEMO-84")
-        # Branch name may be lowercase
-        assert "demo-84" in branch.lower()
+        # Issue key is lowercased in the branch name
+        assert branch.startswith("feature/demo-84-")
 
     def test_generate_commit_message(self, client):
         """Test generating commit message for issue."""
@@ -745,11 +727,6 @@ class TestDevMixin:
 class TestMockJiraClientBase:
     """Tests for MockJiraClientBase core functionality."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
     def test_get_issue_basic(self, client):
         """Test getting an issue by key."""
         issue = client.get_issue("DEMO-84")
@@ -757,6 +734,14 @@ class TestMockJiraClientBase:
         assert "fields" in issue
         assert issue["fields"]["summary"] == "Product Launch"
 
+    def test_getters_return_stored_objects(self, client):
+        """Test read paths hand back stored objects without copying them."""
+        assert client.get_issue("DEMO-84") is client.get_issue("DEMO-84")
+        comment = client.add_comment("DEMO-84", {"type": "doc", "content": []})
+        assert client.get_comment("DEMO-84", comment["id"]) is comment
+        worklog = client.add_worklog("DEMO-84", time_spent="1h")
+        assert client.get_worklogs("DEMO-84")["worklogs"][-1] is worklog
+
     def test_get_issue_with_fields_parameter(self, client):
         """Test get_issue with fields parameter (for API parity)."""
         issue = client.get_issue("DEMO-84", fields="summary,status")
@@ -787,6 +772,7 @@ class TestMockJiraClientBase:
         assert "key" in result
         assert "id" in result
         assert result["key"].startswith("DEMO-")
+        assert result["fields"] == client.get_issue(result["key"])["fields"]
 
     def test_create_issue_with_priority(self, client):
         """Test creating an issue with priority."""
@@ -798,9 +784,7 @@ class TestMockJiraClientBase:
         }
         result = client.create_issue(fields)
         assert "key" in result
-        # Verify the created issue
-        issue = client.get_issue(result["key"])
-        assert issue["fields"]["priority"]["name"] == "High"
+        assert result["fields"]["priority"]["name"] == "High"
 
     def test_create_issue_with_labels(self, client):
         """Test creating an issue with labels."""
@@ -810,8 +794,7 @@ class TestMockJiraClientBase:
             "issuetype": {"name": "Task"},
             "labels": ["automated", "test"],
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         assert "automated" in issue["fields"]["labels"]
         assert "test" in issue["fields"]["labels"]
 
@@ -901,6 +884,17 @@ class TestMockJiraClientBase:
         issue = client.get_issue("DEMO-87")
         assert issue["fields"]["assignee"] is None
 
+    def test_seed_data_not_shared_between_clients(self, client):
+        """Test changes on one client don't leak into newly created clients."""
+        client.update_issue("DEMO-84", fields={"summary": "Changed"})
+        client.get_issue("DEMO-84")["fields"]["labels"].append("changed")
+        client.transition_issue("DEMO-84", "31")
+
+        fresh = MockJiraClient().get_issue("DEMO-84")
+        assert fresh["fields"]["summary"] == "Product Launch"
+        assert fresh["fields"]["labels"] == ["demo"]
+        assert fresh["fields"]["status"]["name"] == "To Do"
+
     def test_context_manager(self, client):
         """Test client works as context manager."""
         with MockJiraClient() as c:
@@ -1044,25 +1038,42 @@ class TestMockJiraClientBase:
         user = client.get_user(username="Jason")
         assert user["displayName"] == "Jason Krueger"
 
-    def test_generic_get_method(self, client):
-        """Test generic GET method returns empty dict."""
-        result = client.get("/rest/api/3/unknown")
-        assert result == {}
-
-    def test_generic_post_method(self, client):
-        """Test generic POST method returns empty dict."""
-        result = client.post("/rest/api/3/unknown", data={"test": "data"})
-        assert result == {}
-
-    def test_generic_put_method(self, client):
-        """Test generic PUT method returns empty dict."""
-        result = client.put("/rest/api/3/unknown", data={"test": "data"})
-        assert result == {}
-
-    def test_generic_delete_method(self, client):
-        """Test generic DELETE method is no-op."""
-        # Should not raise
-        client.delete("/rest/api/3/unknown")
+    @pytest.mark.parametrize(
+        "method,kwargs,expected",
+        [
+            ("get", {}, {}),
+            (
+                "get",
+                {
+                    "params": {"key": "value"},
+                    "operation": "test operation",
+                    "headers": {"X-Custom": "header"},
+                },
+                {},
+            ),
+            ("post", {"data": {"test": "data"}}, {}),
+            (
+                "post",
+                {
+                    "data": {"key": "value"},
+                    "operation": "test create",
+                    "headers": {"X-Custom": "header"},
+                },
+                {},
+            ),
+            ("put", {"data": {"test": "data"}}, {}),
+            ("delete", {}, None),
+            (
+                "delete",
+                {"params": {"key": "value"}, "operation": "test delete"},
+                None,
+            ),
+        ],
+    )
+    def test_generic_http_methods(self, client, method, kwargs, expected):
+        """Test generic HTTP methods return plain objects for unmocked endpoints."""
+        result = getattr(client, method)("/rest/api/3/unknown", **kwargs)
+        assert result == expected
 
     def test_close_method(self, client):
         """Test close method is no-op."""
@@ -1123,13 +1134,11 @@ class TestMockJiraClientBase:
         with pytest.raises(NotFoundError):
             client.get_project_components("NONEXISTENT")
 
-    def test_get_comment(self, client):
+    def test_get_comment(self, issue_with_comment):
         """Test getting a specific comment."""
-        # Add a comment first
-        comment = client.add_comment("DEMO-84", {"type": "doc", "content": []})
-        # Get it
-        fetched = client.get_comment("DEMO-84", comment["id"])
-        assert fetched["id"] == comment["id"]
+        client, comment_id = issue_with_comment
+        fetched = client.get_comment("DEMO-84", comment_id)
+        assert fetched["id"] == comment_id
 
     def test_get_comment_not_found(self, client):
         """Test getting non-existent comment raises error."""
@@ -1194,13 +1203,11 @@ class TestMockJiraClientBase:
         # DEMOSD has no versions configured in mock
         assert versions == []
 
-    def test_update_comment(self, client):
+    def test_update_comment(self, issue_with_comment):
         """Test updating a comment."""
-        # Add a comment first
-        comment = client.add_comment("DEMO-84", {"type": "doc", "content": []})
-        # Update it
+        client, comment_id = issue_with_comment
         new_body = {"type": "doc", "content": [{"type": "paragraph"}]}
-        updated = client.update_comment("DEMO-84", comment["id"], new_body)
+        updated = client.update_comment("DEMO-84", comment_id, new_body)
         assert updated["body"] == new_body
 
     def test_update_comment_not_found(self, client):
@@ -1240,6 +1247,16 @@ class TestMockJiraClientBase:
         assert client.timeout == 60
         assert client.max_retries == 5
 
+    def test_init_without_seed(self, unseeded_client):
+        """Test seed=False gives an empty issue store."""
+        assert unseeded_client.search_issues("project = DEMO")["total"] == 0
+        with pytest.raises(NotFoundError):
+            unseeded_client.get_issue("DEMO-84")
+        created = unseeded_client.create_issue(
+            {"project": {"key": "DEMO"}, "summary": "First issue"}
+        )
+        assert unseeded_client.get_issue(created["key"])["key"] == created["key"]
+
     def test_search_issues_by_jason_assignee(self, client):
         """Test searching issues by Jason assignee."""
         results = client.search_issues("project = DEMO AND assignee = Jason")
@@ -1273,14 +1290,12 @@ class TestMockJiraClientBase:
             if assignee:
                 assert "jane" in assignee.get("displayName", "").lower()
 
-    def test_delete_comment(self, client):
+    def test_delete_comment(self, issue_with_comment):
         """Test deleting a comment."""
-        # Add a comment first
-        comment = client.add_comment("DEMO-84", {"type": "doc", "content": []})
-        # Delete it
-        client.delete_comment("DEMO-84", comment["id"])
+        client, comment_id = issue_with_comment
+        client.delete_comment("DEMO-84", comment_id)
         # Should not raise when deleting again (no-op)
-        client.delete_comment("DEMO-84", comment["id"])
+        client.delete_comment("DEMO-84", comment_id)
 
     def test_add_comment_creates_list(self, client):
         """Test adding first comment creates comment list."""
@@ -1321,8 +1336,7 @@ class TestMockJiraClientBase:
     def test_create_issue_default_type(self, client):
         """Test creating issue uses default type when not specified."""
         fields = {"project": {"key": "DEMO"}, "summary": "Default type issue"}
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         assert issue["fields"]["issuetype"]["name"] == "Task"
 
     def test_create_issue_default_priority(self, client):
@@ -1332,8 +1346,7 @@ class TestMockJiraClientBase:
             "summary": "Default priority issue",
             "issuetype": {"name": "Bug"},
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         assert issue["fields"]["priority"]["name"] == "Medium"
 
     def test_create_issue_with_string_issuetype(self, client):
@@ -1343,8 +1356,7 @@ class TestMockJiraClientBase:
             "summary": "String type issue",
             "issuetype": "Bug",  # Not a dict
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         # Should use default Task when issuetype is not a dict
         assert issue["fields"]["issuetype"]["name"] == "Task"
 
@@ -1355,8 +1367,7 @@ class TestMockJiraClientBase:
             "summary": "String priority issue",
             "priority": "High",  # Not a dict
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         # Should use default Medium when priority is not a dict
         assert issue["fields"]["priority"]["name"] == "Medium"
 
@@ -1525,50 +1536,27 @@ class TestMockJiraClientBase:
         with pytest.raises(NotFoundError):
             client.get_issue(result["key"])
 
-    def test_search_issues_with_fields_list(self, client):
-        """Test search with specific fields list."""
-        results = client.search_issues(
-            "project = DEMO",
-            fields=["summary", "status", "assignee"],
-        )
-        assert "issues" in results
-        assert len(results["issues"]) >= 1
-
     def test_get_user_with_key(self, client):
         """Test get_user with key parameter raises NotFoundError."""
         # Key lookup is not supported in mock, raises NotFoundError
         with pytest.raises(NotFoundError):
             client.get_user(key="abc123")
 
-    def test_get_worklogs_not_found(self, client):
-        """Test getting worklogs for non-existent issue."""
-        with pytest.raises(NotFoundError):
-            client.get_worklogs("NONEXISTENT-999")
-
-    def test_add_worklog_not_found(self, client):
-        """Test adding worklog to non-existent issue."""
-        with pytest.raises(NotFoundError):
-            client.add_worklog("NONEXISTENT-999", time_spent="1h")
-
-    def test_add_comment_not_found(self, client):
-        """Test adding comment to non-existent issue."""
-        with pytest.raises(NotFoundError):
-            client.add_comment("NONEXISTENT-999", {"type": "doc"})
-
-    def test_get_comments_not_found(self, client):
-        """Test getting comments for non-existent issue."""
+    @pytest.mark.parametrize(
+        "method_name,args",
+        [
+            ("get_worklogs", ()),
+            ("add_worklog", ("1h",)),
+            ("add_comment", ({"type": "doc"},)),
+            ("get_comments", ()),
+            ("delete_comment", ("123",)),
+            ("assign_issue", ("abc123",)),
+        ],
+    )
+    def test_issue_operation_not_found(self, client, method_name, args):
+        """Test issue-scoped operations on a non-existent issue raise NotFoundError."""
         with pytest.raises(NotFoundError):
-            client.get_comments("NONEXISTENT-999")
-
-    def test_delete_comment_not_found_issue(self, client):
-        """Test deleting comment from non-existent issue."""
-        with pytest.raises(NotFoundError):
-            client.delete_comment("NONEXISTENT-999", "123")
-
-    def test_assign_issue_not_found(self, client):
-        """Test assigning non-existent issue."""
-        with pytest.raises(NotFoundError):
-            client.assign_issue("NONEXISTENT-999", "abc123")
+            getattr(client, method_name)("NONEXISTENT-999", *args)
 
     def test_create_issue_with_description(self, client):
         """Test creating issue with description."""
@@ -1577,8 +1565,7 @@ class TestMockJiraClientBase:
             "summary": "Issue with description",
             "description": {"type": "doc", "content": []},
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         assert issue["fields"]["description"] is not None
 
     def test_create_issue_with_assignee(self, client):
@@ -1588,38 +1575,9 @@ class TestMockJiraClientBase:
             "summary": "Issue with assignee",
             "assignee": {"accountId": "abc123"},
         }
-        result = client.create_issue(fields)
-        issue = client.get_issue(result["key"])
+        issue = client.create_issue(fields)
         assert issue["fields"]["assignee"]["accountId"] == "abc123"
 
-    def test_generic_get_with_params(self, client):
-        """Test generic GET with parameters."""
-        result = client.get(
-            "/rest/api/3/test",
-            params={"key": "value"},
-            operation="test operation",
-            headers={"X-Custom": "header"},
-        )
-        assert result == {}
-
-    def test_generic_post_with_all_params(self, client):
-        """Test generic POST with all parameters."""
-        result = client.post(
-            "/rest/api/3/test",
-            data={"key": "value"},
-            operation="test create",
-            headers={"X-Custom": "header"},
-        )
-        assert result == {}
-
-    def test_generic_delete_with_params(self, client):
-        """Test generic DELETE with parameters."""
-        client.delete(
-            "/rest/api/3/test",
-            params={"key": "value"},
-            operation="test delete",
-        )  # Should not raise
-
     def test_search_issues_order_by_key(self, client):
         """Test search with ORDER BY key."""
         results = client.search_issues("project = DEMO ORDER BY key ASC")
@@ -1704,17 +1662,8 @@ class TestMockJiraClientBase:
     def test_search_filters_returns_list(self, client):
         """Test searching filters returns appropriate structure."""
         result = client.search_filters()
-        assert "values" in result or isinstance(result, list)
-
-    def test_get_my_filters_returns_list(self, client):
-        """Test get_my_filters returns a list."""
-        filters = client.get_my_filters()
-        assert isinstance(filters, list)
-
-    def test_validate_jql_returns_dict(self, client):
-        """Test validate_jql returns a dict."""
-        result = client.validate_jql("project = DEMO")
-        assert isinstance(result, dict)
+        assert isinstance(result["values"], list)
+        assert result["total"] == len(result["values"])
 
     def test_count_issues_returns_int(self, client):
         """Test count_issues returns an integer."""
@@ -1737,11 +1686,6 @@ class TestMockJiraClientBase:
 class TestCollaborateMixinExtended:
     """Extended tests for CollaborateMixin."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
     def test_get_attachments(self, client):
         """Test getting attachments for an issue."""
         attachments = client.get_attachments("DEMO-84")
@@ -1764,11 +1708,6 @@ class TestCollaborateMixinExtended:
 class TestAgileMixinExtended:
     """Extended tests for AgileMixin."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
     def test_get_all_boards(self, client):
         """Test getting all boards."""
         boards = client.get_all_boards()
@@ -1802,14 +1741,9 @@ class TestAgileMixinExtended:
 class TestRelationshipsMixinExtended:
     """Extended tests for RelationshipsMixin."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_get_issue_link_types(self, client):
+    def test_get_issue_link_types(self, unseeded_client):
         """Test getting issue link types."""
-        result = client.get_issue_link_types()
+        result = unseeded_client.get_issue_link_types()
         assert "issueLinkTypes" in result
 
     def test_get_link_types(self, client):
@@ -1888,15 +1822,11 @@ class TestRelationshipsMixinExtended:
 class TestTimeMixinExtended:
     """Extended tests for TimeMixin."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
-
-    def test_get_worklogs(self, client):
+    def test_get_worklogs(self, issue_with_worklog):
         """Test getting worklogs for an issue."""
+        client, worklog_id = issue_with_worklog
         result = client.get_worklogs("DEMO-84")
-        assert "worklogs" in result
+        assert [w["id"] for w in result["worklogs"]] == [worklog_id]
 
     def test_add_worklog(self, client):
         """Test adding a worklog."""
@@ -1908,33 +1838,32 @@ class TestTimeMixinExtended:
         result = client.add_worklog("DEMO-84", "1h 30m", comment="Working on task")
         assert "id" in result
 
-    def test_update_worklog(self, client):
+    def test_update_worklog(self, issue_with_worklog):
         """Test updating a worklog."""
-        # First add a worklog
-        worklog = client.add_worklog("DEMO-84", "2h")
-        result = client.update_worklog("DEMO-84", worklog["id"], "3h")
-        assert result is not None
+        client, worklog_id = issue_with_worklog
+        result = client.update_worklog("DEMO-84", worklog_id, "3h")
+        assert result["timeSpent"] == "3h"
 
-    def test_delete_worklog(self, client):
+    def test_delete_worklog(self, issue_with_worklog):
         """Test deleting a worklog."""
-        worklog = client.add_worklog("DEMO-84", "1h")
-        # Should not raise
-        client.delete_worklog("DEMO-84", worklog["id"])
+        client, worklog_id = issue_with_worklog
+        client.delete_worklog("DEMO-84", worklog_id)
+        assert client.get_worklogs("DEMO-84")["worklogs"] == []
 
-    def test_get_worklog(self, client):
+    def test_get_worklog(self, issue_with_worklog):
         """Test getting a specific worklog."""
-        worklog = client.add_worklog("DEMO-84", "2h")
-        result = client.get_worklog("DEMO-84", worklog["id"])
-        assert "id" in result
+        client, worklog_id = issue_with_worklog
+        result = client.get_worklog("DEMO-84", worklog_id)
+        assert result["id"] == worklog_id
 
 
 class TestDevMixinExtended:
     """Extended tests for DevMixin."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
     def test_get_branches(self, client):
         """Test getting branches for an issue."""
@@ -1961,9 +1890,9 @@ class TestFieldsMixinExtended:
     """Extended tests for FieldsMixin."""
 
     @pytest.fixture
-    def client(self):
-        """Create a fresh mock client."""
-        return MockJiraClient()
+    def client(self, _base_client):
+        """Shared mock client without snapshotting; this class only reads."""
+        return _base_client
 
     def test_get_fields(self, client):
         """Test getting all fields."""
@@ -1,9 +1,19 @@
 """Tests for the JIRA credential manager."""
 
+import json
+import re
+from collections.abc import Mapping
+from datetime import timedelta
+from functools import partial
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from assistant_skills_lib import CredentialBackend
+from assistant_skills_lib import CredentialNotFoundError as BaseCredentialNotFoundError
 
+import jira_as.credential_manager as cm
 from jira_as.credential_manager import (
     CredentialManager,
     CredentialNotFoundError,
@@ -13,32 +23,99 @@ from jira_as.credential_manager import (
     store_credentials,
     validate_credentials,
 )
+from jira_as.error_handler import AuthenticationError, JiraError, ValidationError
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+RE_INVALID_CREDENTIALS = re.compile("Invalid credentials")
+RE_ACCESS_FORBIDDEN = re.compile("Access forbidden")
+RE_CANNOT_CONNECT = re.compile("Cannot connect")
+RE_TIMED_OUT = re.compile("timed out")
+RE_STATUS_500 = re.compile("Connection failed with status 500")
+RE_EMPTY_TOKEN = re.compile("API token cannot be empty")
+
+# Payload returned by /rest/api/3/myself for a successful validation
+MYSELF_RESPONSE = MappingProxyType({"accountId": "abc123", "displayName": "Test User"})
+
+
+def make_response(status_code, body=None):
+    """Build a real requests.Response with the given status and JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    if body is None or isinstance(body, Mapping):
+        body = dict(body or {})
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def respond(status_code, body, *request_args, **request_kwargs):
+    """requests.get stand-in: ignore the request and return make_response()."""
+    return make_response(status_code, body)
+
+
+def responder(status_code, body=None):
+    """Build a requests.get side_effect that answers with the given response."""
+    return partial(respond, status_code, body)
+
+
+@pytest.fixture(scope="session")
+def manager(tmp_path_factory):
+    """Shared CredentialManager pointed at a scratch .claude directory.
+
+    Session scope means one manager per xdist worker, and tmp_path_factory
+    gives each worker its own directory, so no test can reach the real
+    settings.local.json or race another worker's.
+    """
+    manager = CredentialManager()
+    manager._claude_dir = tmp_path_factory.mktemp(".claude")
+    return manager
+
+
+@pytest.fixture(scope="session")
+def creds():
+    """Read-only credentials dict as passed to validate_credentials."""
+    return MappingProxyType(
+        {
+            "site_url": "https://test.atlassian.net",
+            "email": "test@example.com",
+            "api_token": "test-token",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def creds_tuple(creds):
+    """The same credentials as a (url, email, api_token) tuple."""
+    return creds["site_url"], creds["email"], creds["api_token"]
+
+
+@pytest.fixture
+def fake_requests_get(monkeypatch):
+    """Replace requests.get with a MagicMock for the duration of a test."""
+    mock_get = MagicMock()
+    monkeypatch.setattr("requests.get", mock_get)
+    return mock_get
 
 
 class TestCredentialManager:
     """Tests for CredentialManager class."""
 
-    def test_get_service_name(self):
+    def test_get_service_name(self, manager):
         """Test service name is jira-assistant."""
-        manager = CredentialManager()
         assert manager.get_service_name() == "jira-assistant"
 
-    def test_get_env_prefix(self):
+    def test_get_env_prefix(self, manager):
         """Test environment prefix is JIRA."""
-        manager = CredentialManager()
         assert manager.get_env_prefix() == "JIRA"
 
-    def test_get_credential_fields(self):
+    def test_get_credential_fields(self, manager):
         """Test credential fields list."""
-        manager = CredentialManager()
         fields = manager.get_credential_fields()
         assert "site_url" in fields
         assert "email" in fields
         assert "api_token" in fields
 
-    def test_get_credential_not_found_hint(self):
+    def test_get_credential_not_found_hint(self, manager):
         """Test hint text includes setup instructions."""
-        manager = CredentialManager()
         hint = manager.get_credential_not_found_hint()
         assert "JIRA_API_TOKEN" in hint
         assert "JIRA_EMAIL" in hint
@@ -62,133 +139,115 @@ class TestCredentialNotFoundError:
 class TestValidateCredentials:
     """Tests for credential validation."""
 
-    @patch("requests.get")
-    def test_validate_success(self, mock_get):
-        """Test successful validation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "accountId": "abc123",
-            "displayName": "Test User",
-        }
-        mock_get.return_value = mock_response
-
-        manager = CredentialManager()
-        result = manager.validate_credentials(
-            {
-                "site_url": "https://test.atlassian.net",
-                "email": "test@example.com",
-                "api_token": "test-token",
-            }
+    @pytest.fixture(autouse=True)
+    def _clear_validation_cache(self, manager):
+        """Start each test without cached validation results."""
+        manager.clear_validation_cache()
+
+    def test_validate_success(self, fake_requests_get, manager, creds):
+        """Test successful validation calls /myself with basic auth."""
+        fake_requests_get.side_effect = responder(200, MYSELF_RESPONSE)
+
+        assert manager.validate_credentials(creds) == MYSELF_RESPONSE
+        fake_requests_get.assert_called_once_with(
+            "https://test.atlassian.net/rest/api/3/myself",
+            auth=(creds["email"], creds["api_token"]),
+            headers={"Accept": "application/json"},
+            timeout=10,
         )
 
-        assert result["accountId"] == "abc123"
-
-    @patch("requests.get")
-    def test_validate_401_unauthorized(self, mock_get):
-        """Test validation with 401 response."""
-        from jira_as.error_handler import AuthenticationError
-
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
-
-        manager = CredentialManager()
-        with pytest.raises(AuthenticationError, match="Invalid credentials"):
-            manager.validate_credentials(
-                {
-                    "site_url": "https://test.atlassian.net",
-                    "email": "test@example.com",
-                    "api_token": "bad-token",
-                }
-            )
-
-    @patch("requests.get")
-    def test_validate_403_forbidden(self, mock_get):
-        """Test validation with 403 response."""
-        from jira_as.error_handler import AuthenticationError
-
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_get.return_value = mock_response
-
-        manager = CredentialManager()
-        with pytest.raises(AuthenticationError, match="Access forbidden"):
-            manager.validate_credentials(
-                {
-                    "site_url": "https://test.atlassian.net",
-                    "email": "test@example.com",
-                    "api_token": "test-token",
-                }
-            )
-
-    @patch("requests.get")
-    def test_validate_connection_error(self, mock_get):
-        """Test validation with connection error."""
-        import requests
-
-        from jira_as.error_handler import JiraError
-
-        mock_get.side_effect = requests.exceptions.ConnectionError()
-
-        manager = CredentialManager()
-        with pytest.raises(JiraError, match="Cannot connect"):
-            manager.validate_credentials(
-                {
-                    "site_url": "https://test.atlassian.net",
-                    "email": "test@example.com",
-                    "api_token": "test-token",
-                }
-            )
-
-    @patch("requests.get")
-    def test_validate_timeout(self, mock_get):
-        """Test validation with timeout."""
-        import requests
-
-        from jira_as.error_handler import JiraError
-
-        mock_get.side_effect = requests.exceptions.Timeout()
-
-        manager = CredentialManager()
-        with pytest.raises(JiraError, match="timed out"):
-            manager.validate_credentials(
-                {
-                    "site_url": "https://test.atlassian.net",
-                    "email": "test@example.com",
-                    "api_token": "test-token",
-                }
-            )
+    @pytest.mark.parametrize(
+        "side_effect,exc,match",
+        [
+            (responder(401), AuthenticationError, RE_INVALID_CREDENTIALS),
+            (responder(403), AuthenticationError, RE_ACCESS_FORBIDDEN),
+            (responder(500), JiraError, RE_STATUS_500),
+            (requests.exceptions.ConnectionError(), JiraError, RE_CANNOT_CONNECT),
+            (requests.exceptions.Timeout(), JiraError, RE_TIMED_OUT),
+        ],
+        ids=[
+            "401_unauthorized",
+            "403_forbidden",
+            "500_server_error",
+            "connection_error",
+            "timeout",
+        ],
+    )
+    def test_validate_failure(
+        self, fake_requests_get, manager, creds, side_effect, exc, match
+    ):
+        """Test validation maps HTTP and transport failures to JIRA errors."""
+        fake_requests_get.side_effect = side_effect
+
+        with pytest.raises(exc, match=match):
+            manager.validate_credentials(creds)
+
+    def test_validate_success_is_cached(self, fake_requests_get, manager, creds):
+        """Test a repeat validation within the TTL skips the API call."""
+        fake_requests_get.side_effect = responder(200, MYSELF_RESPONSE)
+
+        first = manager.validate_credentials(creds)
+        first["accountId"] = "mutated"
+
+        assert manager.validate_credentials(creds) == MYSELF_RESPONSE
+        fake_requests_get.assert_called_once()
+
+    @pytest.mark.parametrize("body", [["not", "an", "object"], "ok"])
+    def test_validate_returns_non_object_body(
+        self, fake_requests_get, manager, creds, body
+    ):
+        """Test a non-object JSON body is returned as-is, fresh and cached."""
+        fake_requests_get.side_effect = responder(200, body)
+
+        assert manager.validate_credentials(creds) == body
+        assert manager.validate_credentials(creds) == body
+
+    def test_validate_cache_keyed_by_token(self, fake_requests_get, manager, creds):
+        """Test a different token is validated against the API again."""
+        fake_requests_get.side_effect = responder(200, MYSELF_RESPONSE)
+
+        manager.validate_credentials(creds)
+        manager.validate_credentials({**creds, "api_token": "other-token"})
+
+        assert fake_requests_get.call_count == 2
+
+    def test_validate_cache_expires(
+        self, fake_requests_get, manager, creds, monkeypatch
+    ):
+        """Test an expired cache entry is validated against the API again."""
+        monkeypatch.setattr(manager, "VALIDATION_CACHE_TTL", timedelta(0))
+        fake_requests_get.side_effect = responder(200, MYSELF_RESPONSE)
+
+        manager.validate_credentials(creds)
+        manager.validate_credentials(creds)
+
+        assert fake_requests_get.call_count == 2
+
+    def test_validate_failure_not_cached(self, fake_requests_get, manager, creds):
+        """Test a failed validation is retried rather than cached."""
+        fake_requests_get.side_effect = responder(401)
+        with pytest.raises(AuthenticationError):
+            manager.validate_credentials(creds)
+
+        fake_requests_get.side_effect = responder(200, MYSELF_RESPONSE)
+        assert manager.validate_credentials(creds) == MYSELF_RESPONSE
 
 
 class TestGetCredentialsTuple:
     """Tests for get_credentials_tuple method."""
 
     @patch.object(CredentialManager, "get_credentials")
-    def test_get_credentials_tuple_success(self, mock_get):
+    def test_get_credentials_tuple_success(self, mock_get, manager, creds, creds_tuple):
         """Test successful credential retrieval as tuple."""
-        mock_get.return_value = {
-            "site_url": "https://test.atlassian.net",
-            "email": "test@example.com",
-            "api_token": "test-token",
-        }
-
-        manager = CredentialManager()
-        url, email, token = manager.get_credentials_tuple()
+        mock_get.return_value = dict(creds)
 
-        assert url == "https://test.atlassian.net"
-        assert email == "test@example.com"
-        assert token == "test-token"
+        assert manager.get_credentials_tuple() == creds_tuple
 
     @patch.object(CredentialManager, "get_credentials")
-    def test_get_credentials_tuple_not_found(self, mock_get):
+    def test_get_credentials_tuple_not_found(self, mock_get, manager):
         """Test credential not found raises error."""
-        from assistant_skills_lib import CredentialNotFoundError as BaseError
+        mock_get.side_effect = BaseCredentialNotFoundError("jira-assistant")
 
-        mock_get.side_effect = BaseError("jira-assistant")
-
-        manager = CredentialManager()
         with pytest.raises(CredentialNotFoundError):
             manager.get_credentials_tuple()
 
@@ -197,44 +256,27 @@ class TestStoreCredentialsTuple:
     """Tests for store_credentials_tuple method."""
 
     @patch.object(CredentialManager, "store_credentials")
-    def test_store_credentials_tuple_success(self, mock_store):
+    def test_store_credentials_tuple_success(
+        self, mock_store, manager, creds, creds_tuple
+    ):
         """Test successful credential storage."""
-        from assistant_skills_lib import CredentialBackend
-
         mock_store.return_value = CredentialBackend.KEYCHAIN
 
-        manager = CredentialManager()
-        result = manager.store_credentials_tuple(
-            url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
+        result = manager.store_credentials_tuple(*creds_tuple)
 
         assert result == CredentialBackend.KEYCHAIN
-        mock_store.assert_called_once()
-
-    def test_store_credentials_tuple_empty_token(self):
-        """Test storing with empty token raises error."""
-        from jira_as.error_handler import ValidationError
-
-        manager = CredentialManager()
-        with pytest.raises(ValidationError, match="API token cannot be empty"):
+        mock_store.assert_called_once_with(dict(creds), None)
+
+    @pytest.mark.parametrize(
+        "api_token", ["", "   ", "\t", "\n"], ids=["empty", "spaces", "tab", "newline"]
+    )
+    def test_store_credentials_tuple_blank_token(self, manager, creds, api_token):
+        """Test storing with a blank token raises error."""
+        with pytest.raises(ValidationError, match=RE_EMPTY_TOKEN):
             manager.store_credentials_tuple(
-                url="https://test.atlassian.net",
-                email="test@example.com",
-                api_token="",
-            )
-
-    def test_store_credentials_tuple_whitespace_token(self):
-        """Test storing with whitespace token raises error."""
-        from jira_as.error_handler import ValidationError
-
-        manager = CredentialManager()
-        with pytest.raises(ValidationError, match="API token cannot be empty"):
-            manager.store_credentials_tuple(
-                url="https://test.atlassian.net",
-                email="test@example.com",
-                api_token="   ",
+                url=creds["site_url"],
+                email=creds["email"],
+                api_token=api_token,
             )
 
 
@@ -242,112 +284,64 @@ class TestValidateCredentialsTuple:
     """Tests for validate_credentials_tuple method."""
 
     @patch.object(CredentialManager, "validate_credentials")
-    def test_validate_credentials_tuple(self, mock_validate):
+    def test_validate_credentials_tuple(
+        self, mock_validate, manager, creds, creds_tuple
+    ):
         """Test validating credentials from tuple values."""
         mock_validate.return_value = {"accountId": "abc123"}
 
-        manager = CredentialManager()
-        result = manager.validate_credentials_tuple(
-            url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
+        result = manager.validate_credentials_tuple(*creds_tuple)
 
         assert result["accountId"] == "abc123"
-        mock_validate.assert_called_once()
+        mock_validate.assert_called_once_with(dict(creds))
 
 
-class TestSingletonAndConvenienceFunctions:
-    """Tests for singleton and convenience functions."""
+class TestConvenienceFunctions:
+    """Tests for the singleton accessor and module-level convenience functions."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_credential_manager(self, monkeypatch):
+        """Clear the get_credential_manager() singleton; restored after each test."""
+        monkeypatch.setattr(cm, "_credential_manager", None)
 
     def test_get_credential_manager_singleton(self):
         """Test get_credential_manager returns same instance."""
-        # Reset the singleton for testing
-        import jira_as.credential_manager as cm
-
-        cm._credential_manager = None
-
         manager1 = get_credential_manager()
         manager2 = get_credential_manager()
 
         assert manager1 is manager2
 
-        # Clean up
-        cm._credential_manager = None
-
-    def test_is_keychain_available(self):
-        """Test is_keychain_available wrapper."""
-        # Just test it doesn't crash - actual availability depends on system
-        result = is_keychain_available()
-        assert isinstance(result, bool)
-
-
-class TestConvenienceFunctions:
-    """Tests for module-level convenience functions."""
+    @pytest.mark.parametrize("available", [True, False])
+    def test_is_keychain_available(self, available):
+        """Test is_keychain_available wrapper returns the backend probe result."""
+        # Stub the probe so the test never touches the real keyring backend
+        with patch.object(
+            CredentialManager, "is_keychain_available", return_value=available
+        ) as mock_probe:
+            assert is_keychain_available() is available
+        mock_probe.assert_called_once_with()
 
     @patch.object(CredentialManager, "get_credentials_tuple")
-    def test_get_credentials(self, mock_get_tuple):
+    def test_get_credentials(self, mock_get_tuple, creds_tuple):
         """Test get_credentials convenience function."""
-        mock_get_tuple.return_value = (
-            "https://test.atlassian.net",
-            "test@example.com",
-            "test-token",
-        )
-
-        # Reset singleton to use fresh manager
-        import jira_as.credential_manager as cm
-
-        cm._credential_manager = None
-
-        url, email, token = get_credentials()
-
-        assert url == "https://test.atlassian.net"
-        assert email == "test@example.com"
-        assert token == "test-token"
+        mock_get_tuple.return_value = creds_tuple
 
-        # Clean up
-        cm._credential_manager = None
+        assert get_credentials() == creds_tuple
 
     @patch.object(CredentialManager, "store_credentials_tuple")
-    def test_store_credentials(self, mock_store):
+    def test_store_credentials(self, mock_store, creds_tuple):
         """Test store_credentials convenience function."""
-        from assistant_skills_lib import CredentialBackend
-
         mock_store.return_value = CredentialBackend.KEYCHAIN
 
-        # Reset singleton
-        import jira_as.credential_manager as cm
-
-        cm._credential_manager = None
-
-        result = store_credentials(
-            url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
+        result = store_credentials(*creds_tuple)
 
         assert result == CredentialBackend.KEYCHAIN
 
-        # Clean up
-        cm._credential_manager = None
-
     @patch.object(CredentialManager, "validate_credentials_tuple")
-    def test_validate_credentials_function(self, mock_validate):
+    def test_validate_credentials_function(self, mock_validate, creds_tuple):
         """Test validate_credentials convenience function."""
         mock_validate.return_value = {"accountId": "abc123"}
 
-        # Reset singleton
-        import jira_as.credential_manager as cm
-
-        cm._credential_manager = None
-
-        result = validate_credentials(
-            url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
+        result = validate_credentials(*creds_tuple)
 
         assert result["accountId"] == "abc123"
-
-        # Clean up
-        cm._credential_manager = None
@@ -3,11 +3,11 @@ Tests for JiraClient using mocked HTTP responses.
 """
 
 import json
-import os
-import tempfile
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 import responses
+from responses.matchers import json_params_matcher
 
 from jira_as.error_handler import (
     AuthenticationError,
@@ -19,75 +19,111 @@ from jira_as.error_handler import (
 )
 from jira_as.jira_client import JiraClient
 
+BASE_URL = "https://test.atlassian.net"
 
-@pytest.fixture
+
+def _add_json(rsps, method, path, body=None, status=200, match=()):
+    """Register a JSON response for ``method`` on ``BASE_URL + path``."""
+    rsps.add(method, f"{BASE_URL}{path}", json=body, status=status, match=match)
+
+
+def _last_body(rsps):
+    """Decode the JSON body of the most recent intercepted request."""
+    return json.loads(rsps.calls[-1].request.body)
+
+
+def _last_query(rsps):
+    """Parse the query string of the most recent intercepted request."""
+    return parse_qs(urlsplit(rsps.calls[-1].request.url).query)
+
+
+@pytest.fixture(scope="module")
+def _rsps():
+    """RequestsMock patched in once for the module rather than per test."""
+    rsps = responses.RequestsMock(assert_all_requests_are_fired=False)
+    rsps.start()
+    yield rsps
+    rsps.stop(allow_assert=False)
+    rsps.reset()
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses(_rsps):
+    """Intercept HTTP for each test; registrations and calls reset afterwards."""
+    yield _rsps
+    _rsps.reset()
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a JiraClient for testing."""
-    return JiraClient(
-        base_url="https://test.atlassian.net",
+    """JiraClient shared by the module; responses intercepts its HTTP calls."""
+    client = JiraClient(
+        base_url=BASE_URL,
         email="test@example.com",
         api_token="test-token",
         timeout=30,
     )
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def base_url():
-    """Base URL for mocked responses."""
-    return "https://test.atlassian.net"
+@pytest.fixture(scope="module")
+def configured_client():
+    """JiraClient built with a trailing-slash URL and non-default settings."""
+    client = JiraClient(
+        base_url=f"{BASE_URL}/",
+        email="test@example.com",
+        api_token="test-token",
+        timeout=60,
+        max_retries=5,
+        retry_backoff=3.0,
+    )
+    yield client
+    client.close()
 
 
-class TestJiraClientInit:
-    """Tests for JiraClient initialization."""
+@pytest.fixture(scope="module")
+def upload_file(tmp_path_factory):
+    """Text file written once per module for upload tests."""
+    path = tmp_path_factory.mktemp("upload") / "test.txt"
+    path.write_text("test content")
+    return str(path)
 
-    def test_init_strips_trailing_slash(self):
-        """Test that trailing slash is stripped from base_url."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net/",
-            email="test@example.com",
-            api_token="test-token",
-        )
-        assert client.base_url == "https://test.atlassian.net"
 
-    def test_init_stores_credentials(self):
-        """Test that credentials are stored."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
-        assert client.email == "test@example.com"
-        assert client.api_token == "test-token"
+@pytest.fixture(scope="module")
+def download_dir(tmp_path_factory):
+    """Directory shared by the module for download targets."""
+    return tmp_path_factory.mktemp("download")
 
-    def test_init_stores_config(self):
-        """Test that configuration is stored."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-            timeout=60,
-            max_retries=5,
-            retry_backoff=3.0,
-        )
-        assert client.timeout == 60
-        assert client.max_retries == 5
-        assert client.retry_backoff == 3.0
 
-    def test_init_creates_session(self):
-        """Test that session is created with proper config."""
-        client = JiraClient(
-            base_url="https://test.atlassian.net",
-            email="test@example.com",
-            api_token="test-token",
-        )
-        assert client.session is not None
-        assert client.session.headers["Accept"] == "application/json"
-        assert client.session.headers["Content-Type"] == "application/json"
+class TestJiraClientInit:
+    """Tests for JiraClient initialization."""
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            # Trailing slash is stripped from base_url
+            ("base_url", BASE_URL),
+            ("email", "test@example.com"),
+            ("api_token", "test-token"),
+            ("timeout", 60),
+            ("max_retries", 5),
+            ("retry_backoff", 3.0),
+        ],
+    )
+    def test_init_stores_attribute(self, configured_client, attr, expected):
+        """Test that constructor arguments are stored on the client."""
+        assert getattr(configured_client, attr) == expected
+
+    @pytest.mark.parametrize("header", ["Accept", "Content-Type"])
+    def test_init_session_headers(self, configured_client, header):
+        """Test that the session is created with JSON headers."""
+        assert configured_client.session.headers[header] == "application/json"
 
     def test_context_manager(self):
         """Test client works as context manager."""
         with JiraClient(
-            base_url="https://test.atlassian.net",
+            base_url=BASE_URL,
             email="test@example.com",
             api_token="test-token",
         ) as client:
@@ -96,7 +132,7 @@ class TestJiraClientInit:
     def test_close(self):
         """Test close method."""
         client = JiraClient(
-            base_url="https://test.atlassian.net",
+            base_url=BASE_URL,
             email="test@example.com",
             api_token="test-token",
         )
@@ -107,40 +143,38 @@ class TestJiraClientInit:
 class TestHttpMethods:
     """Tests for basic HTTP methods."""
 
-    @responses.activate
-    def test_get_success(self, client, base_url):
+    def test_get_success(self, mocked_responses, client):
         """Test successful GET request."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/test",
-            json={"key": "value"},
-            status=200,
+            "/rest/api/3/test",
+            {"key": "value"},
         )
 
         result = client.get("/rest/api/3/test")
         assert result == {"key": "value"}
 
-    @responses.activate
-    def test_get_with_params(self, client, base_url):
+    def test_get_with_params(self, mocked_responses, client):
         """Test GET request with query parameters."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/search",
-            json={"issues": []},
-            status=200,
+            "/rest/api/3/search",
+            {"issues": []},
         )
 
         result = client.get("/rest/api/3/search", params={"jql": "project=TEST"})
         assert result == {"issues": []}
-        assert "jql=project%3DTEST" in responses.calls[0].request.url
+        assert _last_query(mocked_responses)["jql"] == ["project=TEST"]
 
-    @responses.activate
-    def test_post_success(self, client, base_url):
+    def test_post_success(self, mocked_responses, client):
         """Test successful POST request."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/api/3/issue",
-            json={"id": "10001", "key": "TEST-1"},
+            "/rest/api/3/issue",
+            {"id": "10001", "key": "TEST-1"},
             status=201,
         )
 
@@ -150,24 +184,19 @@ class TestHttpMethods:
         )
         assert result["key"] == "TEST-1"
 
-    @responses.activate
-    def test_post_returns_empty_on_204(self, client, base_url):
+    def test_post_returns_empty_on_204(self, mocked_responses, client):
         """Test POST with 204 No Content returns empty dict."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/test",
-            status=204,
-        )
+        _add_json(mocked_responses, responses.POST, "/rest/api/3/test", status=204)
 
         result = client.post("/rest/api/3/test", data={})
         assert result == {}
 
-    @responses.activate
-    def test_put_success(self, client, base_url):
+    def test_put_success(self, mocked_responses, client):
         """Test successful PUT request."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1",
+            "/rest/api/3/issue/TEST-1",
             status=204,
         )
 
@@ -177,12 +206,12 @@ class TestHttpMethods:
         )
         assert result == {}
 
-    @responses.activate
-    def test_delete_success(self, client, base_url):
+    def test_delete_success(self, mocked_responses, client):
         """Test successful DELETE request."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.DELETE,
-            f"{base_url}/rest/api/3/issue/TEST-1",
+            "/rest/api/3/issue/TEST-1",
             status=204,
         )
 
@@ -193,278 +222,365 @@ class TestHttpMethods:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @responses.activate
-    def test_401_raises_authentication_error(self, client, base_url):
-        """Test 401 raises AuthenticationError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/myself",
-            json={"errorMessages": ["Not authenticated"]},
-            status=401,
-        )
-
-        with pytest.raises(AuthenticationError):
-            client.get("/rest/api/3/myself")
-
-    @responses.activate
-    def test_403_raises_permission_error(self, client, base_url):
-        """Test 403 raises PermissionError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/project/SECRET",
-            json={"errorMessages": ["Access denied"]},
-            status=403,
-        )
-
-        with pytest.raises(PermissionError):
-            client.get("/rest/api/3/project/SECRET")
-
-    @responses.activate
-    def test_404_raises_not_found_error(self, client, base_url):
-        """Test 404 raises NotFoundError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/issue/NOTFOUND-1",
-            json={"errorMessages": ["Issue not found"]},
-            status=404,
-        )
-
-        with pytest.raises(NotFoundError):
-            client.get("/rest/api/3/issue/NOTFOUND-1")
-
-    @responses.activate
-    def test_400_raises_validation_error(self, client, base_url):
-        """Test 400 raises ValidationError."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/issue",
-            json={"errors": {"summary": "Required field"}},
-            status=400,
-        )
-
-        with pytest.raises(ValidationError):
-            client.post("/rest/api/3/issue", data={})
-
-    @responses.activate
-    def test_429_raises_rate_limit_error(self, client, base_url):
-        """Test 429 raises RateLimitError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/search",
-            json={"errorMessages": ["Rate limit exceeded"]},
-            status=429,
-        )
-
-        with pytest.raises(RateLimitError):
-            client.get("/rest/api/3/search")
-
-    @responses.activate
-    def test_500_raises_server_error(self, client, base_url):
-        """Test 500 raises ServerError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            json={"errorMessages": ["Internal error"]},
-            status=500,
-        )
+    @pytest.mark.parametrize(
+        ("method", "path", "status", "body", "exc"),
+        [
+            (
+                "GET",
+                "/rest/api/3/myself",
+                401,
+                {"errorMessages": ["Not authenticated"]},
+                AuthenticationError,
+            ),
+            (
+                "GET",
+                "/rest/api/3/project/SECRET",
+                403,
+                {"errorMessages": ["Access denied"]},
+                PermissionError,
+            ),
+            (
+                "GET",
+                "/rest/api/3/issue/NOTFOUND-1",
+                404,
+                {"errorMessages": ["Issue not found"]},
+                NotFoundError,
+            ),
+            (
+                "POST",
+                "/rest/api/3/issue",
+                400,
+                {"errors": {"summary": "Required field"}},
+                ValidationError,
+            ),
+            (
+                "GET",
+                "/rest/api/3/search",
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                RateLimitError,
+            ),
+            (
+                "GET",
+                "/rest/api/3/issue/TEST-1",
+                500,
+                {"errorMessages": ["Internal error"]},
+                ServerError,
+            ),
+        ],
+        ids=["401", "403", "404", "400", "429", "500"],
+    )
+    def test_status_maps_to_exception(
+        self, mocked_responses, client, method, path, status, body, exc
+    ):
+        """Test each error status raises its matching exception."""
+        _add_json(mocked_responses, method, path, body, status=status)
+
+        with pytest.raises(exc):
+            if method == "POST":
+                client.post(path, data={})
+            else:
+                client.get(path)
+
+
+class TestSimpleOperations:
+    """Single-request operations that return the response body unchanged."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "status", "body", "call"),
+        [
+            pytest.param(
+                responses.GET,
+                "/rest/api/3/issue/TEST-1",
+                200,
+                {
+                    "id": "10001",
+                    "key": "TEST-1",
+                    "fields": {"summary": "Test Issue", "status": {"name": "Open"}},
+                },
+                lambda c: c.get_issue("TEST-1"),
+                id="get_issue",
+            ),
+            pytest.param(
+                responses.POST,
+                "/rest/api/3/issue",
+                201,
+                {"id": "10001", "key": "TEST-1"},
+                lambda c: c.create_issue(
+                    {
+                        "project": {"key": "TEST"},
+                        "summary": "New Issue",
+                        "issuetype": {"name": "Task"},
+                    }
+                ),
+                id="create_issue",
+            ),
+            pytest.param(
+                responses.PUT,
+                "/rest/api/3/issue/TEST-1",
+                204,
+                None,
+                lambda c: c.update_issue("TEST-1", {"summary": "Updated"}),
+                id="update_issue",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/api/3/issue/TEST-1/comment",
+                200,
+                {
+                    "comments": [{"id": "1", "body": {"type": "doc", "content": []}}],
+                    "total": 1,
+                },
+                lambda c: c.get_comments("TEST-1"),
+                id="get_comments",
+            ),
+            pytest.param(
+                responses.POST,
+                "/rest/api/3/issue/TEST-1/comment",
+                201,
+                {"id": "10001", "body": {"type": "doc", "content": []}},
+                lambda c: c.add_comment(
+                    "TEST-1", {"type": "doc", "version": 1, "content": []}
+                ),
+                id="add_comment",
+            ),
+            pytest.param(
+                responses.PUT,
+                "/rest/api/3/issue/TEST-1/comment/10001",
+                200,
+                {"id": "10001"},
+                lambda c: c.update_comment(
+                    "TEST-1", "10001", {"type": "doc", "version": 1, "content": []}
+                ),
+                id="update_comment",
+            ),
+            pytest.param(
+                responses.POST,
+                "/rest/api/3/issue/TEST-1/worklog",
+                201,
+                {"id": "10001", "timeSpent": "1h"},
+                lambda c: c.add_worklog("TEST-1", time_spent="1h"),
+                id="add_worklog",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/api/3/issue/TEST-1/worklog",
+                200,
+                {"worklogs": [{"id": "1", "timeSpent": "1h"}], "total": 1},
+                lambda c: c.get_worklogs("TEST-1"),
+                id="get_worklogs",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/api/3/user/search",
+                200,
+                [{"accountId": "abc123", "displayName": "Test User"}],
+                lambda c: c.search_users("test"),
+                id="search_users",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/agile/1.0/sprint/1",
+                200,
+                {"id": 1, "name": "Sprint 1", "state": "active"},
+                lambda c: c.get_sprint(1),
+                id="get_sprint",
+            ),
+            pytest.param(
+                responses.POST,
+                "/rest/agile/1.0/sprint",
+                201,
+                {"id": 1, "name": "New Sprint"},
+                lambda c: c.create_sprint(board_id=1, name="New Sprint"),
+                id="create_sprint",
+            ),
+            # update_sprint uses PUT per the JIRA REST API spec
+            pytest.param(
+                responses.PUT,
+                "/rest/agile/1.0/sprint/1",
+                200,
+                {"id": 1, "name": "Updated Sprint"},
+                lambda c: c.update_sprint(1, name="Updated Sprint"),
+                id="update_sprint",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/agile/1.0/board/1",
+                200,
+                {"id": 1, "name": "Test Board", "type": "scrum"},
+                lambda c: c.get_board(1),
+                id="get_board",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/agile/1.0/board",
+                200,
+                {"values": [{"id": 1, "name": "Board 1"}], "total": 1},
+                lambda c: c.get_all_boards(),
+                id="get_all_boards",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/agile/1.0/board/1/backlog",
+                200,
+                {"issues": [{"key": "TEST-1"}], "total": 1},
+                lambda c: c.get_board_backlog(1),
+                id="get_board_backlog",
+            ),
+            pytest.param(
+                responses.GET,
+                "/rest/api/3/project/TEST",
+                200,
+                {"id": "10000", "key": "TEST", "name": "Test Project"},
+                lambda c: c.get_project("TEST"),
+                id="get_project",
+            ),
+        ],
+    )
+    def test_returns_response_body(
+        self, mocked_responses, client, method, path, status, body, call
+    ):
+        """Test the operation hits its endpoint and returns the decoded body."""
+        _add_json(mocked_responses, method, path, body, status=status)
 
-        with pytest.raises(ServerError):
-            client.get("/rest/api/3/issue/TEST-1")
+        assert call(client) == body
+        assert len(mocked_responses.calls) == 1
 
 
 class TestIssueOperations:
     """Tests for issue CRUD operations."""
 
-    @responses.activate
-    def test_get_issue(self, client, base_url):
-        """Test getting an issue."""
-        issue_data = {
-            "id": "10001",
-            "key": "TEST-1",
-            "fields": {
-                "summary": "Test Issue",
-                "status": {"name": "Open"},
-            },
-        }
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            json=issue_data,
-            status=200,
-        )
-
-        result = client.get_issue("TEST-1")
-        assert result["key"] == "TEST-1"
-        assert result["fields"]["summary"] == "Test Issue"
-
-    @responses.activate
-    def test_get_issue_with_fields(self, client, base_url):
+    def test_get_issue_with_fields(self, mocked_responses, client):
         """Test getting an issue with specific fields."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            json={"key": "TEST-1", "fields": {"summary": "Test"}},
-            status=200,
+            "/rest/api/3/issue/TEST-1",
+            {"key": "TEST-1", "fields": {"summary": "Test"}},
         )
 
         client.get_issue("TEST-1", fields=["summary", "status"])
-        assert "fields=summary%2Cstatus" in responses.calls[0].request.url
-
-    @responses.activate
-    def test_create_issue(self, client, base_url):
-        """Test creating an issue."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/issue",
-            json={"id": "10001", "key": "TEST-1"},
-            status=201,
-        )
-
-        result = client.create_issue(
-            {
-                "project": {"key": "TEST"},
-                "summary": "New Issue",
-                "issuetype": {"name": "Task"},
-            }
-        )
-        assert result["key"] == "TEST-1"
-
-    @responses.activate
-    def test_update_issue(self, client, base_url):
-        """Test updating an issue."""
-        responses.add(
-            responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            status=204,
-        )
-
-        # update_issue returns None
-        result = client.update_issue("TEST-1", {"summary": "Updated"})
-        assert result is None
-
-    @responses.activate
-    def test_delete_issue(self, client, base_url):
-        """Test deleting an issue."""
-        responses.add(
+        assert _last_query(mocked_responses)["fields"] == ["summary,status"]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_query"),
+        [
+            ({}, {"deleteSubtasks": ["true"]}),
+            # deleteSubtasks is only sent when True
+            ({"delete_subtasks": False}, {}),
+        ],
+        ids=["with_subtasks", "without_subtasks"],
+    )
+    def test_delete_issue(self, mocked_responses, client, kwargs, expected_query):
+        """Test deleting an issue sends deleteSubtasks only when requested."""
+        _add_json(
+            mocked_responses,
             responses.DELETE,
-            f"{base_url}/rest/api/3/issue/TEST-1",
+            "/rest/api/3/issue/TEST-1",
             status=204,
         )
 
         # delete_issue returns None
-        client.delete_issue("TEST-1")
-        # Check param is in URL
-        assert "deleteSubtasks=true" in responses.calls[0].request.url
-
-    @responses.activate
-    def test_delete_issue_without_subtasks(self, client, base_url):
-        """Test deleting an issue without subtasks."""
-        responses.add(
-            responses.DELETE,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            status=204,
-        )
-
-        # When delete_subtasks=False, param should not be in URL
-        client.delete_issue("TEST-1", delete_subtasks=False)
-        # deleteSubtasks should NOT be in URL (only added when True)
-        assert "deleteSubtasks" not in responses.calls[0].request.url
+        client.delete_issue("TEST-1", **kwargs)
+        assert _last_query(mocked_responses) == expected_query
 
 
 class TestSearchOperations:
     """Tests for search operations."""
 
-    @responses.activate
-    def test_search_issues(self, client, base_url):
+    def test_search_issues(self, mocked_responses, client):
         """Test searching issues with JQL."""
         # search_issues uses GET to /rest/api/3/search/jql
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/search/jql",
-            json={
+            "/rest/api/3/search/jql",
+            {
                 "issues": [{"key": "TEST-1"}, {"key": "TEST-2"}],
                 "total": 2,
                 "startAt": 0,
                 "maxResults": 50,
             },
-            status=200,
         )
 
         result = client.search_issues("project = TEST")
-        assert len(result["issues"]) == 2
-        assert result["total"] == 2
+        assert (len(result["issues"]), result["total"]) == (2, 2)
 
-    @responses.activate
-    def test_search_issues_with_fields(self, client, base_url):
+    def test_search_issues_with_fields(self, mocked_responses, client):
         """Test searching with specific fields."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/search/jql",
-            json={"issues": [], "total": 0},
-            status=200,
+            "/rest/api/3/search/jql",
+            {"issues": [], "total": 0},
         )
 
         client.search_issues("project = TEST", fields=["summary", "status"])
-        assert "fields=summary%2Cstatus" in responses.calls[0].request.url
+        assert _last_query(mocked_responses)["fields"] == ["summary,status"]
 
-    @responses.activate
-    def test_search_issues_with_pagination(self, client, base_url):
+    def test_search_issues_with_pagination(self, mocked_responses, client):
         """Test searching with pagination."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/search/jql",
-            json={"issues": [], "total": 100, "startAt": 50, "maxResults": 25},
-            status=200,
+            "/rest/api/3/search/jql",
+            {"issues": [], "total": 100, "startAt": 50, "maxResults": 25},
         )
 
         client.search_issues("project = TEST", start_at=50, max_results=25)
-        assert "startAt=50" in responses.calls[0].request.url
-        assert "maxResults=25" in responses.calls[0].request.url
+        query = _last_query(mocked_responses)
+        assert (query["startAt"], query["maxResults"]) == (["50"], ["25"])
 
 
 class TestTransitionOperations:
     """Tests for transition operations."""
 
-    @responses.activate
-    def test_get_transitions(self, client, base_url):
+    def test_get_transitions(self, mocked_responses, client):
         """Test getting available transitions."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1/transitions",
-            json={
+            "/rest/api/3/issue/TEST-1/transitions",
+            {
                 "transitions": [
                     {"id": "11", "name": "To Do"},
                     {"id": "21", "name": "In Progress"},
                     {"id": "31", "name": "Done"},
                 ]
             },
-            status=200,
         )
 
         result = client.get_transitions("TEST-1")
         assert len(result) == 3
         assert result[0]["name"] == "To Do"
 
-    @responses.activate
-    def test_transition_issue(self, client, base_url):
+    def test_transition_issue(self, mocked_responses, client):
         """Test transitioning an issue."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/api/3/issue/TEST-1/transitions",
+            "/rest/api/3/issue/TEST-1/transitions",
             status=204,
+            match=[json_params_matcher({"transition": {"id": "21"}})],
         )
 
         client.transition_issue("TEST-1", "21")
-        body = json.loads(responses.calls[0].request.body)
-        assert body["transition"]["id"] == "21"
 
-    @responses.activate
-    def test_transition_issue_with_fields(self, client, base_url):
+    def test_transition_issue_with_fields(self, mocked_responses, client):
         """Test transitioning with additional fields."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/api/3/issue/TEST-1/transitions",
+            "/rest/api/3/issue/TEST-1/transitions",
             status=204,
+            match=[
+                json_params_matcher(
+                    {
+                        "transition": {"id": "21"},
+                        "fields": {"resolution": {"name": "Fixed"}},
+                    }
+                )
+            ],
         )
 
         client.transition_issue(
@@ -472,102 +588,42 @@ class TestTransitionOperations:
             "21",
             fields={"resolution": {"name": "Fixed"}},
         )
-        body = json.loads(responses.calls[0].request.body)
-        assert body["fields"]["resolution"]["name"] == "Fixed"
 
 
 class TestCommentOperations:
     """Tests for comment operations."""
 
-    @responses.activate
-    def test_get_comments(self, client, base_url):
-        """Test getting comments."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1/comment",
-            json={
-                "comments": [
-                    {"id": "1", "body": {"type": "doc", "content": []}},
-                ],
-                "total": 1,
-            },
-            status=200,
-        )
-
-        result = client.get_comments("TEST-1")
-        assert len(result["comments"]) == 1
-
-    @responses.activate
-    def test_add_comment(self, client, base_url):
-        """Test adding a comment."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/issue/TEST-1/comment",
-            json={"id": "10001", "body": {"type": "doc", "content": []}},
-            status=201,
-        )
-
-        result = client.add_comment(
-            "TEST-1",
-            {"type": "doc", "version": 1, "content": []},
-        )
-        assert result["id"] == "10001"
-
-    @responses.activate
-    def test_update_comment(self, client, base_url):
-        """Test updating a comment."""
-        responses.add(
-            responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1/comment/10001",
-            json={"id": "10001"},
-            status=200,
-        )
-
-        result = client.update_comment(
-            "TEST-1",
-            "10001",
-            {"type": "doc", "version": 1, "content": []},
-        )
-        assert result["id"] == "10001"
-
-    @responses.activate
-    def test_delete_comment(self, client, base_url):
+    def test_delete_comment(self, mocked_responses, client):
         """Test deleting a comment."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.DELETE,
-            f"{base_url}/rest/api/3/issue/TEST-1/comment/10001",
+            "/rest/api/3/issue/TEST-1/comment/10001",
             status=204,
         )
 
         client.delete_comment("TEST-1", "10001")
-        assert len(responses.calls) == 1
+        mocked_responses.assert_call_count(
+            f"{BASE_URL}/rest/api/3/issue/TEST-1/comment/10001", 1
+        )
 
 
 class TestWorklogOperations:
     """Tests for worklog operations."""
 
-    @responses.activate
-    def test_add_worklog(self, client, base_url):
-        """Test adding a worklog."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/issue/TEST-1/worklog",
-            json={"id": "10001", "timeSpent": "1h"},
-            status=201,
-        )
-
-        # add_worklog uses time_spent (string format like "1h")
-        result = client.add_worklog("TEST-1", time_spent="1h")
-        assert result["timeSpent"] == "1h"
-
-    @responses.activate
-    def test_add_worklog_with_comment(self, client, base_url):
+    def test_add_worklog_with_comment(self, mocked_responses, client):
         """Test adding a worklog with comment."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/api/3/issue/TEST-1/worklog",
-            json={"id": "10001"},
+            "/rest/api/3/issue/TEST-1/worklog",
+            {"id": "10001"},
             status=201,
+            match=[
+                json_params_matcher(
+                    {"timeSpent": "1h", "comment": {"type": "doc", "content": []}}
+                )
+            ],
         )
 
         client.add_worklog(
@@ -575,200 +631,77 @@ class TestWorklogOperations:
             time_spent="1h",
             comment={"type": "doc", "content": []},
         )
-        body = json.loads(responses.calls[0].request.body)
-        assert body["timeSpent"] == "1h"
-        assert "comment" in body
-
-    @responses.activate
-    def test_get_worklogs(self, client, base_url):
-        """Test getting worklogs."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1/worklog",
-            json={
-                "worklogs": [{"id": "1", "timeSpent": "1h"}],
-                "total": 1,
-            },
-            status=200,
-        )
-
-        result = client.get_worklogs("TEST-1")
-        assert len(result["worklogs"]) == 1
 
 
 class TestUserOperations:
     """Tests for user operations."""
 
-    @responses.activate
-    def test_get_current_user_id(self, client, base_url):
+    def test_get_current_user_id(self, mocked_responses, client):
         """Test getting current user ID."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/myself",
-            json={"accountId": "abc123", "displayName": "Test User"},
-            status=200,
+            "/rest/api/3/myself",
+            {"accountId": "abc123", "displayName": "Test User"},
         )
 
         result = client.get_current_user_id()
         assert result == "abc123"
 
-    @responses.activate
-    def test_assign_issue(self, client, base_url):
+    def test_assign_issue(self, mocked_responses, client):
         """Test assigning an issue."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1/assignee",
+            "/rest/api/3/issue/TEST-1/assignee",
             status=204,
         )
 
         client.assign_issue("TEST-1", "abc123")
-        body = json.loads(responses.calls[0].request.body)
+        body = _last_body(mocked_responses)
         assert body["accountId"] == "abc123"
 
-    @responses.activate
-    def test_unassign_issue(self, client, base_url):
+    def test_unassign_issue(self, mocked_responses, client):
         """Test unassigning an issue (account_id=None sends None as body)."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1/assignee",
+            "/rest/api/3/issue/TEST-1/assignee",
             status=204,
         )
 
         client.assign_issue("TEST-1", None)
         # When account_id is None, data is None (not {"accountId": None})
-        assert responses.calls[0].request.body is None
-
-    @responses.activate
-    def test_search_users(self, client, base_url):
-        """Test searching users."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/user/search",
-            json=[{"accountId": "abc123", "displayName": "Test User"}],
-            status=200,
-        )
-
-        result = client.search_users("test")
-        assert len(result) == 1
-        assert result[0]["accountId"] == "abc123"
+        assert mocked_responses.calls[0].request.body is None
 
 
 class TestSprintOperations:
     """Tests for sprint operations."""
 
-    @responses.activate
-    def test_get_sprint(self, client, base_url):
-        """Test getting a sprint."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/agile/1.0/sprint/1",
-            json={"id": 1, "name": "Sprint 1", "state": "active"},
-            status=200,
-        )
-
-        result = client.get_sprint(1)
-        assert result["id"] == 1
-        assert result["state"] == "active"
-
-    @responses.activate
-    def test_create_sprint(self, client, base_url):
-        """Test creating a sprint."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/agile/1.0/sprint",
-            json={"id": 1, "name": "New Sprint"},
-            status=201,
-        )
-
-        result = client.create_sprint(
-            board_id=1,
-            name="New Sprint",
-        )
-        assert result["name"] == "New Sprint"
-
-    @responses.activate
-    def test_update_sprint(self, client, base_url):
-        """Test updating a sprint (uses PUT per JIRA REST API spec)."""
-        responses.add(
-            responses.PUT,
-            f"{base_url}/rest/agile/1.0/sprint/1",
-            json={"id": 1, "name": "Updated Sprint"},
-            status=200,
-        )
-
-        result = client.update_sprint(1, name="Updated Sprint")
-        assert result["name"] == "Updated Sprint"
-
-    @responses.activate
-    def test_move_issues_to_sprint(self, client, base_url):
+    def test_move_issues_to_sprint(self, mocked_responses, client):
         """Test moving issues to sprint."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/agile/1.0/sprint/1/issue",
+            "/rest/agile/1.0/sprint/1/issue",
             status=204,
         )
 
         client.move_issues_to_sprint(1, ["TEST-1", "TEST-2"])
-        body = json.loads(responses.calls[0].request.body)
+        body = _last_body(mocked_responses)
         assert body["issues"] == ["TEST-1", "TEST-2"]
 
 
-class TestBoardOperations:
-    """Tests for board operations."""
-
-    @responses.activate
-    def test_get_board(self, client, base_url):
-        """Test getting a board."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/agile/1.0/board/1",
-            json={"id": 1, "name": "Test Board", "type": "scrum"},
-            status=200,
-        )
-
-        result = client.get_board(1)
-        assert result["name"] == "Test Board"
-
-    @responses.activate
-    def test_get_all_boards(self, client, base_url):
-        """Test getting all boards."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/agile/1.0/board",
-            json={
-                "values": [{"id": 1, "name": "Board 1"}],
-                "total": 1,
-            },
-            status=200,
-        )
-
-        result = client.get_all_boards()
-        assert len(result["values"]) == 1
-
-    @responses.activate
-    def test_get_board_backlog(self, client, base_url):
-        """Test getting board backlog."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/agile/1.0/board/1/backlog",
-            json={"issues": [{"key": "TEST-1"}], "total": 1},
-            status=200,
-        )
-
-        result = client.get_board_backlog(1)
-        assert len(result["issues"]) == 1
-
-
 class TestLinkOperations:
     """Tests for issue link operations."""
 
-    @responses.activate
-    def test_get_link_types(self, client, base_url):
+    def test_get_link_types(self, mocked_responses, client):
         """Test getting link types."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/issueLinkType",
-            json={
+            "/rest/api/3/issueLinkType",
+            {
                 "issueLinkTypes": [
                     {
                         "id": "1",
@@ -778,75 +711,73 @@ class TestLinkOperations:
                     },
                 ]
             },
-            status=200,
         )
 
         result = client.get_link_types()
         assert len(result) == 1
         assert result[0]["name"] == "Blocks"
 
-    @responses.activate
-    def test_create_link(self, client, base_url):
+    def test_create_link(self, mocked_responses, client):
         """Test creating a link."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.POST,
-            f"{base_url}/rest/api/3/issueLink",
-            json={},
+            "/rest/api/3/issueLink",
+            {},
             status=201,
         )
 
         # create_link signature: link_type, inward_key, outward_key
         client.create_link("Blocks", "TEST-1", "TEST-2")
-        body = json.loads(responses.calls[0].request.body)
-        assert body["type"]["name"] == "Blocks"
-        assert body["inwardIssue"]["key"] == "TEST-1"
-        assert body["outwardIssue"]["key"] == "TEST-2"
-
-    @responses.activate
-    def test_delete_link(self, client, base_url):
+        body = _last_body(mocked_responses)
+        assert (
+            body["type"]["name"],
+            body["inwardIssue"]["key"],
+            body["outwardIssue"]["key"],
+        ) == ("Blocks", "TEST-1", "TEST-2")
+
+    def test_delete_link(self, mocked_responses, client):
         """Test deleting a link."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.DELETE,
-            f"{base_url}/rest/api/3/issueLink/10001",
+            "/rest/api/3/issueLink/10001",
             status=204,
         )
 
         client.delete_link("10001")
-        assert len(responses.calls) == 1
+        mocked_responses.assert_call_count(f"{BASE_URL}/rest/api/3/issueLink/10001", 1)
 
 
 class TestProjectOperations:
     """Tests for project operations."""
 
-    @responses.activate
-    def test_get_project(self, client, base_url):
-        """Test getting a project."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/project/TEST",
-            json={"id": "10000", "key": "TEST", "name": "Test Project"},
-            status=200,
-        )
+    @pytest.fixture
+    def project_mocks(self, mocked_responses):
+        """Register the create-project endpoint, optionally with /myself."""
+
+        def register(include_myself):
+            if include_myself:
+                _add_json(
+                    mocked_responses,
+                    responses.GET,
+                    "/rest/api/3/myself",
+                    {"accountId": "abc123"},
+                )
+            _add_json(
+                mocked_responses,
+                responses.POST,
+                "/rest/api/3/project",
+                {"id": "10000", "key": "NEW"},
+                status=201,
+            )
 
-        result = client.get_project("TEST")
-        assert result["key"] == "TEST"
+        return register
 
-    @responses.activate
-    def test_create_project(self, client, base_url):
+    def test_create_project(self, mocked_responses, client, project_mocks):
         """Test creating a project."""
         # create_project calls get_current_user_id if no lead provided
-        responses.add(
-            responses.GET,
-            f"{base_url}/rest/api/3/myself",
-            json={"accountId": "abc123"},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/project",
-            json={"id": "10000", "key": "NEW"},
-            status=201,
-        )
+        project_mocks(include_myself=True)
 
         result = client.create_project(
             key="NEW",
@@ -854,16 +785,11 @@ class TestProjectOperations:
             project_type_key="software",
         )
         assert result["key"] == "NEW"
+        assert _last_body(mocked_responses)["leadAccountId"] == "abc123"
 
-    @responses.activate
-    def test_create_project_with_lead(self, client, base_url):
+    def test_create_project_with_lead(self, mocked_responses, client, project_mocks):
         """Test creating a project with explicit lead."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/rest/api/3/project",
-            json={"id": "10000", "key": "NEW"},
-            status=201,
-        )
+        project_mocks(include_myself=False)
 
         result = client.create_project(
             key="NEW",
@@ -872,81 +798,63 @@ class TestProjectOperations:
             lead_account_id="abc123",
         )
         assert result["key"] == "NEW"
-        body = json.loads(responses.calls[0].request.body)
+        body = _last_body(mocked_responses)
         assert body["leadAccountId"] == "abc123"
 
-    @responses.activate
-    def test_delete_project(self, client, base_url):
+    def test_delete_project(self, mocked_responses, client):
         """Test deleting a project."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.DELETE,
-            f"{base_url}/rest/api/3/project/TEST",
+            "/rest/api/3/project/TEST",
             status=204,
         )
 
         client.delete_project("TEST")
-        assert "enableUndo=true" in responses.calls[0].request.url
+        assert _last_query(mocked_responses)["enableUndo"] == ["true"]
 
 
 class TestFileOperations:
     """Tests for file upload/download operations."""
 
-    @responses.activate
-    def test_upload_file(self, client, base_url):
+    def test_upload_file(self, mocked_responses, client, upload_file):
         """Test uploading a file."""
-        # Create temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test content")
-            temp_path = f.name
-
-        try:
-            responses.add(
-                responses.POST,
-                f"{base_url}/rest/api/3/issue/TEST-1/attachments",
-                json=[{"id": "10001", "filename": "test.txt"}],
-                status=200,
-            )
+        _add_json(
+            mocked_responses,
+            responses.POST,
+            "/rest/api/3/issue/TEST-1/attachments",
+            [{"id": "10001", "filename": "test.txt"}],
+        )
 
-            # upload_file takes endpoint as first param
-            result = client.upload_file(
-                "/rest/api/3/issue/TEST-1/attachments", temp_path
-            )
-            assert result[0]["filename"] == "test.txt"
-        finally:
-            os.unlink(temp_path)
+        # upload_file takes endpoint as first param
+        result = client.upload_file("/rest/api/3/issue/TEST-1/attachments", upload_file)
+        assert result[0]["filename"] == "test.txt"
 
-    @responses.activate
-    def test_download_file(self, client, base_url):
+    def test_download_file(self, mocked_responses, client, download_dir):
         """Test downloading a file."""
         # download_file takes a full URL
-        responses.add(
-            responses.GET,
-            f"{base_url}/secure/attachment/10001/file.txt",
-            body=b"file content",
-            status=200,
+        mocked_responses.get(
+            f"{BASE_URL}/secure/attachment/10001/file.txt", body=b"file content"
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = os.path.join(temp_dir, "downloaded.txt")
-            # download_file takes full URL, not just ID
-            client.download_file(
-                f"{base_url}/secure/attachment/10001/file.txt", output_path
-            )
-            assert os.path.exists(output_path)
-            with open(output_path, "rb") as f:
-                assert f.read() == b"file content"
+        output_path = download_dir / "downloaded.txt"
+        # download_file takes full URL, not just ID
+        client.download_file(
+            f"{BASE_URL}/secure/attachment/10001/file.txt", str(output_path)
+        )
+        assert output_path.read_bytes() == b"file content"
 
 
 class TestTimeTracking:
     """Tests for time tracking operations."""
 
-    @responses.activate
-    def test_get_time_tracking(self, client, base_url):
+    def test_get_time_tracking(self, mocked_responses, client):
         """Test getting time tracking info."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.GET,
-            f"{base_url}/rest/api/3/issue/TEST-1",
-            json={
+            "/rest/api/3/issue/TEST-1",
+            {
                 "fields": {
                     "timetracking": {
                         "originalEstimate": "2h",
@@ -955,21 +863,20 @@ class TestTimeTracking:
                     }
                 }
             },
-            status=200,
         )
 
         result = client.get_time_tracking("TEST-1")
         assert result["originalEstimate"] == "2h"
 
-    @responses.activate
-    def test_set_time_tracking(self, client, base_url):
+    def test_set_time_tracking(self, mocked_responses, client):
         """Test setting time tracking."""
-        responses.add(
+        _add_json(
+            mocked_responses,
             responses.PUT,
-            f"{base_url}/rest/api/3/issue/TEST-1",
+            "/rest/api/3/issue/TEST-1",
             status=204,
         )
 
         client.set_time_tracking("TEST-1", original_estimate="4h")
-        body = json.loads(responses.calls[0].request.body)
+        body = _last_body(mocked_responses)
         assert body["fields"]["timetracking"]["originalEstimate"] == "4h"
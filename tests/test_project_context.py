@@ -49,6 +49,12 @@ class TestProjectContext:
         ctx = ProjectContext(project_key="PROJ", workflows={"by_issue_type": {}})
         assert ctx.has_context() is True
 
+    def test_has_context_tracks_later_updates(self):
+        """Test has_context reflects data added after construction."""
+        ctx = ProjectContext(project_key="PROJ")
+        ctx.defaults["global"] = {"priority": "High"}
+        assert ctx.has_context() is True
+
     def test_get_issue_types(self):
         """Test get_issue_types returns issue types."""
         ctx = ProjectContext(
@@ -131,6 +137,17 @@ class TestLoadJsonFile:
         result = load_json_file(json_file)
         assert result is None
 
+    def test_stdlib_fallback_without_orjson(self, tmp_path, monkeypatch):
+        """Test files still load and invalid JSON is rejected without orjson."""
+        monkeypatch.setattr("jira_as.project_context.orjson", None)
+        valid = tmp_path / "valid.json"
+        valid.write_text('{"key": "value"}')
+        invalid = tmp_path / "invalid.json"
+        invalid.write_text("not valid json")
+
+        assert load_json_file(valid) == {"key": "value"}
+        assert load_json_file(invalid) is None
+
 
 class TestMergeContexts:
     """Tests for merge_contexts function."""
@@ -155,6 +172,16 @@ class TestMergeContexts:
         assert merged == settings
         assert source == "settings"
 
+    def test_one_sided_returns_input_without_merging(self):
+        """Test that an empty or missing side returns the other unchanged."""
+        skill = {"metadata": {"key": "value"}}
+        settings = {"defaults": {"priority": "High"}}
+        with patch("jira_as.project_context._deep_merge") as deep_merge:
+            assert merge_contexts(skill, {}) == (skill, "skill")
+            assert merge_contexts({}, settings)[0] is settings
+            assert merge_contexts({}, {}) == ({}, "none")
+        deep_merge.assert_not_called()
+
     def test_both_contexts_merge(self):
         """Test merging both contexts."""
         skill = {"metadata": {"a": 1}, "defaults": {"b": 2}}
@@ -190,6 +217,19 @@ class TestDeepMerge:
         _deep_merge(base, override)
         assert base == {"a": 1}
 
+    def test_nested_base_not_modified(self):
+        """Test that dicts nested several levels inside base are not modified."""
+        base = {"l1": {"l2": {"l3": {"a": 1}}, "keep": True}}
+        override = {"l1": {"l2": {"l3": {"b": 2}, "x": 0}}}
+        result = _deep_merge(base, override)
+        assert result == {"l1": {"l2": {"l3": {"a": 1, "b": 2}, "x": 0}, "keep": True}}
+        assert base == {"l1": {"l2": {"l3": {"a": 1}}, "keep": True}}
+
+    def test_non_dict_override_replaces_dict(self):
+        """Test that a non-dict override value replaces a nested dict."""
+        result = _deep_merge({"a": {"b": 1}}, {"a": [1, 2]})
+        assert result == {"a": [1, 2]}
+
 
 class TestGetDefaultsForIssueType:
     """Tests for get_defaults_for_issue_type function."""
@@ -246,6 +286,18 @@ class TestGetDefaultsForIssueType:
         result = get_defaults_for_issue_type(ctx, "Bug")
         assert set(result["components"]) == {"Backend", "Frontend"}
 
+    def test_list_merge_dedupes_in_order(self):
+        """Test merged lists drop duplicates and keep global entries first."""
+        ctx = ProjectContext(
+            project_key="PROJ",
+            defaults={
+                "global": {"labels": ["b", "a"]},
+                "by_issue_type": {"Bug": {"labels": ["a", "c", "b"]}},
+            },
+        )
+        result = get_defaults_for_issue_type(ctx, "Bug")
+        assert result["labels"] == ["b", "a", "c"]
+
 
 class TestGetValidTransitions:
     """Tests for get_valid_transitions function."""
@@ -371,6 +423,26 @@ class TestGetCommonLabels:
         result = get_common_labels(ctx, issue_type="Bug", limit=2)
         assert len(result) == 2
 
+    def test_ties_keep_first_seen_order(self):
+        """Test labels with equal counts keep their pattern order."""
+        ctx = ProjectContext(
+            project_key="PROJ",
+            patterns={
+                "by_issue_type": {"Bug": {"labels": {"b": 1, "a": 2, "c": 1, "d": 1}}}
+            },
+        )
+        assert get_common_labels(ctx, issue_type="Bug", limit=3) == ["a", "b", "c"]
+
+    def test_ranking_tracks_later_updates(self):
+        """Test labels added after a lookup are ranked on the next call."""
+        ctx = ProjectContext(
+            project_key="PROJ",
+            patterns={"by_issue_type": {"Bug": {"labels": {"a": 3, "b": 2, "c": 1}}}},
+        )
+        assert get_common_labels(ctx, issue_type="Bug", limit=1) == ["a"]
+        ctx.patterns["by_issue_type"]["Bug"]["labels"]["z"] = 99
+        assert get_common_labels(ctx, issue_type="Bug") == ["z", "a", "b", "c"]
+
 
 class TestValidateTransition:
     """Tests for validate_transition function."""
@@ -392,6 +464,47 @@ class TestValidateTransition:
         ctx = ProjectContext(project_key="PROJ")
         assert validate_transition(ctx, "Bug", "Open", "Done") is False
 
+    def test_transition_scoped_to_type_and_status(self):
+        """Test a target is only valid from its own issue type and status."""
+        ctx = ProjectContext(
+            project_key="PROJ",
+            workflows={
+                "by_issue_type": {
+                    "Bug": {
+                        "transitions": {
+                            "Open": [{"to_status": "In Progress"}],
+                            "In Progress": [
+                                {"to_status": "Done"},
+                                {"to_status": "Open"},
+                            ],
+                        }
+                    },
+                    "Story": {"transitions": {"Open": [{"to_status": "Done"}]}},
+                }
+            },
+        )
+        assert validate_transition(ctx, "Bug", "In Progress", "Done") is True
+        assert validate_transition(ctx, "Bug", "Open", "Done") is False
+        assert validate_transition(ctx, "Story", "Open", "Done") is True
+        assert validate_transition(ctx, "Story", "Open", "In Progress") is False
+
+    def test_tracks_later_workflow_updates(self):
+        """Test a transition added after a lookup is valid on the next call."""
+        ctx = ProjectContext(
+            project_key="PROJ",
+            workflows={
+                "by_issue_type": {
+                    "Bug": {"transitions": {"Open": [{"to_status": "In Progress"}]}}
+                }
+            },
+        )
+        assert validate_transition(ctx, "Bug", "Open", "Done") is False
+        ctx.workflows["by_issue_type"]["Bug"]["transitions"]["Open"].append(
+            {"to_status": "Done"}
+        )
+        assert validate_transition(ctx, "Bug", "Open", "Done") is True
+        assert {"to_status": "Done"} in get_valid_transitions(ctx, "Bug", "Open")
+
 
 class TestFormatContextSummary:
     """Tests for format_context_summary function."""
@@ -462,6 +575,19 @@ class TestClearContextCache:
         # Clean up
         clear_context_cache()
 
+    def test_clear_unknown_project_is_noop(self):
+        """Test clearing a project that is not cached leaves others alone."""
+        import jira_as.project_context as pc
+
+        pc._context_cache["PROJ1"] = ProjectContext(project_key="PROJ1")
+
+        clear_context_cache("MISSING")
+
+        assert "PROJ1" in pc._context_cache
+
+        # Clean up
+        clear_context_cache()
+
 
 class TestHasProjectContext:
     """Tests for has_project_context function."""
@@ -2,15 +2,17 @@
 Tests for the testing utilities module.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
+from jira_as.jira_client import JiraClient
 from jira_as.testing import (
     IssueBuilder,
     assert_issue_has_field,
     assert_search_returns_empty,
     assert_search_returns_results,
+    clear_server_info_cache,
     generate_unique_name,
     get_jira_version,
     is_cloud_instance,
@@ -19,15 +21,49 @@ from jira_as.testing import (
 )
 
 
+class _FakeClock:
+    """Stand-in for the time module: sleep() advances monotonic() instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    """Run the polling helpers against a virtual clock instead of real sleeps."""
+    clock = _FakeClock()
+    monkeypatch.setattr("jira_as.testing.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def _shared_client():
+    """Mock JIRA client restricted to the real JiraClient interface."""
+    return Mock(spec_set=JiraClient)
+
+
+@pytest.fixture
+def mock_client(_shared_client):
+    """The module's mock client with calls, return values and side effects reset."""
+    _shared_client.reset_mock(return_value=True, side_effect=True)
+    clear_server_info_cache(_shared_client)
+    return _shared_client
+
+
 class TestIssueBuilder:
     """Tests for IssueBuilder fluent API."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create a mock JIRA client."""
-        client = MagicMock()
-        client.post.return_value = {"id": "12345", "key": "TEST-1"}
-        return client
+    def mock_client(self, mock_client):
+        """Mock client whose issue creation returns TEST-1."""
+        mock_client.post.return_value = {"id": "12345", "key": "TEST-1"}
+        return mock_client
 
     def test_basic_build(self, mock_client):
         """Test basic issue creation with defaults."""
@@ -43,44 +79,62 @@ class TestIssueBuilder:
         assert fields["project"]["key"] == "TEST"
         assert fields["issuetype"]["name"] == "Task"
 
-    def test_with_type(self, mock_client):
-        """Test setting issue type."""
-        builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("Bug test").with_type("Bug").build()
-
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["issuetype"]["name"] == "Bug"
-
-    def test_with_priority(self, mock_client):
-        """Test setting priority."""
-        builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("High priority").with_priority("High").build()
-
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["priority"]["name"] == "High"
-
-    def test_with_description(self, mock_client):
-        """Test setting description with ADF format."""
-        builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("With description").with_description(
-            "Test description"
-        ).build()
-
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["description"]["type"] == "doc"
-        assert fields["description"]["version"] == 1
-
-    def test_with_labels(self, mock_client):
-        """Test setting labels (replaces defaults)."""
-        builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("Custom labels").with_labels(["custom", "labels"]).build()
-
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["labels"] == ["custom", "labels"]
+    @pytest.mark.parametrize(
+        ("method", "args", "field", "expected"),
+        [
+            ("with_type", ("Bug",), "issuetype", {"name": "Bug"}),
+            ("with_priority", ("High",), "priority", {"name": "High"}),
+            (
+                "with_description",
+                ("Test description",),
+                "description",
+                {
+                    "type": "doc",
+                    "version": 1,
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [{"type": "text", "text": "Test description"}],
+                        }
+                    ],
+                },
+            ),
+            # with_labels replaces the default labels
+            (
+                "with_labels",
+                (["custom", "labels"],),
+                "labels",
+                ["custom", "labels"],
+            ),
+            (
+                "with_assignee",
+                ("account123",),
+                "assignee",
+                {"accountId": "account123"},
+            ),
+            (
+                "with_components",
+                (["Backend", "API"],),
+                "components",
+                [{"name": "Backend"}, {"name": "API"}],
+            ),
+            ("with_epic", ("TEST-50",), "customfield_10014", "TEST-50"),
+            ("with_story_points", (5,), "customfield_10016", 5),
+            (
+                "with_field",
+                ("customfield_10001", "value"),
+                "customfield_10001",
+                "value",
+            ),
+        ],
+    )
+    def test_fluent_setter(self, mock_client, method, args, field, expected):
+        """Test each fluent setter writes its field into the create request."""
+        builder = IssueBuilder(mock_client, "TEST").with_summary("Setter test")
+        getattr(builder, method)(*args).build()
+
+        fields = mock_client.post.call_args[1]["json"]["fields"]
+        assert fields[field] == expected
 
     def test_add_labels(self, mock_client):
         """Test adding labels to existing."""
@@ -90,28 +144,15 @@ class TestIssueBuilder:
         call_args = mock_client.post.call_args
         fields = call_args[1]["json"]["fields"]
         # Default labels are ["test", "automated"], plus "extra"
-        assert "extra" in fields["labels"]
-        assert "test" in fields["labels"]
+        assert fields["labels"] == ["test", "automated", "extra"]
 
-    def test_with_assignee(self, mock_client):
-        """Test setting assignee."""
+    def test_add_labels_skips_duplicates(self, mock_client):
+        """Test adding an existing label does not repeat it."""
         builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("Assigned").with_assignee("account123").build()
+        builder.with_summary("Dup labels").add_labels(["test", "new"]).build()
 
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["assignee"]["accountId"] == "account123"
-
-    def test_with_field(self, mock_client):
-        """Test setting arbitrary field."""
-        builder = IssueBuilder(mock_client, "TEST")
-        builder.with_summary("Custom field").with_field(
-            "customfield_10001", "value"
-        ).build()
-
-        call_args = mock_client.post.call_args
-        fields = call_args[1]["json"]["fields"]
-        assert fields["customfield_10001"] == "value"
+        fields = mock_client.post.call_args[1]["json"]["fields"]
+        assert fields["labels"] == ["test", "automated", "new"]
 
     def test_link_to(self, mock_client):
         """Test linking to another issue."""
@@ -137,11 +178,6 @@ class TestIssueBuilder:
 class TestAssertionHelpers:
     """Tests for assertion helper functions."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock JIRA client."""
-        return MagicMock()
-
     def test_assert_search_returns_results_success(self, mock_client):
         """Test successful search assertion."""
         mock_client.post.return_value = {
@@ -155,7 +191,7 @@ class TestAssertionHelpers:
         assert len(results) == 2
         assert results[0]["key"] == "TEST-1"
 
-    def test_assert_search_returns_results_timeout(self, mock_client):
+    def test_assert_search_returns_results_timeout(self, mock_client, fake_clock):
         """Test search assertion timeout."""
         mock_client.post.return_value = {"issues": []}
 
@@ -165,6 +201,9 @@ class TestAssertionHelpers:
             )
 
         assert "Expected at least 1 results" in str(exc_info.value)
+        # Backoff polls at 0s and 0.5s, then gives up after 1.25s
+        assert mock_client.post.call_count == 2
+        assert fake_clock.now == 1.25
 
     def test_assert_search_returns_empty_success(self, mock_client):
         """Test empty search assertion success."""
@@ -223,15 +262,33 @@ class TestAssertionHelpers:
         # Should not raise - extracts name from dict
         assert_issue_has_field(issue, "status", "Open")
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ({"value": "Red", "id": "10001"}, "Red"),
+            ({"key": "TEST-2", "id": "10002"}, "TEST-2"),
+            ({"id": "10003"}, "10003"),
+        ],
+        ids=["select_option", "parent", "id_only"],
+    )
+    def test_assert_issue_has_field_object_scalar(self, value, expected):
+        """Test object fields compare by value, key or id when they lack a name."""
+        issue = {"key": "TEST-1", "fields": {"custom": value}}
+
+        # Should not raise
+        assert_issue_has_field(issue, "custom", expected)
+
+    def test_assert_issue_has_field_nested_value_mismatch(self):
+        """Test a name mismatch reports the extracted name."""
+        issue = {"key": "TEST-1", "fields": {"status": {"name": "Open", "id": "1"}}}
+
+        with pytest.raises(AssertionError, match="expected 'Done', got 'Open'"):
+            assert_issue_has_field(issue, "status", "Done")
+
 
 class TestVersionDetection:
     """Tests for version detection utilities."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock JIRA client."""
-        return MagicMock()
-
     def test_get_jira_version(self, mock_client):
         """Test version parsing."""
         mock_client.get.return_value = {"version": "9.4.5"}
@@ -277,15 +334,44 @@ class TestVersionDetection:
 
         assert is_cloud_instance(mock_client) is False
 
+    def test_server_info_cached_per_client(self, mock_client):
+        """Test version and deployment lookups share one serverInfo request."""
+        mock_client.get.return_value = {
+            "version": "1001.0.0",
+            "deploymentType": "Cloud",
+        }
+
+        assert get_jira_version(mock_client) == (1001, 0, 0)
+        assert is_cloud_instance(mock_client) is True
+        assert get_jira_version(mock_client) == (1001, 0, 0)
+
+        mock_client.get.assert_called_once_with("/rest/api/3/serverInfo")
+
+    def test_clear_server_info_cache(self, mock_client):
+        """Test clearing the cache forces a fresh serverInfo request."""
+        mock_client.get.return_value = {"version": "9.4.5"}
+
+        get_jira_version(mock_client)
+        clear_server_info_cache()
+        get_jira_version(mock_client)
+
+        assert mock_client.get.call_count == 2
+
+    def test_server_info_not_cached_on_error(self, mock_client):
+        """Test a failed lookup is retried on the next call."""
+        mock_client.get.side_effect = [
+            Exception("v3 down"),
+            Exception("v2 down"),
+            {"deploymentType": "Cloud"},
+        ]
+
+        assert is_cloud_instance(mock_client) is False
+        assert is_cloud_instance(mock_client) is True
+
 
 class TestWaitUtilities:
     """Tests for wait/polling utilities."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock JIRA client."""
-        return MagicMock()
-
     def test_wait_for_transition_success(self, mock_client):
         """Test successful transition wait."""
         mock_client.get.return_value = {"fields": {"status": {"name": "Done"}}}
@@ -294,13 +380,16 @@ class TestWaitUtilities:
 
         assert result is True
 
-    def test_wait_for_transition_timeout(self, mock_client):
+    def test_wait_for_transition_timeout(self, mock_client, fake_clock):
         """Test transition wait timeout."""
         mock_client.get.return_value = {"fields": {"status": {"name": "Open"}}}
 
-        result = wait_for_transition(mock_client, "TEST-1", "Done", timeout=1)
+        result = wait_for_transition(mock_client, "TEST-1", "Done", timeout=3)
 
         assert result is False
+        # Polls once per second until the timeout elapses
+        assert mock_client.get.call_count == 3
+        assert fake_clock.now == 3
 
     def test_wait_for_assignment_success(self, mock_client):
         """Test successful assignment wait."""
@@ -332,6 +421,8 @@ class TestGenerateUniqueName:
         # Should have timestamp and suffix
         parts = name.split("_")
         assert len(parts) == 3  # prefix_timestamp_suffix
+        assert len(parts[2]) == 8
+        int(parts[2], 16)  # hex suffix
 
     def test_generate_unique_name_unique(self):
         """Test names are actually unique."""
@@ -3,7 +3,7 @@ Comprehensive tests for validators module.
 """
 
 import os
-import tempfile
+import sys
 
 import pytest
 from assistant_skills_lib.error_handler import ValidationError
@@ -19,6 +19,7 @@ from jira_as.validators import (
     validate_email,
     validate_file_path,
     validate_issue_key,
+    validate_issue_keys,
     validate_jql,
     validate_project_key,
     validate_project_name,
@@ -83,122 +84,176 @@ class TestSafeGetNested:
 class TestValidateIssueKey:
     """Tests for validate_issue_key function."""
 
-    def test_valid_simple(self):
-        """Test valid simple issue key."""
-        assert validate_issue_key("PROJ-123") == "PROJ-123"
-
-    def test_valid_lowercase_normalized(self):
-        """Test lowercase is normalized to uppercase."""
-        assert validate_issue_key("proj-123") == "PROJ-123"
-
-    def test_valid_mixed_case(self):
-        """Test mixed case is normalized."""
-        assert validate_issue_key("PrOj-123") == "PROJ-123"
-
-    def test_valid_alphanumeric_project(self):
-        """Test project key with numbers."""
-        assert validate_issue_key("ABC123-456") == "ABC123-456"
-
-    def test_valid_single_letter_project(self):
-        """Test single letter project key."""
-        assert validate_issue_key("A-1") == "A-1"
-
-    def test_valid_long_number(self):
-        """Test issue with long number."""
-        assert validate_issue_key("PROJ-999999") == "PROJ-999999"
-
-    def test_invalid_empty(self):
-        """Test empty string raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("")
-
-    def test_invalid_none(self):
-        """Test None raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key(None)
-
-    def test_invalid_whitespace_only(self):
-        """Test whitespace only raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("   ")
-
-    def test_invalid_no_dash(self):
-        """Test missing dash raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("PROJ123")
-
-    def test_invalid_no_number(self):
-        """Test missing number raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("PROJ-")
-
-    def test_invalid_no_project(self):
-        """Test missing project key raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("-123")
-
-    def test_invalid_starts_with_number(self):
-        """Test project starting with number raises error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("123-456")
-
-    def test_invalid_special_chars(self):
-        """Test special characters raise error."""
-        with pytest.raises(ValidationError):
-            validate_issue_key("PROJ_123")
-        with pytest.raises(ValidationError):
-            validate_issue_key("PR@J-123")
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("PROJ-123", "PROJ-123", id="simple"),
+            pytest.param("proj-123", "PROJ-123", id="lowercase_normalized"),
+            pytest.param("PrOj-123", "PROJ-123", id="mixed_case"),
+            pytest.param("ABC123-456", "ABC123-456", id="alphanumeric_project"),
+            pytest.param("A-1", "A-1", id="single_letter_project"),
+            pytest.param("PROJ-999999", "PROJ-999999", id="long_number"),
+        ],
+    )
+    def test_valid(self, raw, expected):
+        """Test valid issue keys are normalized to uppercase."""
+        assert validate_issue_key(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+            pytest.param("   ", id="whitespace_only"),
+            pytest.param("PROJ123", id="no_dash"),
+            pytest.param("PROJ-", id="no_number"),
+            pytest.param("-123", id="no_project"),
+            pytest.param("123-456", id="starts_with_number"),
+            pytest.param("PROJ_123", id="underscore"),
+            pytest.param("PR@J-123", id="special_char"),
+            pytest.param("PROJ-1-2", id="two_dashes"),
+            pytest.param("PROJ-1A", id="alnum_number"),
+            pytest.param("\u00c9PROJ-1", id="non_ascii_letter"),
+            pytest.param("PROJ-\u0661", id="non_ascii_digit"),
+        ],
+    )
+    def test_invalid(self, raw):
+        """Test malformed issue keys raise error."""
+        with pytest.raises(ValidationError):
+            validate_issue_key(raw)
+
+    def test_result_is_interned(self):
+        """Test equal keys built at runtime normalize to one string object."""
+        raw = "".join(["intern", "-", "42"])
+        assert validate_issue_key(raw) is sys.intern("INTERN-42")
+
+    def test_repeat_call_served_from_cache(self):
+        """Test a repeated key is answered from the cache."""
+        validate_issue_key.cache_clear()
+
+        assert validate_issue_key("cache-1") == "CACHE-1"
+        assert validate_issue_key("cache-1") == "CACHE-1"
+
+        assert validate_issue_key.cache_info().hits == 1
+
+    def test_invalid_raises_on_every_call(self):
+        """Test errors are not cached."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_issue_key("PROJ123")
+
+
+@pytest.mark.parametrize(
+    "validator,kwargs,expected",
+    [
+        pytest.param(
+            validate_issue_key, {"issue_key": "proj-1"}, "PROJ-1", id="issue_key"
+        ),
+        pytest.param(
+            validate_project_key, {"project_key": "proj"}, "PROJ", id="project_key"
+        ),
+        pytest.param(
+            validate_project_type,
+            {"project_type": "Software"},
+            "software",
+            id="project_type",
+        ),
+        pytest.param(
+            validate_assignee_type,
+            {"assignee_type": "unassigned"},
+            "UNASSIGNED",
+            id="assignee_type",
+        ),
+        pytest.param(
+            validate_project_template,
+            {"template": "scrum"},
+            PROJECT_TEMPLATES["scrum"],
+            id="project_template",
+        ),
+        pytest.param(
+            validate_email,
+            {"email": "User@Example.com"},
+            "user@example.com",
+            id="email",
+        ),
+        pytest.param(
+            validate_url,
+            {"url": "https://example.atlassian.net/", "require_https": True},
+            "https://example.atlassian.net",
+            id="url",
+        ),
+    ],
+)
+def test_memoized_validator_accepts_keyword_value(validator, kwargs, expected):
+    """Test memoized validators still accept the value by its parameter name."""
+    assert validator(**kwargs) == expected
+    assert validator(**kwargs) == expected
+
+
+class TestValidateIssueKeys:
+    """Tests for validate_issue_keys function."""
+
+    def test_valid_normalized_in_order(self):
+        """Test keys are stripped, uppercased and kept in input order."""
+        assert validate_issue_keys(["proj-2", " PROJ-1 ", "ABC123-9"]) == [
+            "PROJ-2",
+            "PROJ-1",
+            "ABC123-9",
+        ]
+
+    def test_empty(self):
+        """Test an empty batch validates to an empty list."""
+        assert validate_issue_keys([]) == []
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+            pytest.param("PROJ123", id="no_dash"),
+        ],
+    )
+    def test_invalid_matches_single_key_error(self, raw):
+        """Test a bad key raises the same error as validate_issue_key."""
+        with pytest.raises(ValidationError) as single:
+            validate_issue_key(raw)
+        with pytest.raises(ValidationError) as batch:
+            validate_issue_keys(["PROJ-1", raw])
+        assert str(batch.value) == str(single.value)
 
 
 class TestValidateProjectKey:
     """Tests for validate_project_key function."""
 
-    def test_valid_simple(self):
-        """Test valid simple project key."""
-        assert validate_project_key("PROJ") == "PROJ"
-
-    def test_valid_lowercase_normalized(self):
-        """Test lowercase is normalized."""
-        assert validate_project_key("proj") == "PROJ"
-
-    def test_valid_with_numbers(self):
-        """Test project key with numbers."""
-        assert validate_project_key("PROJ2") == "PROJ2"
-
-    def test_valid_min_length(self):
-        """Test minimum length (2 chars)."""
-        assert validate_project_key("AB") == "AB"
-
-    def test_valid_max_length(self):
-        """Test maximum length (10 chars)."""
-        assert validate_project_key("ABCDEFGHIJ") == "ABCDEFGHIJ"
-
-    def test_invalid_empty(self):
-        """Test empty string raises error."""
-        with pytest.raises(ValidationError):
-            validate_project_key("")
-
-    def test_invalid_too_short(self):
-        """Test single character raises error."""
-        with pytest.raises(ValidationError):
-            validate_project_key("A")
-
-    def test_invalid_too_long(self):
-        """Test 11+ characters raises error."""
-        with pytest.raises(ValidationError):
-            validate_project_key("ABCDEFGHIJK")
-
-    def test_invalid_starts_with_number(self):
-        """Test starting with number raises error."""
-        with pytest.raises(ValidationError):
-            validate_project_key("1PROJ")
-
-    def test_invalid_special_chars(self):
-        """Test special characters raise error."""
-        with pytest.raises(ValidationError):
-            validate_project_key("PROJ-1")
-        with pytest.raises(ValidationError):
-            validate_project_key("PROJ_X")
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("PROJ", "PROJ", id="simple"),
+            pytest.param("proj", "PROJ", id="lowercase_normalized"),
+            pytest.param("PROJ2", "PROJ2", id="with_numbers"),
+            pytest.param("AB", "AB", id="min_length"),
+            pytest.param("ABCDEFGHIJ", "ABCDEFGHIJ", id="max_length"),
+        ],
+    )
+    def test_valid(self, raw, expected):
+        """Test valid project keys are normalized to uppercase."""
+        assert validate_project_key(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("A", id="too_short"),
+            pytest.param("ABCDEFGHIJK", id="too_long"),
+            pytest.param("1PROJ", id="starts_with_number"),
+            pytest.param("PROJ-1", id="dash"),
+            pytest.param("PROJ_X", id="underscore"),
+        ],
+    )
+    def test_invalid(self, raw):
+        """Test malformed project keys raise error."""
+        with pytest.raises(ValidationError):
+            validate_project_key(raw)
 
 
 class TestValidateJql:
@@ -252,6 +307,16 @@ class TestValidateJql:
         with pytest.raises(ValidationError):
             validate_jql("project = PROJ javascript:alert(1)")
 
+    def test_dangerous_error_names_matched_text(self):
+        """Test the error reports the text that matched."""
+        with pytest.raises(ValidationError, match="pattern: ;  drop"):
+            validate_jql("project = PROJ;  drop TABLE issues")
+
+    def test_valid_keyword_without_semicolon(self):
+        """Test SQL keywords in ordinary JQL are not flagged."""
+        jql = 'summary ~ "update docs" AND text ~ "delete"'
+        assert validate_jql(jql) == jql
+
     def test_invalid_too_long(self):
         """Test JQL over 10000 chars raises error."""
         long_jql = "project = " + "A" * 10000
@@ -274,11 +339,32 @@ class TestValidateTransitionId:
         """Test integer input converted to string."""
         assert validate_transition_id(456) == "456"
 
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("007", "7", id="leading_zeros"),
+            pytest.param(" 12 ", "12", id="surrounding_whitespace"),
+        ],
+    )
+    def test_valid_normalized(self, raw, expected):
+        """Test numeric strings are normalized like int() would."""
+        assert validate_transition_id(raw) == expected
+
     def test_invalid_negative(self):
         """Test negative number raises error."""
         with pytest.raises(ValidationError):
             validate_transition_id("-1")
 
+    def test_invalid_too_many_digits(self):
+        """Test digit strings past the int conversion limit raise error."""
+        with pytest.raises(ValidationError):
+            validate_transition_id("1" * 5000)
+
+    def test_invalid_non_ascii_digit(self):
+        """Test Unicode digits that int() rejects raise error."""
+        with pytest.raises(ValidationError):
+            validate_transition_id("\u00b2")
+
     def test_invalid_non_numeric(self):
         """Test non-numeric string raises error."""
         with pytest.raises(ValidationError):
@@ -293,22 +379,19 @@ class TestValidateTransitionId:
 class TestValidateProjectType:
     """Tests for validate_project_type function."""
 
-    def test_valid_software(self):
-        """Test software project type."""
-        assert validate_project_type("software") == "software"
-
-    def test_valid_business(self):
-        """Test business project type."""
-        assert validate_project_type("business") == "business"
-
-    def test_valid_service_desk(self):
-        """Test service_desk project type."""
-        assert validate_project_type("service_desk") == "service_desk"
-
-    def test_valid_uppercase_normalized(self):
-        """Test uppercase is normalized to lowercase."""
-        assert validate_project_type("SOFTWARE") == "software"
-        assert validate_project_type("Business") == "business"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("software", "software", id="software"),
+            pytest.param("business", "business", id="business"),
+            pytest.param("service_desk", "service_desk", id="service_desk"),
+            pytest.param("SOFTWARE", "software", id="uppercase_normalized"),
+            pytest.param("Business", "business", id="capitalized_normalized"),
+        ],
+    )
+    def test_valid(self, raw, expected):
+        """Test valid project types are normalized to lowercase."""
+        assert validate_project_type(raw) == expected
 
     def test_invalid_unknown_type(self):
         """Test unknown type raises error."""
@@ -317,6 +400,13 @@ class TestValidateProjectType:
         assert "software" in str(exc_info.value)
         assert "business" in str(exc_info.value)
 
+    def test_invalid_lists_types_in_stable_order(self):
+        """Test the valid types are listed sorted, independent of set order."""
+        with pytest.raises(
+            ValidationError, match="Valid types: business, service_desk, software"
+        ):
+            validate_project_type("unknown")
+
     def test_invalid_empty(self):
         """Test empty string raises error."""
         with pytest.raises(ValidationError):
@@ -331,22 +421,19 @@ class TestValidateProjectType:
 class TestValidateAssigneeType:
     """Tests for validate_assignee_type function."""
 
-    def test_valid_project_lead(self):
-        """Test PROJECT_LEAD assignee type."""
-        assert validate_assignee_type("PROJECT_LEAD") == "PROJECT_LEAD"
-
-    def test_valid_unassigned(self):
-        """Test UNASSIGNED assignee type."""
-        assert validate_assignee_type("UNASSIGNED") == "UNASSIGNED"
-
-    def test_valid_component_lead(self):
-        """Test COMPONENT_LEAD assignee type."""
-        assert validate_assignee_type("COMPONENT_LEAD") == "COMPONENT_LEAD"
-
-    def test_valid_lowercase_normalized(self):
-        """Test lowercase is normalized to uppercase."""
-        assert validate_assignee_type("project_lead") == "PROJECT_LEAD"
-        assert validate_assignee_type("unassigned") == "UNASSIGNED"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("PROJECT_LEAD", "PROJECT_LEAD", id="project_lead"),
+            pytest.param("UNASSIGNED", "UNASSIGNED", id="unassigned"),
+            pytest.param("COMPONENT_LEAD", "COMPONENT_LEAD", id="component_lead"),
+            pytest.param("project_lead", "PROJECT_LEAD", id="lowercase_normalized"),
+            pytest.param("unassigned", "UNASSIGNED", id="unassigned_lowercase"),
+        ],
+    )
+    def test_valid(self, raw, expected):
+        """Test valid assignee types are normalized to uppercase."""
+        assert validate_assignee_type(raw) == expected
 
     def test_invalid_unknown_type(self):
         """Test unknown type raises error."""
@@ -368,31 +455,28 @@ class TestValidateAssigneeType:
 class TestValidateProjectTemplate:
     """Tests for validate_project_template function."""
 
-    def test_valid_scrum_shortcut(self):
-        """Test scrum shortcut expands."""
-        result = validate_project_template("scrum")
-        assert result == PROJECT_TEMPLATES["scrum"]
-        assert "scrum" in result
-
-    def test_valid_kanban_shortcut(self):
-        """Test kanban shortcut expands."""
-        result = validate_project_template("kanban")
-        assert result == PROJECT_TEMPLATES["kanban"]
-
-    def test_valid_uppercase_shortcut(self):
-        """Test uppercase shortcut is normalized."""
-        result = validate_project_template("SCRUM")
-        assert result == PROJECT_TEMPLATES["scrum"]
-
-    def test_valid_full_template_key_with_colon(self):
-        """Test full template key with colon passes through."""
-        full_key = "com.example:custom-template"
-        assert validate_project_template(full_key) == full_key
-
-    def test_valid_full_template_key_with_dot(self):
-        """Test full template key with dot passes through."""
-        full_key = "com.example.template"
-        assert validate_project_template(full_key) == full_key
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param("scrum", PROJECT_TEMPLATES["scrum"], id="scrum_shortcut"),
+            pytest.param("kanban", PROJECT_TEMPLATES["kanban"], id="kanban_shortcut"),
+            pytest.param("SCRUM", PROJECT_TEMPLATES["scrum"], id="uppercase_shortcut"),
+            pytest.param(
+                "com.example:custom-template",
+                "com.example:custom-template",
+                id="full_key_with_colon",
+            ),
+            pytest.param(
+                "com.example.template", "com.example.template", id="full_key_with_dot"
+            ),
+            pytest.param(
+                "com.Example:Scrum", "com.example:scrum", id="full_key_lowered"
+            ),
+        ],
+    )
+    def test_valid(self, raw, expected):
+        """Test shortcuts expand and full template keys pass through."""
+        assert validate_project_template(raw) == expected
 
     def test_invalid_unknown_shortcut(self):
         """Test unknown shortcut raises error."""
@@ -406,6 +490,14 @@ class TestValidateProjectTemplate:
         with pytest.raises(ValidationError):
             validate_project_template("")
 
+    def test_shortcuts_contain_no_full_key_separators(self):
+        """Test no shortcut could be mistaken for a full template key."""
+        assert not any("." in name or ":" in name for name in PROJECT_TEMPLATES)
+
+    def test_shortcuts_are_lowercase(self):
+        """Test shortcut keys match the lowercased input they are looked up by."""
+        assert all(name == name.lower() for name in PROJECT_TEMPLATES)
+
     def test_all_shortcuts_work(self):
         """Test all template shortcuts expand correctly."""
         for shortcut, full_key in PROJECT_TEMPLATES.items():
@@ -531,21 +623,44 @@ class TestValidateEmail:
             validate_email("user@")
 
 
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """Small files keyed by extension, created once for the path validator tests."""
+    root = tmp_path_factory.mktemp("validators")
+    files = {}
+    for ext in (".txt", ".png", ".jpg", ".jpeg", ".gif"):
+        path = root / f"sample{ext}"
+        path.write_bytes(b"test content")
+        files[ext] = str(path)
+    return files
+
+
+@pytest.fixture(scope="session")
+def oversized_attachment(tmp_path_factory):
+    """File just over the 10MB attachment limit."""
+    path = tmp_path_factory.mktemp("validators") / "big.bin"
+    with open(path, "wb") as f:
+        f.truncate(10 * 1024 * 1024 + 1)  # sparse: only the size matters
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def oversized_avatar(tmp_path_factory):
+    """PNG just over the 1MB avatar limit."""
+    path = tmp_path_factory.mktemp("validators") / "big.png"
+    with open(path, "wb") as f:
+        f.truncate(1 * 1024 * 1024 + 1)  # sparse: only the size matters
+    return str(path)
+
+
 class TestValidateFilePath:
     """Tests for validate_file_path function."""
 
-    def test_valid_existing_file(self):
+    def test_valid_existing_file(self, sample_files):
         """Test valid existing file."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b"test content")
-            temp_path = f.name
-
-        try:
-            result = validate_file_path(temp_path, must_exist=True)
-            assert os.path.isabs(result)
-            assert os.path.exists(result)
-        finally:
-            os.unlink(temp_path)
+        result = validate_file_path(sample_files[".txt"], must_exist=True)
+        assert os.path.isabs(result)
+        assert os.path.exists(result)
 
     def test_valid_no_exist_check(self):
         """Test path without existence check."""
@@ -557,95 +672,30 @@ class TestValidateFilePath:
         with pytest.raises(ValidationError):
             validate_file_path("/definitely/does/not/exist.txt", must_exist=True)
 
-    def test_invalid_file_too_large(self):
+    def test_invalid_file_too_large(self, oversized_attachment):
         """Test file over 10MB raises error."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            # Write just over 10MB
-            f.write(b"x" * (10 * 1024 * 1024 + 1))
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_file_path(temp_path, must_exist=True)
-            assert "too large" in str(exc_info.value).lower()
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValidationError) as exc_info:
+            validate_file_path(oversized_attachment, must_exist=True)
+        assert "too large" in str(exc_info.value).lower()
 
 
 class TestValidateAvatarFile:
     """Tests for validate_avatar_file function."""
 
-    def test_valid_png(self):
-        """Test valid PNG file."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"fake png content")
-            temp_path = f.name
-
-        try:
-            result = validate_avatar_file(temp_path)
-            assert result.endswith(".png")
-        finally:
-            os.unlink(temp_path)
-
-    def test_valid_jpg(self):
-        """Test valid JPG file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            f.write(b"fake jpg content")
-            temp_path = f.name
-
-        try:
-            result = validate_avatar_file(temp_path)
-            assert result.endswith(".jpg")
-        finally:
-            os.unlink(temp_path)
-
-    def test_valid_jpeg(self):
-        """Test valid JPEG file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpeg", delete=False) as f:
-            f.write(b"fake jpeg content")
-            temp_path = f.name
-
-        try:
-            result = validate_avatar_file(temp_path)
-            assert result.endswith(".jpeg")
-        finally:
-            os.unlink(temp_path)
-
-    def test_valid_gif(self):
-        """Test valid GIF file."""
-        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as f:
-            f.write(b"fake gif content")
-            temp_path = f.name
-
-        try:
-            result = validate_avatar_file(temp_path)
-            assert result.endswith(".gif")
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_extension(self):
+    @pytest.mark.parametrize("ext", [".png", ".jpg", ".jpeg", ".gif"])
+    def test_valid_image(self, sample_files, ext):
+        """Test supported image extensions."""
+        result = validate_avatar_file(sample_files[ext])
+        assert result.endswith(ext)
+
+    def test_invalid_extension(self, sample_files):
         """Test invalid file extension raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"text content")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_avatar_file(temp_path)
-            assert ".png" in str(exc_info.value)
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_too_large(self):
+        with pytest.raises(ValidationError) as exc_info:
+            validate_avatar_file(sample_files[".txt"])
+        assert ".png" in str(exc_info.value)
+
+    def test_invalid_too_large(self, oversized_avatar):
         """Test avatar over 1MB raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            # Write just over 1MB
-            f.write(b"x" * (1 * 1024 * 1024 + 1))
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                validate_avatar_file(temp_path)
-            assert "too large" in str(exc_info.value).lower()
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ValidationError) as exc_info:
+            validate_avatar_file(oversized_avatar)
+        assert "too large" in str(exc_info.value).lower()